@@ -0,0 +1,81 @@
+# benchmarks/bench_critical_values.py
+"""
+Benchmark: Tabelle kritischer Werte.
+
+- Aufbau (vektorisierte Quantilsuche) über ein großes Gitter
+- Abfrage aus der Tabelle gegen exakte Konstruktion
+  (leere Caches, je Abfrage ein neues Modell)
+
+Aufruf (im Projektverzeichnis):
+
+    python -m benchmarks.bench_critical_values
+"""
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from tests.model.binomial import BinomialModel, MODEL_CACHE
+from tests.geometry.construct_rejection_region import (
+    REGION_CACHE,
+    clear_critical_value_tables,
+    register_critical_value_table,
+    two_sided_equal_tails,
+)
+from tests.geometry.critical_values import CriticalValueTable, build_critical_value_table
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - t0
+
+
+def _queries(table, rng, count):
+    n = rng.choice(table.n_values, count)
+    p = rng.choice(table.p0_values, count)
+    a = rng.choice(table.alpha_values, count)
+    return list(zip(n.tolist(), p.tolist(), a.tolist()))
+
+
+def _answer(queries):
+    MODEL_CACHE.clear()
+    REGION_CACHE.clear()
+    return [two_sided_equal_tails(BinomialModel(n=n, p=p), a).K for n, p, a in queries]
+
+
+def run(n_max=20_000, p0_count=19, alpha_values=(0.01, 0.05, 0.1), queries=200):
+    n_values = np.arange(1, n_max + 1)
+    p0_values = np.round(np.linspace(0.05, 0.95, p0_count), 4)
+
+    table, t_build = _timed(lambda: build_critical_value_table(
+        n_values, p0_values, alpha_values
+    ))
+    cells = table.left.size
+    print(f"Aufbau {cells:,} Einträge: {t_build:.2f} s "
+          f"({cells / t_build:,.0f} / s), {table.nbytes / 2**20:.1f} MB")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "K.npz")
+        table.save(path)
+        table, t_load = _timed(lambda: CriticalValueTable.load(path))
+        print(f"Laden: {t_load * 1e3:.1f} ms, Datei {os.path.getsize(path) / 2**20:.1f} MB")
+
+    qs = _queries(table, np.random.default_rng(0), queries)
+
+    clear_critical_value_tables()
+    exact, t_exact = _timed(lambda: _answer(qs))
+    register_critical_value_table(table)
+    looked_up, t_table = _timed(lambda: _answer(qs))
+    clear_critical_value_tables()
+
+    print(f"{queries} Abfragen exakt:   {t_exact / queries * 1e3:8.3f} ms je Abfrage")
+    print(f"{queries} Abfragen Tabelle: {t_table / queries * 1e3:8.3f} ms je Abfrage "
+          f"(Faktor {t_exact / t_table:.0f}, gleich: {exact == looked_up})")
+
+
+if __name__ == "__main__":
+    run()
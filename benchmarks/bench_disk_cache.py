@@ -0,0 +1,53 @@
+# benchmarks/bench_disk_cache.py
+"""
+Benchmark: Plattencache für pmf/cdf/sf (DISK_CACHE).
+
+Je n ein frischer Interpreter (wie ein neuer Notebook-Kernel oder
+Worker-Prozess): Modell anlegen und cdf/sf/ppf abfragen,
+ohne Cache, mit leerem Cache (schreiben) und mit gefülltem Cache (memmap).
+
+Aufruf (im Projektverzeichnis):
+
+    python -m benchmarks.bench_disk_cache
+"""
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import tempfile
+
+_CHILD = """
+import time
+from tests.model.binomial import BinomialModel
+t0 = time.perf_counter()
+m = BinomialModel(n={n}, p=0.3)
+m.cdf({n} // 3); m.sf({n} // 2); m.ppf(0.025)
+print(time.perf_counter() - t0)
+"""
+
+
+def _run(n: int, cache_dir: str | None) -> float:
+    env = dict(os.environ)
+    env.pop("HYPOTHESENTESTS_CACHE_DIR", None)
+    if cache_dir is not None:
+        env["HYPOTHESENTESTS_CACHE_DIR"] = cache_dir
+    proc = subprocess.run(
+        [sys.executable, "-c", _CHILD.format(n=n)],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    return float(proc.stdout)
+
+
+def run(n_values=(100_000, 1_000_000, 10_000_000)):
+    print(f"{'n':>12} {'ohne [ms]':>10} {'schreiben [ms]':>15} {'memmap [ms]':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in n_values:
+            plain = _run(n, None)
+            write = _run(n, tmp)
+            read = _run(n, tmp)
+            print(f"{n:>12,} {plain * 1e3:>10.1f} {write * 1e3:>15.1f} {read * 1e3:>12.2f}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,157 @@
+# benchmarks/bench_explanatory_render.py
+"""
+Benchmark: Zeichenzeit und Dateigröße der Spiegel-Grafik
+(plot_spiegel_distribution) in Abhängigkeit von n.
+
+Verglichen werden
+- Einzelbalken: ein ax.bar je k (frühere Umsetzung, hier nachgebaut)
+- Collection   : eine PolyCollection je Farbschicht (aktuelle Umsetzung)
+
+Aufruf (im Projektverzeichnis):
+
+    python -m benchmarks.bench_explanatory_render
+"""
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+
+from tests.model.binomial import BinomialModel
+from tests.geometry.construct_rejection_region import two_sided_equal_tails
+from tests.explanatory.plot_spiegel_distribution import plot_spiegel_distribution
+from tests.plots.plot_model import ModelPlotStyle
+
+
+def _per_bar(*, model_alt, model_null, rejection_region, style, save=None):
+    # frühere Umsetzung (unverändert übernommen):
+    # ein Rechteck-Artist je k und Verteilung
+    fig, ax = plt.subplots(figsize=style.figsize)
+
+    # x-Bereich: sigma-basiert (jetzt wirksam!)
+    mu = model_null.n * model_null.p
+    sigma = (model_null.n * model_null.p * (1 - model_null.p)) ** 0.5
+
+    xmin = max(0, int(mu - style.sigma_range * sigma))
+    xmax = min(model_null.n, int(mu + style.sigma_range * sigma))
+
+    ax.set_xlim(xmin, xmax)
+
+    # H0-Verteilung (oben, fix)
+    for k in range(xmin, xmax + 1):
+        if k in rejection_region.K:
+            color = style.reject_color      # rot: Ablehnung unter H0
+        else:
+            color = style.model_color       # blau: akzeptiert
+
+        ax.bar(
+            k,
+            model_null.pmf(k),
+            width=style.bar_width,
+            color=color,
+            edgecolor="black",
+            linewidth=0.5,
+            zorder=2,
+        )
+
+    # H1-Verteilung gespiegelt (unten, beweglich)
+    for k in range(xmin, xmax + 1):
+        if k in rejection_region.K:
+            color = style.power_pstar_color   # grün: Power-Masse
+        else:
+            color = "lightblue"               # nicht verworfen
+
+        ax.bar(
+            k,
+            -model_alt.pmf(k),   # echte Spiegelung
+            width=style.bar_width,
+            color=color,
+            edgecolor="black",
+            linewidth=0.3,
+            zorder=2,
+        )
+
+    # Spiegelachse & y-Achse
+    ax.axhline(0, color="black", linewidth=1)
+
+    ymax = max(model_null.pmf(k) for k in range(xmin, xmax + 1))
+    ax.set_ylim(-1.2 * ymax, 1.2 * ymax)
+
+    ax.set_xlabel(r"Anzahl der Erfolge $k$")
+    ax.set_ylabel(r"$P(X = k)$")
+
+    ax.tick_params(labelsize=style.tick_fontsize)
+
+    # Dezente Orientierung rechts (keine Legende!)
+    ax.text(
+        0.8,
+        0.90,
+        rf"$H_0:\ p={model_null.p}$",
+        transform=ax.transAxes,
+        ha="left",
+        va="top",
+        fontsize=style.tick_fontsize,
+        color="gray",
+    )
+
+    ax.text(
+        0.8,
+        0.84,
+        rf"$H_1:\ p={model_alt.p}$",
+        transform=ax.transAxes,
+        ha="left",
+        va="top",
+        fontsize=style.tick_fontsize,
+        color="gray",
+    )
+
+    # Kein Titel, kein Subtitel, kein Textblock
+    # (Teil einer erklärenden Sequenz)
+
+    if save is not None:
+        fig.savefig(save, bbox_inches="tight")
+
+    return ax
+
+
+def _measure(plot_fn, path, **kwargs):
+    t0 = time.perf_counter()
+    plot_fn(save=path, **kwargs)
+    seconds = time.perf_counter() - t0
+    plt.close("all")
+    return seconds, os.path.getsize(path)
+
+
+def run(n_values=(100, 500, 2_000, 10_000), p0=0.4, p_alt=0.45, alpha=0.05):
+    # großer Darstellungsbereich, damit viele Balken sichtbar sind
+    style = ModelPlotStyle(sigma_range=40.0)
+
+    print(f"{'n':>7} {'Format':>6} {'Einzelbalken [s]':>17} {'Collection [s]':>15} "
+          f"{'Einzel [kB]':>12} {'Collection [kB]':>16}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in n_values:
+            model_null = BinomialModel(n=n, p=p0)
+            kwargs = dict(
+                model_alt=BinomialModel(n=n, p=p_alt),
+                model_null=model_null,
+                rejection_region=two_sided_equal_tails(model_null, alpha),
+                style=style,
+            )
+            for ext in ("png", "pdf"):
+                t_old, s_old = _measure(_per_bar, f"{tmp}/old.{ext}", **kwargs)
+                t_new, s_new = _measure(
+                    plot_spiegel_distribution, f"{tmp}/new.{ext}", **kwargs
+                )
+                print(f"{n:>7} {ext:>6} {t_old:>17.3f} {t_new:>15.3f} "
+                      f"{s_old / 1024:>12.0f} {s_new / 1024:>16.0f}")
+
+
+if __name__ == "__main__":
+    run()
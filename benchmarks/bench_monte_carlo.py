@@ -0,0 +1,38 @@
+# benchmarks/bench_monte_carlo.py
+"""
+Benchmark: Durchsatz der Monte-Carlo-Simulation
+(Beobachtungen je Sekunde) für verschiedene Worker-Zahlen,
+dazu der Abgleich mit der exakten Power.
+
+Aufruf (im Projektverzeichnis):
+
+    python -m benchmarks.bench_monte_carlo
+"""
+from __future__ import annotations
+
+import os
+
+from tests.model.binomial import BinomialModel
+from tests.geometry.construct_rejection_region import two_sided_equal_tails
+from tests.power.power_function import power_at
+from tests.simulation.monte_carlo import empirical_power
+
+
+def run(n=1_000, p0=0.4, p_alt=0.45, alpha=0.05, samples=20_000_000):
+    R = two_sided_equal_tails(BinomialModel(n=n, p=p0), alpha)
+    exact = power_at(BinomialModel(n=n, p=p_alt), R)
+
+    print(f"exakte Power g_{n}({p_alt}) = {exact:.6f}")
+    print(f"{'Worker':>7} {'Schätzung':>10} {'KI 95 %':>22} {'im KI':>6} "
+          f"{'Zeit [s]':>9} {'Beob./s':>10}")
+
+    workers = sorted({1, 2, os.cpu_count() or 1})
+    for w in workers:
+        res = empirical_power(R, p_alt, samples, workers=w, seed=0)
+        print(f"{w:>7} {res.estimate:>10.6f} "
+              f"[{res.ci_low:.6f}, {res.ci_high:.6f}] {str(res.covers(exact)):>6} "
+              f"{res.seconds:>9.2f} {res.samples_per_second:>10.3g}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,49 @@
+# benchmarks/bench_power_curve.py
+"""
+Benchmark: Powerkurve als Schleife (power_curve) gegen
+vektorisierte Berechnung (power_curve_binomial).
+
+Aufruf (im Projektverzeichnis):
+
+    python -m benchmarks.bench_power_curve
+"""
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+from tests.model.binomial import BinomialModel
+from tests.geometry.construct_rejection_region import two_sided_equal_tails
+from tests.power.power_function import power_curve, power_curve_binomial
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - t0
+
+
+def run(n_values=(100, 1_000, 10_000), grid_size=1_000, p0=0.4, alpha=0.05):
+    p_values = np.linspace(0.0, 1.0, grid_size)
+
+    print(f"{'n':>8} {'Gitter':>7} {'Schleife [s]':>13} {'vektorisiert [s]':>17} "
+          f"{'Faktor':>8} {'max |Δ|':>10}")
+
+    for n in n_values:
+        R = two_sided_equal_tails(BinomialModel(n=n, p=p0), alpha)
+
+        loop, t_loop = _timed(lambda: power_curve(
+            model_factory=lambda p: BinomialModel(n=n, p=p),
+            p_values=p_values,
+            rejection_region=R,
+        ))
+        vec, t_vec = _timed(lambda: power_curve_binomial(n, p_values, R))
+
+        diff = np.max(np.abs(np.array([g for _, g in loop]) - vec))
+        print(f"{n:>8} {grid_size:>7} {t_loop:>13.3f} {t_vec:>17.5f} "
+              f"{t_loop / t_vec:>8.0f} {diff:>10.1e}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,42 @@
+# benchmarks/bench_power_surface.py
+"""
+Benchmark: Powerfläche g_n(p) auf einem (n × p)-Gitter,
+in einem Prozess gegen Prozesspool mit gemeinsamem Speicher.
+
+Aufruf (im Projektverzeichnis):
+
+    python -m benchmarks.bench_power_surface
+"""
+from __future__ import annotations
+
+import os
+import time
+
+import numpy as np
+
+from tests.power.power_surface import power_surface
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - t0
+
+
+def run(n_count=1_000, p_count=1_000, n_min=10, p0=0.4, alpha=0.05):
+    n_values = np.arange(n_min, n_min + n_count)
+    p_values = np.linspace(0.0, 1.0, p_count)
+
+    ref, t_ref = _timed(lambda: power_surface(n_values, p_values, p0, alpha))
+    print(f"Gitter {n_count} × {p_count}, 1 Prozess: {t_ref:.2f} s")
+
+    for w in sorted({2, os.cpu_count() or 1} - {1}):
+        res, t = _timed(lambda: power_surface(
+            n_values, p_values, p0, alpha, workers=w
+        ))
+        same = np.array_equal(res.power, ref.power)
+        print(f"{w:>3} Worker: {t:.2f} s  (Faktor {t_ref / t:.1f}, gleich: {same})")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,120 @@
+# benchmarks/check_import_time.py
+"""
+Regressionsprüfung der Importzeit (python -X importtime).
+
+Jedes Modul wird in einem frischen Interpreter importiert.
+Geprüft wird
+- dass weder matplotlib noch scipy mitgeladen werden
+  (beides nur bei Bedarf, innerhalb der Funktionen) – harte Prüfung,
+- die eigene Importzeit des Projekts (Summe der self-Zeiten aller
+  Module unter tests.*, ohne numpy und Standardbibliothek; Median
+  aus mehreren Läufen) gegen ein Budget. Fremde Pakete schwanken
+  je nach Rechner stark und werden nur zur Information gezeigt.
+  Über Budget ist eine Warnung, mit --strict ein Fehler.
+
+Aufruf (im Projektverzeichnis):
+
+    python -m benchmarks.check_import_time
+    python -m benchmarks.check_import_time --budget-ms 30 --runs 5 --strict
+
+Rückgabewert 1, falls eine harte Prüfung fehlschlägt.
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+# Rechenkern und Einstiegsmodule der Grafik (letztere laden
+# matplotlib erst beim Zeichnen)
+MODULES = (
+    "tests.model.binomial",
+    "tests.model.normal",
+    "tests.model.poisson",
+    "tests.geometry.construct_rejection_region",
+    "tests.decision.decision_rule",
+    "tests.decision.p_value",
+    "tests.power.power_function",
+    "tests.power.sample_size",
+    "tests.plots.plot_model",
+    "tests.plots.plot_power",
+    "tests.plots.interactive",
+    "tests.explanatory.sequence",
+)
+
+FORBIDDEN = ("matplotlib", "scipy")
+
+# Pakete, deren Zeit als "eigene" zählt
+PROJECT = "tests"
+
+# eigene Module zusammen derzeit etwa 10–20 ms
+DEFAULT_BUDGET_MS = 50.0
+
+
+def _importtime(module: str) -> tuple[float, float, set[str]]:
+    """
+    Eigene und gesamte Importzeit [ms] sowie alle geladenen Pakete.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    own_us = 0
+    total_us = 0
+    loaded: set[str] = set()
+    for line in proc.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        package = name.split(".")[0]
+        loaded.add(package)
+        if package == PROJECT:
+            own_us += int(self_us)
+        if name == module:
+            total_us = int(cumulative)
+    return own_us / 1000, total_us / 1000, loaded
+
+
+def run(budget_ms: float = DEFAULT_BUDGET_MS, runs: int = 3, strict: bool = False) -> bool:
+    ok = True
+    print(f"{'Modul':<44} {'eigen [ms]':>10} {'Budget':>7} {'gesamt [ms]':>11}  Befund")
+    for module in MODULES:
+        own: list[float] = []
+        total: list[float] = []
+        loaded: set[str] = set()
+        for _ in range(runs):
+            own_ms, total_ms, names = _importtime(module)
+            own.append(own_ms)
+            total.append(total_ms)
+            loaded |= names
+        own_ms = statistics.median(own)
+        total_ms = statistics.median(total)
+
+        problems = [f"lädt {pkg}" for pkg in FORBIDDEN if pkg in loaded]
+        ok &= not problems
+        if own_ms > budget_ms:
+            problems.append("über Budget" if strict else "über Budget (Warnung)")
+            ok &= not strict
+
+        print(f"{module:<44} {own_ms:>10.1f} {budget_ms:>7.0f} {total_ms:>11.1f}  "
+              f"{', '.join(problems) or 'ok'}")
+    return ok
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--strict", action="store_true",
+                        help="Budget-Überschreitung als Fehler werten")
+    args = parser.parse_args(argv)
+    return 0 if run(args.budget_ms, args.runs, args.strict) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+# benchmarks/check_p_values.py
+"""
+Regressionsprüfung der p-Werte (equal tails) gegen die
+ursprüngliche Definition:
+
+    Zentrum  c = Σ x · P(X = x)   (Schleife, von links nach rechts)
+    Spiegel  round(2c - x_obs)
+    p        = P(X <= left) + P(X >= right)
+
+Geprüft werden vor allem Gleichstände: n·p = k/4, dort fällt
+2c - x_obs auf einen halben Wert, und die Rundung hängt am
+Rechenweg des Zentrums. Für jedes n < n_max, jedes p = k/(4n)
+und jedes x_obs müssen skalare und vektorisierte Funktion
+denselben Spiegelpunkt wählen wie die Schleife, dazu feste
+Einzelfälle mit bekanntem p-Wert.
+
+Aufruf (im Projektverzeichnis):
+
+    python -m benchmarks.check_p_values
+    python -m benchmarks.check_p_values --n-max 120
+
+Rückgabewert 1, falls eine Prüfung fehlschlägt.
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import sys
+
+import numpy as np
+
+from tests.model.binomial import BinomialModel
+from tests.decision.p_value import (
+    p_value_two_sided_equal_tails,
+    p_value_two_sided_equal_tails_batch,
+)
+
+# (n, p, x_obs, p-Wert der ursprünglichen Implementierung)
+CASES = (
+    (5, 0.15, 0, 0.9999999999999998),
+    (3, 11 / 12, 2, 1.0),
+    (5, 0.45, 0, 0.06878125000000002),
+    (1, 0.75, 0, 0.25),
+    (3, 1 / 12, 2, 0.019675925925925923),
+    (10, 0.325, 1, 0.18252123778846113),
+    (4, 0.3125, 0, 0.59381103515625),
+    (7, 0.75, 4, 0.68853759765625),
+)
+
+
+def _reference(n: int, p: float, x_obs: int) -> float:
+    # ursprüngliche Schleifen-Implementierung
+    pmf = [math.comb(n, x) * p ** x * (1 - p) ** (n - x) for x in range(n + 1)]
+    center = sum(x * pmf[x] for x in range(n + 1))
+    mirror = int(round(2 * center - x_obs))
+    left, right = min(x_obs, mirror), max(x_obs, mirror)
+    p_val = sum(pmf[x] for x in range(n + 1) if x <= left)
+    p_val += sum(pmf[x] for x in range(n + 1) if x >= right)
+    return min(1.0, p_val)
+
+
+def run(n_max: int = 60) -> int:
+    failures = 0
+
+    for n, p, x_obs, want in CASES:
+        got = p_value_two_sided_equal_tails(BinomialModel(n=n, p=p), x_obs)
+        ok = math.isclose(got, want, rel_tol=1e-9, abs_tol=1e-15)
+        failures += not ok
+        print(f"Bin({n}, {p:.6g}), x = {x_obs}: p = {got:.10g} "
+              f"(erwartet {want:.10g})  {'ok' if ok else 'FEHLER'}")
+
+    checked = 0
+    bad = 0
+    for n in range(1, n_max):
+        for k in range(1, 4 * n):
+            p = k / (4 * n)
+            model = BinomialModel(n=n, p=p)
+            xs = np.arange(n + 1)
+            want = np.array([_reference(n, p, int(x)) for x in xs])
+            batch = p_value_two_sided_equal_tails_batch(model, xs)
+            scalar = np.array([p_value_two_sided_equal_tails(model, int(x)) for x in xs])
+            close = np.isclose(batch, want, rtol=1e-9, atol=1e-12) & (batch == scalar)
+            checked += xs.size
+            if not close.all():
+                bad += int((~close).sum())
+                if bad <= 5:
+                    x = int(xs[~close][0])
+                    print(f"Abweichung: Bin({n}, {p:.6g}), x = {x}: "
+                          f"{batch[x]:.10g} statt {want[x]:.10g}")
+    failures += bad
+    print(f"n·p = k/4, n < {n_max}: {checked:,} p-Werte, {bad} Abweichungen")
+
+    return 1 if failures else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--n-max", type=int, default=60)
+    args = parser.parse_args(argv)
+    return run(args.n_max)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
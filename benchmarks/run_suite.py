@@ -0,0 +1,388 @@
+# benchmarks/run_suite.py
+"""
+Benchmark-Suite: Laufzeit und Spitzenspeicher der zentralen Pfade
+(Modell, Geometrie, Entscheidung, Power, Grafik) für n = 10 ... 10^7.
+
+Ergebnisse als JSON, damit Läufe verglichen und
+Rückschritte erkannt werden können.
+
+Aufruf (im Projektverzeichnis):
+
+    python -m benchmarks.run_suite --output bench.json
+    python -m benchmarks.run_suite --max-n 100000 --output neu.json \\
+        --compare bench.json --threshold 1.3
+
+Mit --compare: Rückgabewert 1, falls ein Fall um mehr als den
+Faktor threshold langsamer geworden ist.
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable
+
+import numpy as np
+
+from tests.model.binomial import BinomialModel, MODEL_CACHE
+from tests.geometry import construct_rejection_region as crr
+from tests.decision.p_value import (
+    p_value_symmetric,
+    p_value_two_sided_equal_tails,
+    p_value_two_sided_equal_tails_batch,
+)
+from tests.power.power_function import power_curve, power_curve_binomial
+
+P0 = 0.4
+P_ALT = 0.45
+ALPHA = 0.05
+N_VALUES = (10, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+# Anzahl Einzelabfragen je Aufruf bei skalaren Funktionen
+LOOKUPS = 1_000
+
+
+@dataclass(frozen=True)
+class Case:
+    """
+    Ein Benchmark-Fall.
+
+    - make(n): bereitet vor (nicht gemessen) und liefert die
+      zu messende Funktion ohne Argumente
+    - ops    : Operationen je Aufruf (für die Zeit je Operation)
+    - max_n  : größtes sinnvolles n (Python-Schleifen über den Träger)
+    """
+    group: str
+    name: str
+    make: Callable[[int], Callable[[], object]]
+    ops: int = 1
+    max_n: int = N_VALUES[-1]
+
+
+# ---------------------------------------------------------------------
+# Fälle
+# ---------------------------------------------------------------------
+
+def _model(n: int, p: float = P0) -> BinomialModel:
+    # fertig aufgebautes Modell (Aufbau nicht Teil der Messung)
+    model = BinomialModel(n=n, p=p)
+    model.cumulative
+    return model
+
+
+def _lookup_points(n: int) -> list[int]:
+    rng = np.random.default_rng(0)
+    return rng.binomial(n, P0, size=LOOKUPS).tolist()
+
+
+def _make_build(n):
+    def run():
+        MODEL_CACHE.clear()
+        return BinomialModel(n=n, p=P0).cumulative
+    return run
+
+
+def _make_scalar(method: str):
+    def make(n):
+        fn = getattr(_model(n), method)
+        ks = _lookup_points(n)
+
+        def run():
+            for k in ks:
+                fn(k)
+        return run
+    return make
+
+
+def _make_construct(construct):
+    def make(n):
+        model = _model(n)
+
+        def run():
+            crr.REGION_CACHE.clear()
+            return construct(model, ALPHA)
+        return run
+    return make
+
+
+def _make_probability(n):
+    R = crr.two_sided_equal_tails(_model(n), ALPHA)
+    return R.probability
+
+
+def _make_p_value(n):
+    model = _model(n)
+    xs = _lookup_points(n)
+
+    def run():
+        for x in xs:
+            p_value_two_sided_equal_tails(model, x)
+    return run
+
+
+def _make_p_value_batch(n):
+    model = _model(n)
+    xs = np.random.default_rng(0).binomial(n, P0, size=100_000)
+    return lambda: p_value_two_sided_equal_tails_batch(model, xs)
+
+
+def _make_p_value_symmetric(n):
+    model = _model(n)
+    x = int(n * P0) // 2
+    return lambda: p_value_symmetric(x, model, n * P0)
+
+
+def _make_power_curve(n):
+    R = crr.two_sided_equal_tails(_model(n), ALPHA)
+    p_values = np.linspace(0.0, 1.0, 101)
+    return lambda: power_curve(
+        model_factory=lambda p: BinomialModel(n=n, p=p),
+        p_values=p_values,
+        rejection_region=R,
+    )
+
+
+def _make_power_curve_binomial(n):
+    R = crr.two_sided_equal_tails(_model(n), ALPHA)
+    p_values = np.linspace(0.0, 1.0, 1_001)
+    return lambda: power_curve_binomial(n, p_values, R)
+
+
+def _make_plot(draw):
+    # Zeichnen + Speichern (PNG in den Speicher), danach schließen
+    def make(n):
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+        from tests.plots.plot_model import ModelPlotStyle
+
+        model = _model(n)
+        style = ModelPlotStyle()
+
+        def run():
+            ax = draw(model, style, io.BytesIO())
+            plt.close(ax.figure)
+        return run
+    return make
+
+
+def _plot_model(model, style, buf):
+    from tests.plots.plot_model import plot_binomial_model
+    return plot_binomial_model(model=model, style=style, save=buf)
+
+
+def _plot_rejection_region(model, style, buf):
+    from tests.plots.plot_rejection_region import (
+        plot_binomial_model_with_rejection_region,
+    )
+    return plot_binomial_model_with_rejection_region(
+        model=model, alpha=ALPHA, k_obs=int(model.n * P0), style=style, save=buf
+    )
+
+
+def _plot_p_value(model, style, buf):
+    from tests.plots.plot_p_value import plot_binomial_model_with_p_value
+    return plot_binomial_model_with_p_value(
+        model=model, x_obs=int(model.n * P_ALT), style=style, save=buf
+    )
+
+
+def _plot_power(model, style, buf):
+    from tests.plots.plot_power import plot_power_curve
+    n = model.n
+    return plot_power_curve(
+        lambda p: BinomialModel(n=n, p=p),
+        crr.two_sided_equal_tails(model, ALPHA),
+        p0=P0, n=n, alpha=ALPHA, p_star=P_ALT, style=style, save=buf,
+    )
+
+
+def _plot_spiegel(model, style, buf):
+    from tests.explanatory.plot_spiegel_distribution import plot_spiegel_distribution
+    return plot_spiegel_distribution(
+        model_alt=_model(model.n, P_ALT),
+        model_null=model,
+        rejection_region=crr.two_sided_equal_tails(model, ALPHA),
+        style=style,
+        save=buf,
+    )
+
+
+CASES = (
+    Case("model", "BinomialModel (Aufbau)", _make_build),
+    Case("model", "BinomialModel.pmf", _make_scalar("pmf"), ops=LOOKUPS),
+    Case("model", "BinomialModel.cdf", _make_scalar("cdf"), ops=LOOKUPS),
+    Case("model", "BinomialModel.sf", _make_scalar("sf"), ops=LOOKUPS),
+    Case("geometry", "left_tail", _make_construct(crr.left_tail)),
+    Case("geometry", "right_tail", _make_construct(crr.right_tail)),
+    Case("geometry", "two_sided_equal_tails", _make_construct(crr.two_sided_equal_tails)),
+    Case("geometry", "two_sided_symmetric", _make_construct(crr.two_sided_symmetric)),
+    Case("geometry", "RejectionRegion.probability", _make_probability),
+    Case("decision", "p_value_two_sided_equal_tails", _make_p_value, ops=LOOKUPS),
+    Case("decision", "p_value_two_sided_equal_tails_batch", _make_p_value_batch,
+         ops=100_000),
+    # Summe über den ganzen Träger in Python
+    Case("decision", "p_value_symmetric", _make_p_value_symmetric, max_n=100_000),
+    # ein Modell je p (101 Stück)
+    Case("power", "power_curve", _make_power_curve, max_n=100_000),
+    Case("power", "power_curve_binomial", _make_power_curve_binomial),
+    Case("plot", "plot_binomial_model", _make_plot(_plot_model)),
+    Case("plot", "plot_binomial_model_with_rejection_region",
+         _make_plot(_plot_rejection_region)),
+    Case("plot", "plot_binomial_model_with_p_value", _make_plot(_plot_p_value)),
+    Case("plot", "plot_power_curve", _make_plot(_plot_power)),
+    Case("plot", "plot_spiegel_distribution", _make_plot(_plot_spiegel)),
+)
+
+
+# ---------------------------------------------------------------------
+# Messung
+# ---------------------------------------------------------------------
+
+def _measure(fn: Callable[[], object], min_time: float, max_repeat: int) -> dict:
+    # Aufwärmen: verzögerte Importe (scipy, matplotlib), erste Allokationen
+    fn()
+
+    times = []
+    total = 0.0
+    while len(times) < max_repeat and (total < min_time or len(times) < 3):
+        t0 = time.perf_counter()
+        fn()
+        dt = time.perf_counter() - t0
+        times.append(dt)
+        total += dt
+        if dt > min_time:
+            break
+
+    # Spitzenspeicher in einem eigenen Aufruf (tracemalloc bremst)
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "seconds_median": statistics.median(times),
+        "seconds_min": min(times),
+        "repeats": len(times),
+        "peak_bytes": peak,
+    }
+
+
+def _meta() -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+    }
+
+
+def run(
+    *,
+    n_values=N_VALUES,
+    groups=None,
+    min_time: float = 0.2,
+    max_repeat: int = 20,
+) -> dict:
+    results = []
+    print(f"{'Gruppe':<9} {'Fall':<40} {'n':>9} {'Zeit/Op':>11} {'Spitze':>10}")
+    for case in CASES:
+        if groups and case.group not in groups:
+            continue
+        for n in n_values:
+            if n > case.max_n:
+                continue
+            fn = case.make(n)
+            m = _measure(fn, min_time, max_repeat)
+            per_op = m["seconds_median"] / case.ops
+            results.append({
+                "group": case.group,
+                "name": case.name,
+                "n": n,
+                "ops": case.ops,
+                "seconds_per_op": per_op,
+                **m,
+            })
+            print(f"{case.group:<9} {case.name:<40} {n:>9} "
+                  f"{_fmt_time(per_op):>11} {m['peak_bytes'] / 2**20:>8.2f} MB")
+    return {"meta": _meta(), "results": results}
+
+
+def _fmt_time(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[dict]:
+    """
+    Fälle, die gegenüber baseline um mehr als den Faktor
+    threshold langsamer sind (Zuordnung über Name und n).
+    """
+    base = {(r["name"], r["n"]): r for r in baseline["results"]}
+    regressions = []
+    for r in current["results"]:
+        b = base.get((r["name"], r["n"]))
+        if b is None or b["seconds_per_op"] <= 0:
+            continue
+        ratio = r["seconds_per_op"] / b["seconds_per_op"]
+        if ratio > threshold:
+            regressions.append({"name": r["name"], "n": r["n"], "ratio": ratio})
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", help="Ergebnisse als JSON schreiben")
+    parser.add_argument("--max-n", type=int, default=N_VALUES[-1])
+    parser.add_argument("--group", action="append",
+                        choices=sorted({c.group for c in CASES}),
+                        help="nur diese Gruppe(n)")
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="Mindestmesszeit je Fall [s]")
+    parser.add_argument("--compare", help="Vergleichslauf (JSON)")
+    parser.add_argument("--threshold", type=float, default=1.3)
+    args = parser.parse_args(argv)
+
+    report = run(
+        n_values=[n for n in N_VALUES if n <= args.max_n],
+        groups=args.group,
+        min_time=args.min_time,
+    )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        for r in regressions:
+            print(f"LANGSAMER: {r['name']} (n={r['n']}) Faktor {r['ratio']:.2f}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
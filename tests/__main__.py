@@ -0,0 +1,75 @@
+# tests/__main__.py
+"""
+Stapelverarbeitung von Testspezifikationen.
+
+Je Zeile der Eingabe (CSV mit Kopfzeile oder JSON Lines):
+    n, p0, alpha, construction, k_obs, p_star (optional)
+Je Zeile der Ausgabe zusätzlich:
+    l, r, size, p_value, reject, power
+
+Aufruf (im Projektverzeichnis):
+
+    python -m tests eingabe.csv -o ausgabe.csv
+    python -m tests eingabe.jsonl --workers 4 > ausgabe.jsonl
+    cat eingabe.csv | python -m tests - --output-format jsonl
+
+construction: two_sided_equal_tails (Standard), two_sided_symmetric,
+left_tail, right_tail.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+
+from tests.batch.runner import FORMATS, read_specs, run_batch, write_results
+
+
+def _format(path: str, given: str | None) -> str:
+    if given is not None:
+        return given
+    return "jsonl" if path.endswith((".jsonl", ".ndjson")) else "csv"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m tests",
+        description=__doc__.splitlines()[1],
+    )
+    parser.add_argument("input", nargs="?", default="-",
+                        help="Eingabedatei (- : Standardeingabe)")
+    parser.add_argument("-o", "--output", default="-",
+                        help="Ausgabedatei (- : Standardausgabe)")
+    parser.add_argument("--format", choices=FORMATS,
+                        help="Eingabeformat (Standard: nach Dateiendung, sonst csv)")
+    parser.add_argument("--output-format", choices=FORMATS,
+                        help="Ausgabeformat (Standard: wie Eingabe)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Anzahl Prozesse (0: alle Kerne)")
+    parser.add_argument("--chunk-size", type=int, default=10_000,
+                        help="Zeilen je Block")
+    args = parser.parse_args(argv)
+
+    fmt_in = _format(args.input, args.format)
+    fmt_out = args.output_format or (
+        fmt_in if args.output == "-" else _format(args.output, None)
+    )
+
+    src = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+    dst = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+    try:
+        specs = read_specs(src, fmt_in)
+        results = run_batch(specs, workers=args.workers or None, chunk_size=args.chunk_size)
+        write_results(dst, results, fmt_out)
+    except ValueError as e:
+        print(f"Fehler: {e}", file=sys.stderr)
+        return 2
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if dst is not sys.stdout:
+            dst.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
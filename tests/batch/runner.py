@@ -0,0 +1,310 @@
+# tests/batch/runner.py
+from __future__ import annotations
+
+import csv
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import IO, Iterable, Iterator
+
+import numpy as np
+
+from tests.model.binomial import BinomialModel
+from tests.geometry.construct_rejection_region import (
+    left_tail,
+    right_tail,
+    two_sided_equal_tails,
+    two_sided_symmetric,
+)
+from tests.geometry.critical_values import tail_boundaries
+from tests.decision.p_value import p_value_two_sided_equal_tails_batch
+from tests.power.power_function import power_at
+
+
+# ------------------------------------------------------------------
+# Stapelverarbeitung: Testspezifikationen rein, Entscheidungen raus
+# ------------------------------------------------------------------
+#
+# Je Zeile: n, p0, alpha, construction, k_obs, optional p_star.
+# Je Zeile zurück: K-Ränder (l, r), size = P_H0(K), p-Wert,
+# Entscheidung, Power bei p_star.
+#
+# Die Eingabe wird blockweise gelesen (chunk_size Zeilen); im Block
+# werden Zeilen mit gleichem (n, p0, alpha, construction) gruppiert,
+# Modell und Bereich also je Gruppe einmal aufgebaut. Die Gruppen
+# eines Blocks werden auf die Worker verteilt; ausgegeben wird in
+# der Reihenfolge der Eingabe.
+
+CONSTRUCTIONS = {
+    "two_sided_equal_tails": two_sided_equal_tails,
+    "two_sided_symmetric": two_sided_symmetric,
+    "left_tail": left_tail,
+    "right_tail": right_tail,
+}
+
+INPUT_FIELDS = ("n", "p0", "alpha", "construction", "k_obs", "p_star")
+RESULT_FIELDS = ("l", "r", "size", "p_value", "reject", "power")
+
+
+def _integer(value) -> int:
+    # ganze Zahl aus Text ("10") oder JSON (10, 10.0);
+    # 10.7 oder true wären still abgeschnitten -> Fehler
+    if isinstance(value, bool):
+        raise ValueError
+    if isinstance(value, float) and not value.is_integer():
+        raise ValueError
+    return int(value)
+
+
+@dataclass(frozen=True)
+class TestSpec:
+    """
+    Eine Zeile der Eingabe: Modell, Setzung, Beobachtung, optional p*.
+    """
+    n: int
+    p0: float
+    alpha: float
+    construction: str
+    k_obs: int
+    p_star: float | None = None
+
+    def __post_init__(self):
+        if self.n <= 0:
+            raise ValueError("n muss positiv sein")
+        if not (0 < self.p0 < 1):
+            raise ValueError("p0 muss in (0,1) liegen")
+        if not (0 < self.alpha < 1):
+            raise ValueError("alpha muss in (0,1) liegen")
+        if self.construction not in CONSTRUCTIONS:
+            raise ValueError(f"unbekannte Setzung {self.construction!r}")
+        if not (0 <= self.k_obs <= self.n):
+            raise ValueError("k_obs muss in 0..n liegen")
+        if self.p_star is not None and not (0 <= self.p_star <= 1):
+            raise ValueError("p_star muss in [0,1] liegen")
+
+    @property
+    def group(self) -> tuple[int, float, float, str]:
+        return self.n, self.p0, self.alpha, self.construction
+
+    @classmethod
+    def from_row(cls, row: dict) -> "TestSpec":
+        """Aus einer Zeile (CSV: Text, JSON: Zahlen); leere Felder fehlen."""
+        if not isinstance(row, dict):
+            raise ValueError(f"Objekt mit Feldern erwartet, nicht {type(row).__name__}")
+
+        def get(name: str, convert, default=None, required=True):
+            value = row.get(name)
+            if value is None or value == "":
+                if required:
+                    raise ValueError(f"Feld {name!r} fehlt")
+                return default
+            try:
+                return convert(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"Feld {name!r}: ungültiger Wert {value!r}") from None
+
+        return cls(
+            n=get("n", _integer),
+            p0=get("p0", float),
+            alpha=get("alpha", float),
+            construction=get("construction", str, "two_sided_equal_tails", required=False),
+            k_obs=get("k_obs", _integer),
+            p_star=get("p_star", float, required=False),
+        )
+
+
+@dataclass(frozen=True)
+class TestResult:
+    """
+    Ergebnis einer Zeile.
+
+    - l, r   : K = {0..l} ∪ {r..n} (l = -1 / r = n+1: Rand leer)
+    - size   : P(X ∈ K) unter H0
+    - p_value: zur Setzung passender p-Wert
+    - reject : k_obs ∈ K
+    - power  : P(X ∈ K) unter p_star (None ohne p_star)
+    """
+    l: int
+    r: int
+    size: float
+    p_value: float
+    reject: bool
+    power: float | None
+
+
+# ------------------------------------------------------------------
+# Rechnen (je Gruppe ein Modell, ein Bereich)
+# ------------------------------------------------------------------
+
+def _p_values(construction: str, model: BinomialModel, k: np.ndarray) -> np.ndarray:
+    if construction == "left_tail":
+        return np.asarray(model.cdf(k))
+    if construction == "right_tail":
+        return np.asarray(model.sf(k))
+    if construction == "two_sided_symmetric":
+        # wie p_value_symmetric: Summe aller P(X=x) <= P(X=k_obs),
+        # über die sortierten pmf-Werte statt je Beobachtung über den Träger
+        pmf_sorted = np.sort(model.pmf_values)
+        cum = np.cumsum(pmf_sorted)
+        idx = np.searchsorted(pmf_sorted, np.asarray(model.pmf(k)), side="right")
+        return cum[idx - 1]
+    return p_value_two_sided_equal_tails_batch(model, k)
+
+
+def _evaluate(task) -> list[list[TestResult]]:
+    # Auf Modulebene, damit der Prozesspool ihn picklen kann.
+    # task: [(Gruppe, k_obs-Liste, p_star-Liste), ...]
+    out = []
+    for (n, p0, alpha, construction), ks, p_stars in task:
+        model = BinomialModel(n=n, p=p0)
+        R = CONSTRUCTIONS[construction](model, alpha)
+        l, r = tail_boundaries(R.K, n)
+        size = R.probability()
+
+        k = np.asarray(ks, dtype=np.int64)
+        p_vals = _p_values(construction, model, k)
+        reject = R.contains_array(k)
+        power = {
+            p: power_at(BinomialModel(n=n, p=p), R)
+            for p in set(p_stars) if p is not None
+        }
+        out.append([
+            TestResult(l, r, size, float(pv), bool(rj), power.get(ps))
+            for pv, rj, ps in zip(p_vals, reject, p_stars)
+        ])
+    return out
+
+
+def _tasks(chunk: list[TestSpec], parts: int):
+    """
+    Gruppen eines Blocks auf höchstens parts Pakete verteilen
+    (größte Gruppe zuerst, jeweils ins kleinste Paket).
+    Liefert je Paket (task, Zeilenindizes je Gruppe).
+    """
+    groups: dict[tuple, list[int]] = {}
+    for i, spec in enumerate(chunk):
+        groups.setdefault(spec.group, []).append(i)
+
+    bins: list[list] = [[] for _ in range(parts)]
+    sizes = [0] * parts
+    for key, idx in sorted(groups.items(), key=lambda item: -len(item[1])):
+        j = sizes.index(min(sizes))
+        bins[j].append((key, idx))
+        sizes[j] += len(idx)
+
+    for b in bins:
+        if b:
+            task = [
+                (key, [chunk[i].k_obs for i in idx], [chunk[i].p_star for i in idx])
+                for key, idx in b
+            ]
+            yield task, [idx for _, idx in b]
+
+
+def _assemble(chunk: list[TestSpec], parts) -> Iterator[tuple[TestSpec, TestResult]]:
+    # parts: [(Ergebnisse je Gruppe, Zeilenindizes je Gruppe), ...]
+    results: list[TestResult | None] = [None] * len(chunk)
+    for group_results, group_idx in parts:
+        for res, idx in zip(group_results, group_idx):
+            for i, r in zip(idx, res):
+                results[i] = r
+    return zip(chunk, results)
+
+
+def _chunks(specs: Iterable[TestSpec], size: int) -> Iterator[list[TestSpec]]:
+    it = iter(specs)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+def run_batch(
+    specs: Iterable[TestSpec],
+    *,
+    workers: int | None = 1,
+    chunk_size: int = 10_000,
+) -> Iterator[tuple[TestSpec, TestResult]]:
+    """
+    (Spezifikation, Ergebnis) je Eingabezeile, in Eingabereihenfolge.
+
+    - specs     : beliebig langer Strom (wird blockweise gelesen)
+    - workers   : Anzahl Prozesse; 1 = im aktuellen Prozess,
+                  None = os.cpu_count()
+    - chunk_size: Zeilen je Block; höchstens zwei Blöcke
+                  liegen gleichzeitig im Speicher
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size muss positiv sein")
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers == 1:
+        for chunk in _chunks(specs, chunk_size):
+            yield from _assemble(
+                chunk, [(_evaluate(task), idx) for task, idx in _tasks(chunk, 1)]
+            )
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: deque = deque()
+        for chunk in _chunks(specs, chunk_size):
+            futures = [(pool.submit(_evaluate, task), idx) for task, idx in _tasks(chunk, workers)]
+            pending.append((chunk, futures))
+            # nächster Block rechnet, während dieser ausgegeben wird
+            if len(pending) > 1:
+                done, futures = pending.popleft()
+                yield from _assemble(done, [(f.result(), idx) for f, idx in futures])
+        while pending:
+            done, futures = pending.popleft()
+            yield from _assemble(done, [(f.result(), idx) for f, idx in futures])
+
+
+# ------------------------------------------------------------------
+# Ein- und Ausgabe (CSV mit Kopfzeile oder JSON Lines)
+# ------------------------------------------------------------------
+
+FORMATS = ("csv", "jsonl")
+
+
+def read_specs(stream: IO[str], fmt: str = "csv") -> Iterator[TestSpec]:
+    """Zeilen lesen und prüfen (Fehler mit Nummer des Datensatzes)."""
+    if fmt == "csv":
+        rows = csv.DictReader(stream)
+    elif fmt == "jsonl":
+        rows = (json.loads(line) for line in stream if line.strip())
+    else:
+        raise ValueError(f"Format muss eines von {FORMATS} sein")
+
+    for number, row in enumerate(rows, start=1):
+        try:
+            yield TestSpec.from_row(row)
+        except ValueError as e:
+            raise ValueError(f"Datensatz {number}: {e}") from None
+
+
+def write_results(
+    stream: IO[str],
+    results: Iterable[tuple[TestSpec, TestResult]],
+    fmt: str = "csv",
+) -> int:
+    """Eingabefelder und Ergebnisse je Zeile schreiben; Rückgabe: Anzahl."""
+    if fmt not in FORMATS:
+        raise ValueError(f"Format muss eines von {FORMATS} sein")
+
+    fields = INPUT_FIELDS + RESULT_FIELDS
+    writer = None
+    if fmt == "csv":
+        writer = csv.writer(stream)
+        writer.writerow(fields)
+
+    count = 0
+    for spec, result in results:
+        values = [getattr(spec, f) for f in INPUT_FIELDS] + [getattr(result, f) for f in RESULT_FIELDS]
+        if writer is not None:
+            writer.writerow(["" if v is None else v for v in values])
+        else:
+            stream.write(json.dumps(dict(zip(fields, values))) + "\n")
+        count += 1
+    return count
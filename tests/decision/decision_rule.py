@@ -3,7 +3,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
+
 from tests.geometry.rejection_region import RejectionRegion
+from tests.utils.profiling import staged
 
 
 @dataclass(frozen=True)
@@ -33,3 +36,37 @@ def decision_rule(x_obs: int, rejection_region: RejectionRegion) -> TestDecision
     """
     reject = rejection_region.contains(x_obs)
     return TestDecision(x_obs=x_obs, reject=reject)
+
+
+# Kompakte Form vieler Entscheidungen (ein Eintrag je Beobachtung)
+DECISION_DTYPE = np.dtype([("x_obs", np.int64), ("reject", np.bool_)])
+
+
+@staged("decision")
+def decision_rule_batch(
+    x_obs,
+    rejection_region: RejectionRegion,
+    *,
+    structured: bool = False,
+) -> np.ndarray:
+    """
+    Entscheidungsregel für viele Beobachtungen auf einmal
+    (gleicher Test, gleicher Ablehnungsbereich).
+
+    Verwerfe H0 für x genau dann, wenn x ∈ K
+    – vektorisiert, ohne ein TestDecision-Objekt je Beobachtung.
+
+    Rückgabe:
+    - structured=False: boolesche Maske reject (Form wie x_obs)
+    - structured=True : Array mit Feldern x_obs, reject (DECISION_DTYPE)
+    """
+    x = np.asarray(x_obs)
+    reject = rejection_region.contains_array(x)
+
+    if not structured:
+        return reject
+
+    out = np.empty(x.shape, dtype=DECISION_DTYPE)
+    out["x_obs"] = x
+    out["reject"] = reject
+    return out
@@ -1,8 +1,14 @@
 # tests/decision/p_value.py
 from __future__ import annotations
 
+import math
 from typing import Iterable, Protocol
 
+import numpy as np
+
+from tests.utils.error_bound import truncation_error, with_error_bound
+from tests.utils.profiling import staged
+
 
 class DiscreteModel(Protocol):
     @property
@@ -12,32 +18,187 @@ class DiscreteModel(Protocol):
     def pmf(self, x: int) -> float:
         ...
 
+    def cdf(self, x: int) -> float:
+        ...
+
+    def sf(self, x: int) -> float:
+        ...
+
+
+# 2·Zentrum so nah an k + 1/2: Spiegelung 2c - x fällt (für jedes x)
+# auf einen halben Wert, Rundung nur über den Rechenweg entschieden
+_HALF_TOL = 1e-9
+
+
+def _weighted_center(model: DiscreteModel) -> float:
+    # Σ x · P(X = x), von links nach rechts aufsummiert wie die
+    # ursprüngliche Schleife (cumsum läuft der Reihe nach, np.dot nicht)
+    values = getattr(model, "pmf_values", None)
+    if values is not None:
+        x = np.asarray(getattr(model, "window", model.support), dtype=float)
+    else:
+        x = np.asarray(model.support, dtype=float)
+        values = np.array([model.pmf(xi) for xi in model.support], dtype=float)
+    if x.size == 0:
+        return 0.0
+    return float(np.cumsum(x * values)[-1])
+
+
+def _center(model: DiscreteModel) -> float:
+    """
+    Spiegelzentrum: Erwartungswert Σ x · P(X = x).
+
+    Modelle mit geschlossenem Erwartungswert (mean) liefern ihn direkt.
+    Ausnahme: 2·mean liegt auf k + 1/2 (n·p = k/2 + 1/4). Dann fällt
+    jede Spiegelung 2c - x auf einen halben Wert, und die Rundung
+    entschied bisher der Rundungsfehler der Summe. Modelle mit
+    pmf-Tabelle (pmf_values) summieren deshalb wie bisher in derselben
+    Reihenfolge (für n <= EXACT_MAX_N bitgleich, also dieselben
+    Spiegelpunkte); ohne Tabelle bleibt es beim Erwartungswert.
+    """
+    mean = getattr(model, "mean", None)
+    if mean is None:
+        return _weighted_center(model)
+    mean = float(mean)
+    tie = abs((2 * mean) % 1.0 - 0.5) <= _HALF_TOL
+    if tie and getattr(model, "pmf_values", None) is not None:
+        return _weighted_center(model)
+    return mean
+
+
+def _mirror(center: float, x):
+    # Spiegelpunkt round(2c - x), skalar wie elementweise
+    # (round und np.round runden beide genau halbe Werte zur geraden Zahl)
+    m = np.round(2 * center - np.asarray(x)).astype(np.int64)
+    return int(m) if m.ndim == 0 else m
+
+
+@staged("decision")
 def p_value_two_sided_equal_tails(model, x_obs: int) -> float:
     """
     Zweiseitiger p-Wert (equal tails, schulische Setzung).
 
     p = P(X <= left) + P(X >= right),
     wobei (left, right) = sort(x_obs, spiegel(x_obs)).
+
+    Randmassen aus den kumulierten Tabellen des Modells (cdf/sf).
+    Bei abgeschnittenen Modellen weicht p um höchstens
+    model.truncation_error vom exakten Wert ab; die Schranke
+    steht am Ergebnis (p.error_bound, siehe utils.error_bound).
     """
-    center = sum(x * model.pmf(x) for x in model.support)
-    mirror = int(round(2 * center - x_obs))
+    mirror = _mirror(_center(model), x_obs)
 
     left = min(x_obs, mirror)
     right = max(x_obs, mirror)
 
-    p_left = sum(model.pmf(x) for x in model.support if x <= left)
-    p_right = sum(model.pmf(x) for x in model.support if x >= right)
+    p_left = model.cdf(left)
+    p_right = model.sf(right)
 
     p_val = p_left + p_right
-    return min(1.0, p_val)  # numerische Sicherung / Diskretheit
+    p_val = min(1.0, p_val)  # numerische Sicherung / Diskretheit
+    return with_error_bound(p_val, truncation_error(model))
 
 
+@staged("decision")
+def p_value_two_sided_equal_tails_batch(model, x_obs) -> np.ndarray:
+    """
+    Zweiseitiger p-Wert (equal tails) für viele Beobachtungen.
 
+    Gleiche Definition wie p_value_two_sided_equal_tails:
+    - Zentrum einmal berechnen (O(n))
+    - alle Beobachtungen in einem Schritt spiegeln
+    - beide Ränder als Tabellenzugriff (cdf/sf, je O(1))
+
+    Rückgabe:
+        Array der p-Werte, elementweise gleich der skalaren Funktion
+        (mit error_bound wie dort)
+    """
+    x = np.asarray(x_obs)
+    mirror = _mirror(_center(model), x)
+
+    left = np.minimum(x, mirror)
+    right = np.maximum(x, mirror)
+
+    p_val = model.cdf(left) + model.sf(right)
+    return with_error_bound(np.minimum(1.0, p_val), truncation_error(model))
+
+
+
+_TIE_RTOL = 1e-12
+
+
+def _first_at_most(pmf, px: float, lo: int, hi: float) -> float:
+    """
+    Kleinstes y in [lo, hi] mit pmf(y) <= px, pmf dort fallend
+    (hi = inf: exponentiell eingrenzen). Keins: hi + 1.
+    """
+    if pmf(lo) <= px:
+        return lo
+    step = 1
+    while lo + step < hi and pmf(lo + step) > px:
+        lo, step = lo + step, 2 * step
+    # pmf(lo) > px; Treffer (falls vorhanden) in (lo, min(lo + step, hi)]
+    top = min(lo + step, hi)
+    if top == hi and pmf(hi) > px:
+        return hi + 1
+    while top - lo > 1:
+        mid = (lo + top) // 2
+        if pmf(mid) <= px:
+            top = mid
+        else:
+            lo = mid
+    return top
+
+
+def _p_value_unimodal(x_obs: int, model: DiscreteModel) -> float:
+    """
+    p_value_symmetric für unimodale Modelle mit Modus (model.mode),
+    ohne den Träger aufzuzählen (O(log n) pmf-Abfragen):
+
+    pmf steigt bis zum Modus c und fällt danach, also ist
+        {x : pmf(x) <= pmf(x_obs)} = {x <= a} ∪ {x >= b},
+    a = größtes x <= c, b = kleinstes x > c mit pmf(x) <= pmf(x_obs);
+    p = cdf(a) + sf(b).
+
+    Gleichstände (z. B. pmf(mu-1) = pmf(mu) bei ganzem mu) zählen
+    mit: Vergleich mit relativer Toleranz _TIE_RTOL, damit Rundung
+    keine Lücke in eine der beiden Randmengen reißt.
+    """
+    px = model.pmf(x_obs) * (1 + _TIE_RTOL)
+    c = int(model.mode)
+    start = model.support.start
+
+    # links: pmf steigt auf [start, c]; binär nach a suchen
+    # (Invariante: pmf(a) <= px, pmf(hi) > px; Ränder gedacht)
+    a, hi = start - 1, c + 1
+    while hi - a > 1:
+        mid = (a + hi) // 2
+        if model.pmf(mid) <= px:
+            a = mid
+        else:
+            hi = mid
+
+    # rechts: pmf fällt ab c + 1 (bei Poisson nach oben offen)
+    b = _first_at_most(model.pmf, px, c + 1, model.support.stop - 1)
+    return min(1.0, model.cdf(a) + model.sf(b))
+
+
+@staged("decision")
 def p_value_symmetric(x_obs: int, model: DiscreteModel, center: float) -> float:
     """
     Alternative p-Wert-Definition:
     Summe aller Wahrscheinlichkeiten,
     die <= pmf(x_obs) sind (klassisch NP-artig).
+
+    Modelle mit Modus (Poisson mit unbeschränktem Träger,
+    Normalapproximation): über die beiden Ränder um den Modus
+    mit geschlossenen Randmassen (cdf/sf), siehe _p_value_unimodal.
+
+    Schranke für abgeschnittene Modelle: p.error_bound.
     """
-    px = model.pmf(x_obs)
-    return sum(model.pmf(x) for x in model.support if model.pmf(x) <= px)
+    if getattr(model, "mode", None) is not None:
+        p_val = _p_value_unimodal(x_obs, model)
+    else:
+        px = model.pmf(x_obs)
+        p_val = sum(model.pmf(x) for x in model.support if model.pmf(x) <= px)
+    return with_error_bound(p_val, truncation_error(model))
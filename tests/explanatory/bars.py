@@ -0,0 +1,73 @@
+# tests/explanatory/bars.py
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import PolyCollection
+
+
+# ------------------------------------------------------------------
+# Balken als EIN Artist
+# ------------------------------------------------------------------
+#
+# ax.bar legt je Balken ein eigenes Rechteck an; bei n = 2000
+# sind das tausende Artists (langsames Zeichnen, riesige PDFs).
+# Hier werden alle Balken einer Farbschicht als eine PolyCollection
+# aus Arrays gebaut; Aussehen wie ax.bar (mittig, gleiche Breite).
+
+
+def bar_verts(x, heights, width: float) -> np.ndarray:
+    """Eckpunkte der Balken, Form (m, 4, 2)."""
+    x = np.asarray(x, dtype=float)
+    h = np.asarray(heights, dtype=float)
+    left = x - width / 2
+    right = x + width / 2
+    zero = np.zeros_like(x)
+    return np.stack(
+        [
+            np.stack([left, zero], axis=-1),
+            np.stack([left, h], axis=-1),
+            np.stack([right, h], axis=-1),
+            np.stack([right, zero], axis=-1),
+        ],
+        axis=1,
+    )
+
+
+def bar_collection(
+    ax: plt.Axes,
+    x,
+    heights,
+    *,
+    width: float,
+    color,
+    edgecolor=None,
+    linewidth: float = 0.0,
+    zorder: float = 2,
+) -> PolyCollection:
+    """
+    Zeichnet Balken bei x mit Höhen heights (auch negativ)
+    als eine PolyCollection.
+
+    color: eine Farbe oder eine Farbe je Balken.
+    """
+    from matplotlib.collections import PolyCollection   # erst bei Bedarf (Importzeit)
+
+    coll = PolyCollection(
+        bar_verts(x, heights, width),
+        facecolors=color,
+        edgecolors="none" if edgecolor is None else edgecolor,
+        linewidths=linewidth,
+        zorder=zorder,
+    )
+    ax.add_collection(coll, autolim=False)
+    return coll
+
+
+def set_bar_heights(coll: PolyCollection, x, heights, width: float) -> None:
+    """Neue Höhen für eine bestehende Balken-Collection (gleiche x)."""
+    coll.set_verts(bar_verts(x, heights, width))
@@ -1,9 +1,148 @@
 # tests/explanatory/plot_spiegel_distribution.py
 from __future__ import annotations
 
-import matplotlib.pyplot as plt
+from typing import TYPE_CHECKING
 
+import numpy as np
+
+from tests.explanatory.bars import bar_collection, set_bar_heights
 from tests.plots.plot_model import ModelPlotStyle
+from tests.utils.profiling import stage, staged
+
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
+
+class SpiegelDistributionFrame:
+    """
+    Spiegel-Grafik als wiederverwendbares Bild.
+
+    Beim Anlegen wird alles gezeichnet, was nur von H0 und K abhängt
+    (Achsen, H0-Verteilung, Spiegelachse, Beschriftung).
+    update(model_alt) ändert danach nur die Balkenhöhen der
+    gespiegelten H1-Verteilung und die H1-Beschriftung.
+
+    Für Sequenzen: eine Figur, beliebig viele Bilder,
+    gleichbleibender Speicherbedarf.
+    """
+
+    @staged("plot")
+    def __init__(
+        self,
+        *,
+        model_null,
+        rejection_region,
+        style: ModelPlotStyle,
+        ax: plt.Axes | None = None,
+    ):
+        if ax is None:
+            import matplotlib.pyplot as plt   # erst bei Bedarf (Importzeit)
+            fig, ax = plt.subplots(figsize=style.figsize)
+        self.ax = ax
+        self.fig = ax.figure
+        self.style = style
+
+        # -------------------------------------------------
+        # x-Bereich: sigma-basiert (jetzt wirksam!)
+        # -------------------------------------------------
+        mu = model_null.n * model_null.p
+        sigma = (model_null.n * model_null.p * (1 - model_null.p)) ** 0.5
+
+        xmin = max(0, int(mu - style.sigma_range * sigma))
+        xmax = min(model_null.n, int(mu + style.sigma_range * sigma))
+
+        ax.set_xlim(xmin, xmax)
+
+        # Balkenpositionen und Zugehörigkeit zu K (vektorisiert)
+        self.k = np.arange(xmin, xmax + 1)
+        in_K = rejection_region.K.contains_array(self.k)
+        pmf_null = np.asarray(model_null.pmf(self.k), dtype=float)
+
+        # -------------------------------------------------
+        # H0-Verteilung (oben, fix)
+        #   rot: Ablehnung unter H0, blau: akzeptiert
+        # -------------------------------------------------
+        bar_collection(
+            ax,
+            self.k,
+            pmf_null,
+            width=style.bar_width,
+            color=np.where(in_K, style.reject_color, style.model_color),
+            edgecolor="black",
+            linewidth=0.5,
+        )
+
+        # -------------------------------------------------
+        # H1-Verteilung gespiegelt (unten, beweglich)
+        #   grün: Power-Masse, hellblau: nicht verworfen
+        #   Höhen folgen in update()
+        # -------------------------------------------------
+        self._alt_bars = bar_collection(
+            ax,
+            self.k,
+            np.zeros(self.k.size),
+            width=style.bar_width,
+            color=np.where(in_K, style.power_pstar_color, "lightblue"),
+            edgecolor="black",
+            linewidth=0.3,
+        )
+
+        # -------------------------------------------------
+        # Spiegelachse & y-Achse
+        # -------------------------------------------------
+        ax.axhline(0, color="black", linewidth=1)
+
+        ymax = pmf_null.max()
+        ax.set_ylim(-1.2 * ymax, 1.2 * ymax)
+
+        ax.set_xlabel(r"Anzahl der Erfolge $k$")
+        ax.set_ylabel(r"$P(X = k)$")
+
+        ax.tick_params(labelsize=style.tick_fontsize)
+
+        # -------------------------------------------------
+        # Dezente Orientierung rechts (keine Legende!)
+        # -------------------------------------------------
+        ax.text(
+            0.8,
+            0.90,
+            rf"$H_0:\ p={model_null.p}$",
+            transform=ax.transAxes,
+            ha="left",
+            va="top",
+            fontsize=style.tick_fontsize,
+            color="gray",
+        )
+
+        self._alt_label = ax.text(
+            0.8,
+            0.84,
+            "",
+            transform=ax.transAxes,
+            ha="left",
+            va="top",
+            fontsize=style.tick_fontsize,
+            color="gray",
+        )
+
+        # Kein Titel, kein Subtitel, kein Textblock
+        # (Teil einer erklärenden Sequenz)
+
+    @staged("plot")
+    def update(self, model_alt) -> None:
+        """Neues H1-Modell: nur Balkenhöhen und Beschriftung."""
+        pmf_alt = np.asarray(model_alt.pmf(self.k), dtype=float)
+        set_bar_heights(
+            self._alt_bars,
+            self.k,
+            -pmf_alt,   # echte Spiegelung
+            self.style.bar_width,
+        )
+        self._alt_label.set_text(rf"$H_1:\ p={model_alt.p}$")
+
+    def save(self, path: str) -> None:
+        with stage("save"):
+            self.fig.savefig(path, bbox_inches="tight")
 
 
 def plot_spiegel_distribution(
@@ -24,107 +163,17 @@ def plot_spiegel_distribution(
       * grün: Masse von H1 in K (Power)
       * hellblau: restliche Masse
     - x-Achse ist Spiegelachse
-    """
-
-    fig, ax = plt.subplots(figsize=style.figsize)
-
-    # -------------------------------------------------
-    # x-Bereich: sigma-basiert (jetzt wirksam!)
-    # -------------------------------------------------
-    mu = model_null.n * model_null.p
-    sigma = (model_null.n * model_null.p * (1 - model_null.p)) ** 0.5
-
-    xmin = max(0, int(mu - style.sigma_range * sigma))
-    xmax = min(model_null.n, int(mu + style.sigma_range * sigma))
 
-    ax.set_xlim(xmin, xmax)
-
-    # -------------------------------------------------
-    # H0-Verteilung (oben, fix)
-    # -------------------------------------------------
-    for k in model_null.support:
-        if k < xmin or k > xmax:
-            continue
-
-        if k in rejection_region.K:
-            color = style.reject_color      # rot: Ablehnung unter H0
-        else:
-            color = style.model_color       # blau: akzeptiert
-
-        ax.bar(
-            k,
-            model_null.pmf(k),
-            width=style.bar_width,
-            color=color,
-            edgecolor="black",
-            linewidth=0.5,
-            zorder=2,
-        )
-
-    # -------------------------------------------------
-    # H1-Verteilung gespiegelt (unten, beweglich)
-    # -------------------------------------------------
-    for k in model_alt.support:
-        if k < xmin or k > xmax:
-            continue
-
-        if k in rejection_region.K:
-            color = style.power_pstar_color   # grün: Power-Masse
-        else:
-            color = "lightblue"               # nicht verworfen
-
-        ax.bar(
-            k,
-            -model_alt.pmf(k),   # echte Spiegelung
-            width=style.bar_width,
-            color=color,
-            edgecolor="black",
-            linewidth=0.3,
-            zorder=2,
-        )
-
-    # -------------------------------------------------
-    # Spiegelachse & y-Achse
-    # -------------------------------------------------
-    ax.axhline(0, color="black", linewidth=1)
-
-    ymax = max(model_null.pmf(k) for k in range(xmin, xmax + 1))
-    ax.set_ylim(-1.2 * ymax, 1.2 * ymax)
-
-    ax.set_xlabel(r"Anzahl der Erfolge $k$")
-    ax.set_ylabel(r"$P(X = k)$")
-
-    ax.tick_params(labelsize=style.tick_fontsize)
-
-    # -------------------------------------------------
-    # Dezente Orientierung rechts (keine Legende!)
-    # -------------------------------------------------
-    ax.text(
-        0.8,
-        0.90,
-        rf"$H_0:\ p={model_null.p}$",
-        transform=ax.transAxes,
-        ha="left",
-        va="top",
-        fontsize=style.tick_fontsize,
-        color="gray",
-    )
-
-    ax.text(
-        0.8,
-        0.84,
-        rf"$H_1:\ p={model_alt.p}$",
-        transform=ax.transAxes,
-        ha="left",
-        va="top",
-        fontsize=style.tick_fontsize,
-        color="gray",
+    Für Sequenzen mit fester Figur: SpiegelDistributionFrame.
+    """
+    frame = SpiegelDistributionFrame(
+        model_null=model_null,
+        rejection_region=rejection_region,
+        style=style,
     )
-
-    # Kein Titel, kein Subtitel, kein Textblock
-    # (Teil einer erklärenden Sequenz)
+    frame.update(model_alt)
 
     if save is not None:
-        fig.savefig(save, bbox_inches="tight")
+        frame.save(save)
 
-    return ax
+    return frame.ax
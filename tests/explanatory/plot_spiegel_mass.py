@@ -1,11 +1,17 @@
  # tests/explanatory/plot_spiegel_mass.py
 from __future__ import annotations
 
-import matplotlib.pyplot as plt
+from typing import TYPE_CHECKING
 
+from tests.explanatory.bars import bar_collection
 from tests.plots.plot_model import plot_binomial_model, ModelPlotStyle
+from tests.utils.profiling import stage, staged
 
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
 
+
+@staged("plot")
 def plot_spiegel_mass(
     *,
     model_alt,
@@ -20,6 +26,8 @@ def plot_spiegel_mass(
     Vorbereitung der Power-Idee.
     """
 
+    import matplotlib.pyplot as plt   # erst bei Bedarf (Importzeit)
+
     fig, ax = plt.subplots(figsize=style.figsize)
 
     plot_binomial_model(
@@ -28,16 +36,20 @@ def plot_spiegel_mass(
         ax=ax,
     )
 
-    # Masse in K hervorheben
-    for k in rejection_region.K:
-        ax.bar(
-            k,
-            model_alt.pmf(k),
-            width=style.bar_width,
-            color=style.power_pstar_color,
-        )
+    # Masse in K hervorheben (nur der sichtbare Teil, ein Artist)
+    k_lo, k_hi = (int(v) for v in ax.get_xlim())
+    k = rejection_region.K.clip(k_lo, k_hi).to_array()
+    bar_collection(
+        ax,
+        k,
+        model_alt.pmf(k),
+        width=style.bar_width,
+        color=style.power_pstar_color,
+        zorder=1,   # wie ax.bar: unter den pmf-Linien
+    )
 
     if save is not None:
-        fig.savefig(save, bbox_inches="tight")
+        with stage("save"):
+            fig.savefig(save, bbox_inches="tight")
 
     return ax
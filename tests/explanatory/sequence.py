@@ -1,18 +1,72 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from tests.explanatory.plot_spiegel_distribution import SpiegelDistributionFrame
+
+
 def explanatory_sequence(
     *,
     model_factory,
     model_null,
     p_values,
     rejection_region,
-    plot_fn,
+    plot_fn=None,
     style,
     save_pattern: str | None = None,
+    frame=None,
+    workers: int | None = 1,
 ):
     """
     Explanatory sequence:
     - model_null: fixes Nullmodell (H0)
     - model_factory: erzeugt alternative Modelle (H1)
+
+    Zwei Arten:
+    - plot_fn  : je p eine eigene Grafik (neue Figur je Bild)
+    - frame    : Bildklasse (z. B. SpiegelDistributionFrame);
+                 Figur und feste Artists (H0, K, Achsen) werden
+                 einmal angelegt, je p nur update(model_alt).
+                 Gleichbleibender Speicher, egal wie viele Bilder.
+                 Rückgabe: das Bildobjekt (zeigt das letzte Bild).
+
+    workers > 1 (oder None = os.cpu_count()): die Bilder werden
+    in einem Prozesspool mit dem Agg-Backend gerendert und nur als
+    nummerierte Dateien geschrieben (save_pattern nötig; Endung
+    .png/.pdf bestimmt das Format). Je Worker eine Figur bzw. ein
+    Bildobjekt. Rückgabe: None.
+    Unter der Startmethode "spawn" (Windows, macOS) müssen
+    model_factory und plot_fn picklebar sein (keine lambdas).
     """
+    if (plot_fn is None) == (frame is None):
+        raise ValueError("genau eines von plot_fn und frame angeben")
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers > 1:
+        if save_pattern is None:
+            raise ValueError("paralleles Rendern nur mit save_pattern")
+        _render_parallel(
+            list(enumerate(p_values)),
+            workers,
+            (model_factory, model_null, rejection_region,
+             plot_fn, frame, style, save_pattern),
+        )
+        return None
+
+    if frame is not None:
+        view = frame(
+            model_null=model_null,
+            rejection_region=rejection_region,
+            style=style,
+        )
+        for i, p in enumerate(p_values):
+            view.update(model_factory(p))
+            if save_pattern is not None:
+                view.save(save_pattern.format(i=i, p=p))
+        return view
+
     for i, p in enumerate(p_values):
         model_alt = model_factory(p)
 
@@ -27,3 +81,120 @@ def explanatory_sequence(
             style=style,
             save=save,
         )
+
+
+# ------------------------------------------------------------------
+# Paralleles Rendern (Agg, je Worker-Prozess eine Figur)
+# ------------------------------------------------------------------
+
+_job = None
+_view = None
+
+
+def _init_worker(job) -> None:
+    # Initialisierung je Worker: Agg-Backend, Bildobjekt einmal anlegen
+    global _job, _view
+    import matplotlib.pyplot as plt   # erst bei Bedarf (Importzeit)
+    plt.switch_backend("Agg")
+    _job = job
+    _, model_null, rejection_region, _, frame, style, _ = job
+    if frame is not None:
+        _view = frame(
+            model_null=model_null,
+            rejection_region=rejection_region,
+            style=style,
+        )
+
+
+def _render_frames(items) -> int:
+    import matplotlib.pyplot as plt
+    model_factory, model_null, rejection_region, plot_fn, _, style, save_pattern = _job
+    for i, p in items:
+        save = save_pattern.format(i=i, p=p)
+        if _view is not None:
+            _view.update(model_factory(p))
+            _view.save(save)
+        else:
+            ax = plot_fn(
+                model_alt=model_factory(p),
+                model_null=model_null,
+                rejection_region=rejection_region,
+                style=style,
+                save=save,
+            )
+            plt.close(ax.figure)
+    return len(items)
+
+
+def _render_parallel(items, workers: int, job) -> None:
+    # Bilder verschränkt auf Aufgaben verteilen (gleichmäßige Last)
+    n_tasks = min(len(items), 4 * workers)
+    tasks = [items[t::n_tasks] for t in range(n_tasks)]
+
+    # job geht über den Initializer an die Worker (unter "fork" ohne Pickeln)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(job,),
+    ) as pool:
+        for _ in pool.map(_render_frames, tasks):
+            pass
+
+
+# ------------------------------------------------------------------
+# Animation (GIF / MP4) über matplotlib.animation
+# ------------------------------------------------------------------
+
+def save_animation(
+    path: str,
+    *,
+    model_factory,
+    model_null,
+    p_values,
+    rejection_region,
+    style,
+    frame=SpiegelDistributionFrame,
+    fps: int = 10,
+    dpi: float = 100,
+):
+    """
+    Schreibt die Sequenz als eine Animationsdatei.
+
+    - .gif: PillowWriter
+    - .mp4: FFMpegWriter (ffmpeg muss installiert sein)
+
+    Eine Figur für alle Bilder (frame.update je p).
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib import animation
+
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".gif":
+        writer = animation.PillowWriter(fps=fps)
+    elif ext == ".mp4":
+        if not animation.writers.is_available("ffmpeg"):
+            raise ValueError("für .mp4 wird ffmpeg benötigt")
+        writer = animation.FFMpegWriter(fps=fps)
+    else:
+        raise ValueError("Animation nur als .gif oder .mp4")
+
+    view = frame(
+        model_null=model_null,
+        rejection_region=rejection_region,
+        style=style,
+    )
+
+    def draw(p):
+        view.update(model_factory(p))
+
+    anim = animation.FuncAnimation(
+        view.fig,
+        draw,
+        frames=list(p_values),
+        repeat=False,
+        cache_frame_data=False,
+    )
+    try:
+        anim.save(path, writer=writer, dpi=dpi)
+    finally:
+        plt.close(view.fig)
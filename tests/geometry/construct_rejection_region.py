@@ -1,15 +1,24 @@
 # tests/geometry/construct_rejection_region.py
 from __future__ import annotations
 
-from typing import Iterable, Set, Protocol
+import math
+from dataclasses import fields, is_dataclass
+from functools import wraps
+from typing import Callable, Iterable, Sequence, Protocol
 
-from .rejection_region import RejectionRegion
+from tests.utils.lru_cache import LRUCache
+from tests.utils.profiling import staged
+
+from .rejection_region import IntervalSet, RejectionRegion
 
 
 class DiscreteModel(Protocol):
     """
     Minimales Protokoll für diskrete Modelle,
     wie sie zur Konstruktion von Ablehnungsbereichen benötigt werden.
+
+    Die Ränder von K werden über Quantile gesucht (ppf/isf),
+    nicht durch Abwandern des Trägers.
     """
 
     @property
@@ -19,43 +28,169 @@ class DiscreteModel(Protocol):
     def pmf(self, x: int) -> float:
         ...
 
+    def cdf(self, x: int) -> float:
+        ...
+
+    def sf(self, x: int) -> float:
+        ...
+
+    def ppf(self, q: float) -> int:
+        ...
+
+    def isf(self, q: float) -> int:
+        ...
+
+
+# ---------------------------------------------------------------------
+# Cache: (Modellparameter, alpha, Setzung) -> Intervalle von K
+# ---------------------------------------------------------------------
+
+# Schlüssel sind Typ und Parameter des Modells, Werte nur die
+# Intervalle (IntervalSet): der Cache hält keine Modelle und damit
+# keine pmf-/Tabellen-Arrays am Leben, die MODEL_CACHE schon
+# verdrängt hat. Ein Eintrag ist klein, daher Begrenzung über die Anzahl.
+REGION_CACHE = LRUCache(max_entries=4096)
+
+# Tabellen kritischer Werte (tests.geometry.critical_values),
+# werden vor der exakten Konstruktion gefragt
+_TABLES: list = []
+
+
+def register_critical_value_table(table) -> None:
+    """
+    Tabelle für die Suche registrieren: Bereiche zu Schlüsseln
+    der Tabelle kommen dann aus ihr (O(1)), alle anderen
+    weiterhin aus der exakten Konstruktion.
+    """
+    _TABLES.append(table)
+
+
+def clear_critical_value_tables() -> None:
+    _TABLES.clear()
+
+
+def _construct(construct, model: DiscreteModel, alpha: float) -> RejectionRegion:
+    for table in _TABLES:
+        R = table.region(model, alpha, construct.__name__)
+        if R is not None:
+            return R
+    return construct(model, alpha)
+
+
+def _model_key(model: DiscreteModel) -> tuple | None:
+    # (Typ, Feldwerte) einer Dataclass, z. B. (BinomialModel, n, p, tol);
+    # None: kein Schlüssel möglich
+    if not is_dataclass(model):
+        return None
+    key = (type(model),) + tuple(getattr(model, f.name) for f in fields(model))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _cached(construct: Callable[[DiscreteModel, float], RejectionRegion]):
+    """
+    Merkt sich Ablehnungsbereiche je (Modellparameter, alpha, Setzung);
+    neue Bereiche zuerst aus registrierten Tabellen.
+
+    Gespeichert wird nur K; der Bereich wird mit dem
+    übergebenen Modell neu zusammengesetzt.
+
+    Modelle ohne Parameterschlüssel (keine Dataclass oder
+    nicht hashbare Felder, z. B. Listen-Träger) werden ohne
+    Cache konstruiert.
+    """
+    @wraps(construct)
+    @staged("geometry")
+    def wrapper(model: DiscreteModel, alpha: float) -> RejectionRegion:
+        model_key = _model_key(model)
+        if model_key is None:
+            return construct(model, alpha)
+        key = (model_key, float(alpha), construct.__name__)
+        K = REGION_CACHE.get_or_create(key, lambda: _construct(construct, model, alpha).K)
+        return RejectionRegion(model=model, K=K)
+
+    return wrapper
+
+
+# ---------------------------------------------------------------------
+# Kritische Werte (Quantilsuche)
+# ---------------------------------------------------------------------
+
+def _left_boundary(model: DiscreteModel, alpha: float) -> int:
+    """
+    Größtes l mit P(X <= l) <= alpha.
+
+    ppf liefert das kleinste x mit P(X <= x) > alpha;
+    l liegt direkt davor (oder ist der größte Trägerpunkt).
+    """
+    l = model.ppf(math.nextafter(alpha, math.inf))
+    if model.cdf(l) > alpha:
+        l -= 1
+    return l
+
+
+def _right_boundary(model: DiscreteModel, alpha: float) -> int:
+    """
+    Kleinstes r mit P(X >= r) <= alpha.
+
+    isf liefert das größte x mit P(X >= x) > alpha;
+    r liegt direkt dahinter (oder ist der kleinste Trägerpunkt).
+    """
+    r = model.isf(math.nextafter(alpha, math.inf))
+    if model.sf(r) > alpha:
+        r += 1
+    return r
+
+
+def _is_contiguous(support) -> bool:
+    # range(a, b) oder UnboundedRange(a): lückenlos, nie aufzählen
+    return getattr(support, "step", None) == 1 and hasattr(support, "start")
+
+
+def _sorted_support(model: DiscreteModel) -> Sequence[int]:
+    support = model.support
+    if _is_contiguous(support):
+        if support.stop == math.inf:
+            raise ValueError("Setzung braucht einen beschränkten Träger")
+        return support
+    return sorted(support)
+
+
+def _points_between(model: DiscreteModel, lo: int, hi: int) -> IntervalSet:
+    # {x ∈ support : lo <= x <= hi}; stop = inf gibt ein offenes Intervall
+    support = model.support
+    if _is_contiguous(support):
+        return IntervalSet([(max(lo, support.start), min(hi, support.stop - 1))])
+    return IntervalSet.from_points(x for x in support if lo <= x <= hi)
+
 
 # ---------------------------------------------------------------------
 # Einseitige Setzungen
 # ---------------------------------------------------------------------
 
+@_cached
 def left_tail(model: DiscreteModel, alpha: float) -> RejectionRegion:
     """
     Einseitige Setzung (links):
     K = {0, 1, 2, ...} mit P(X ∈ K) <= alpha.
     """
-    prob = 0.0
-    K: Set[int] = set()
-
-    for x in sorted(model.support):
-        p = model.pmf(x)
-        if prob + p > alpha:
-            break
-        K.add(x)
-        prob += p
+    l = _left_boundary(model, alpha)
+    K = _points_between(model, -math.inf, l)
 
     return RejectionRegion(model=model, K=K)
 
 
+@_cached
 def right_tail(model: DiscreteModel, alpha: float) -> RejectionRegion:
     """
     Einseitige Setzung (rechts):
     K = {..., k_max-1, k_max} mit P(X ∈ K) <= alpha.
     """
-    prob = 0.0
-    K: Set[int] = set()
-
-    for x in sorted(model.support, reverse=True):
-        p = model.pmf(x)
-        if prob + p > alpha:
-            break
-        K.add(x)
-        prob += p
+    r = _right_boundary(model, alpha)
+    K = _points_between(model, r, math.inf)
 
     return RejectionRegion(model=model, K=K)
 
@@ -64,6 +199,7 @@ def right_tail(model: DiscreteModel, alpha: float) -> RejectionRegion:
 # Zweiseitige Setzungen
 # ---------------------------------------------------------------------
 
+@_cached
 def two_sided_equal_tails(model: DiscreteModel, alpha: float) -> RejectionRegion:
     """
     Schul-Setzung (equal tails):
@@ -78,31 +214,18 @@ def two_sided_equal_tails(model: DiscreteModel, alpha: float) -> RejectionRegion
     alpha_half = alpha / 2
 
     # linker Rand
-    prob_left = 0.0
-    K_left: Set[int] = set()
-
-    for x in sorted(model.support):
-        p = model.pmf(x)
-        if prob_left + p > alpha_half:
-            break
-        K_left.add(x)
-        prob_left += p
+    l = _left_boundary(model, alpha_half)
+    K_left = _points_between(model, -math.inf, l)
 
     # rechter Rand
-    prob_right = 0.0
-    K_right: Set[int] = set()
-
-    for x in sorted(model.support, reverse=True):
-        p = model.pmf(x)
-        if prob_right + p > alpha_half:
-            break
-        K_right.add(x)
-        prob_right += p
+    r = _right_boundary(model, alpha_half)
+    K_right = _points_between(model, r, math.inf)
 
     K = K_left | K_right
     return RejectionRegion(model=model, K=K)
 
 
+@_cached
 def two_sided_symmetric(model: DiscreteModel, alpha: float) -> RejectionRegion:
     """
     Alternative Setzung (symmetrisch von außen):
@@ -114,31 +237,70 @@ def two_sided_symmetric(model: DiscreteModel, alpha: float) -> RejectionRegion:
     Diese Setzung ist:
     - symmetrisch gedacht,
     - aber NICHT identisch mit equal tails.
-    """
-    left = sorted(model.support)
-    right = list(reversed(left))
 
-    prob = 0.0
-    K: Set[int] = set()
-
-    i = 0
-    while i < len(left):
-        # linker Rand
-        p_left = model.pmf(left[i])
-        if prob + p_left <= alpha:
-            K.add(left[i])
-            prob += p_left
-        else:
-            break
+    Die Anzahl der Schritte wird binär gesucht:
+    nach j Schritten liegen ceil(j/2) Punkte links und
+    floor(j/2) Punkte rechts in K.
 
-        # rechter Rand
-        p_right = model.pmf(right[i])
-        if prob + p_right <= alpha:
-            K.add(right[i])
-            prob += p_right
+    Nur für beschränkte Träger: rechts außen muss es
+    einen letzten Punkt geben (sonst ValueError).
+    """
+    left = _sorted_support(model)
+    m = len(left)
+
+    def steps_mass(j: int) -> float:
+        # Masse nach j Schritten (aus den kumulierten Tabellen)
+        i_left = (j + 1) // 2
+        i_right = j // 2
+        mass = model.cdf(left[i_left - 1]) if i_left else 0.0
+        if i_right:
+            mass += model.sf(left[m - i_right])
+        return mass
+
+    # größtes j in [0, 2m] mit steps_mass(j) <= alpha
+    lo, hi = 0, 2 * m
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if steps_mass(mid) <= alpha:
+            lo = mid
         else:
-            break
-
-        i += 1
+            hi = mid - 1
+    j = lo
+
+    # Nahe an alpha entscheidet die Summationsreihenfolge:
+    # dann wie früher abwechselnd aufsummieren.
+    tol = 1e-12 * max(alpha, 1e-300)
+    near_tie = abs(steps_mass(j) - alpha) <= tol or (
+        j < 2 * m and abs(steps_mass(j + 1) - alpha) <= tol
+    )
+    if near_tie:
+        j = _symmetric_steps_sequential(model, left, alpha)
+
+    n_left = (j + 1) // 2
+    n_right = j // 2
+
+    K = IntervalSet()
+    if n_left:
+        K |= _points_between(model, left[0], left[n_left - 1])
+    if n_right:
+        K |= _points_between(model, left[m - n_right], left[m - 1])
 
     return RejectionRegion(model=model, K=K)
+
+
+def _symmetric_steps_sequential(
+    model: DiscreteModel,
+    left: Sequence[int],
+    alpha: float,
+) -> int:
+    # Anzahl der Schritte wie beim abwechselnden Aufsammeln
+    m = len(left)
+    prob = 0.0
+    for j in range(2 * m):
+        i = j // 2
+        x = left[i] if j % 2 == 0 else left[m - 1 - i]
+        p = model.pmf(x)
+        if prob + p > alpha:
+            return j
+        prob += p
+    return 2 * m
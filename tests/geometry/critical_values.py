@@ -0,0 +1,292 @@
+# tests/geometry/critical_values.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Iterable
+
+import numpy as np
+
+from tests.model.binomial import BinomialModel
+
+from .construct_rejection_region import left_tail, right_tail, two_sided_equal_tails
+from .rejection_region import IntervalSet, RejectionRegion
+
+
+# ---------------------------------------------------------------------
+# Binomial-Randmassen, vektorisiert (n, p0 und a dürfen Arrays sein)
+# ---------------------------------------------------------------------
+
+def binomial_cdf(k, n, p) -> np.ndarray:
+    # P(X <= k) = I_{1-p}(n-k, k+1)
+    from scipy.special import betainc   # erst bei Bedarf (Importzeit)
+    k = np.asarray(k, dtype=float)
+    n = np.asarray(n, dtype=float)
+    kc = np.clip(k, 0, np.maximum(n - 1, 0))
+    val = betainc(n - kc, kc + 1, 1.0 - np.asarray(p))
+    return np.where(k < 0, 0.0, np.where(k >= n, 1.0, val))
+
+
+def binomial_sf(k, n, p) -> np.ndarray:
+    # P(X >= k) = I_p(k, n-k+1)
+    from scipy.special import betainc
+    k = np.asarray(k, dtype=float)
+    n = np.asarray(n, dtype=float)
+    kc = np.clip(k, 1, n)
+    val = betainc(kc, n - kc + 1, p)
+    return np.where(k <= 0, 1.0, np.where(k > n, 0.0, val))
+
+
+def left_boundaries(n, p0, a) -> np.ndarray:
+    """
+    Größtes l mit P(X <= l) <= a, elementweise (l = -1: leerer linker Rand).
+
+    Startwert aus der Normalapproximation, danach
+    schrittweise korrigiert (meist 0–2 Schritte).
+    """
+    from scipy.special import ndtri
+    sigma = np.sqrt(n * p0 * (1 - p0))
+    with np.errstate(invalid="ignore"):
+        l = np.floor(n * p0 + sigma * ndtri(a) - 0.5)
+    l = np.clip(np.nan_to_num(l, nan=-1.0), -1, n)
+
+    while True:
+        high = (l >= 0) & (binomial_cdf(l, n, p0) > a)
+        if not high.any():
+            break
+        l = l - high
+    while True:
+        low = (l < n) & (binomial_cdf(l + 1, n, p0) <= a)
+        if not low.any():
+            break
+        l = l + low
+    return l
+
+
+def right_boundaries(n, p0, a) -> np.ndarray:
+    """
+    Kleinstes r mit P(X >= r) <= a, elementweise (r = n+1: leerer rechter Rand).
+    """
+    from scipy.special import ndtri
+    sigma = np.sqrt(n * p0 * (1 - p0))
+    with np.errstate(invalid="ignore"):
+        r = np.ceil(n * p0 - sigma * ndtri(a) + 0.5)
+    r = np.clip(np.nan_to_num(r, nan=n + 1.0), 0, n + 1)
+
+    while True:
+        low = (r <= n) & (binomial_sf(r, n, p0) > a)
+        if not low.any():
+            break
+        r = r + low
+    while True:
+        high = (r > 0) & (binomial_sf(r - 1, n, p0) <= a)
+        if not high.any():
+            break
+        r = r - high
+    return r
+
+
+# ---------------------------------------------------------------------
+# Tabelle kritischer Werte
+# ---------------------------------------------------------------------
+#
+#     table = build_critical_value_table(range(10, 5001), [0.3, 0.5], [0.01, 0.05])
+#     table.save("K.npz")
+#
+#     from tests.geometry.construct_rejection_region import register_critical_value_table
+#     register_critical_value_table(CriticalValueTable.load("K.npz"))
+#     two_sided_equal_tails(BinomialModel(n=1234, p=0.5), 0.05)   # aus der Tabelle
+
+# Randsetzungen: Setzung -> (linke, rechte) Randmasse als Anteil von alpha
+TAIL_CONSTRUCTIONS = {
+    "two_sided_equal_tails": (0.5, 0.5),
+    "left_tail": (1.0, 0.0),
+    "right_tail": (0.0, 1.0),
+}
+
+_EXACT = {
+    "two_sided_equal_tails": two_sided_equal_tails,
+    "left_tail": left_tail,
+    "right_tail": right_tail,
+}
+
+# relativer Abstand einer Randmasse zu a, ab dem exakt nachgerechnet wird
+# (betainc und die Modelltabellen runden verschieden)
+_TIE_TOL = 1e-9
+
+
+@dataclass(frozen=True)
+class CriticalValueTable:
+    """
+    Kritische Werte l, r von K = {0..l} ∪ {r..n} auf einem Gitter
+    (Setzung × n × p0 × alpha) für ganze Binomialmodelle.
+
+    - left[c, i, j, k]  : l  (-1: kein linker Rand)
+    - right[c, i, j, k] : r  (n+1: kein rechter Rand)
+
+    Abfrage über Schlüssel-Index in O(1); Gitterpunkte müssen
+    exakt getroffen werden (p0, alpha als float).
+    """
+    constructions: tuple[str, ...]
+    n_values: np.ndarray
+    p0_values: np.ndarray
+    alpha_values: np.ndarray
+    left: np.ndarray
+    right: np.ndarray
+
+    @cached_property
+    def _index(self) -> tuple[dict, dict, dict, dict]:
+        return (
+            {name: c for c, name in enumerate(self.constructions)},
+            {int(n): i for i, n in enumerate(self.n_values)},
+            {float(p): j for j, p in enumerate(self.p0_values)},
+            {float(a): k for k, a in enumerate(self.alpha_values)},
+        )
+
+    def lookup(self, construction: str, n: int, p0: float, alpha: float):
+        """(l, r) für den Schlüssel; None, falls nicht in der Tabelle."""
+        c_idx, n_idx, p_idx, a_idx = self._index
+        try:
+            key = (c_idx[construction], n_idx[int(n)], p_idx[float(p0)], a_idx[float(alpha)])
+        except KeyError:
+            return None
+        return int(self.left[key]), int(self.right[key])
+
+    def region(self, model, alpha: float, construction: str) -> RejectionRegion | None:
+        """
+        Ablehnungsbereich aus der Tabelle; None, wenn das Modell
+        kein ganzes Binomialmodell ist oder der Schlüssel fehlt.
+        """
+        if not isinstance(model, BinomialModel) or model.tol != 0:
+            return None
+        hit = self.lookup(construction, model.n, model.p, alpha)
+        if hit is None:
+            return None
+        l, r = hit
+        return RejectionRegion(model=model, K=IntervalSet([(0, l), (r, model.n)]))
+
+    @property
+    def nbytes(self) -> int:
+        return self.left.nbytes + self.right.nbytes
+
+    def save(self, path: str) -> None:
+        """Als .npz (unkomprimiert; Ganzzahlen so schmal wie möglich)."""
+        np.savez(
+            path,
+            constructions=np.array(self.constructions),
+            n_values=self.n_values,
+            p0_values=self.p0_values,
+            alpha_values=self.alpha_values,
+            left=self.left,
+            right=self.right,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "CriticalValueTable":
+        with np.load(path) as data:
+            return cls(
+                constructions=tuple(str(c) for c in data["constructions"]),
+                n_values=data["n_values"],
+                p0_values=data["p0_values"],
+                alpha_values=data["alpha_values"],
+                left=data["left"],
+                right=data["right"],
+            )
+
+
+def tail_boundaries(K: IntervalSet, n: int) -> tuple[int, int]:
+    """
+    Kritische Werte (l, r) eines Randbereichs K = {0..l} ∪ {r..n}
+    (l = -1 / r = n+1: kein linker / rechter Rand).
+    """
+    l, r = -1, n + 1
+    for lo, hi in K.intervals:
+        if lo == 0:
+            l = hi
+        if hi == n:
+            r = lo
+    return l, r
+
+
+def _exact_boundaries(construction: str, n: int, p0: float, alpha: float) -> tuple[int, int]:
+    # (l, r) aus der exakten Konstruktion
+    R = _EXACT[construction](BinomialModel(n=n, p=p0), alpha)
+    return tail_boundaries(R.K, n)
+
+
+def _near(mass: np.ndarray, a: np.ndarray) -> np.ndarray:
+    return np.abs(mass - a) <= _TIE_TOL * a
+
+
+def build_critical_value_table(
+    n_values: Iterable[int],
+    p0_values: Iterable[float],
+    alpha_values: Iterable[float],
+    constructions: Iterable[str] = tuple(TAIL_CONSTRUCTIONS),
+    *,
+    block: int = 256,
+) -> CriticalValueTable:
+    """
+    Kritische Werte für alle Kombinationen berechnen.
+
+    Quantilsuche vektorisiert über das ganze Gitter (je block Werte
+    von n auf einmal). Liegt eine Randmasse näher als _TIE_TOL an
+    ihrer Grenze, wird der Eintrag exakt über die Konstruktion
+    nachgerechnet: die Tabelle liefert dieselben Bereiche wie
+    two_sided_equal_tails, left_tail und right_tail.
+    """
+    constructions = tuple(constructions)
+    for name in constructions:
+        if name not in TAIL_CONSTRUCTIONS:
+            raise ValueError(f"Setzung {name!r} ist keine Randsetzung")
+    n_values = np.unique(np.asarray(list(n_values), dtype=np.int64))
+    p0_values = np.unique(np.asarray(list(p0_values), dtype=float))
+    alpha_values = np.unique(np.asarray(list(alpha_values), dtype=float))
+    if n_values.size == 0 or n_values[0] <= 0:
+        raise ValueError("n muss positiv sein")
+    if p0_values.size == 0 or not ((p0_values > 0) & (p0_values < 1)).all():
+        raise ValueError("p0 muss in (0,1) liegen")
+    if alpha_values.size == 0 or not ((alpha_values > 0) & (alpha_values < 1)).all():
+        raise ValueError("alpha muss in (0,1) liegen")
+
+    dtype = np.int32 if n_values[-1] < 2**31 - 1 else np.int64
+    shape = (len(constructions), len(n_values), len(p0_values), len(alpha_values))
+    left = np.empty(shape, dtype=dtype)
+    right = np.empty(shape, dtype=dtype)
+
+    P = p0_values[None, :, None]
+    for c, name in enumerate(constructions):
+        share_left, share_right = TAIL_CONSTRUCTIONS[name]
+        for start in range(0, len(n_values), block):
+            N = n_values[start:start + block, None, None].astype(float)
+            grid = np.broadcast_shapes(N.shape, P.shape, alpha_values.shape)
+            l = np.full(grid, -1.0)
+            r = np.broadcast_to(N + 1, grid)
+            tie = np.zeros(grid, dtype=bool)
+
+            if share_left:
+                a = share_left * alpha_values
+                l = left_boundaries(N, P, a)
+                tie |= _near(binomial_cdf(l, N, P), a) | _near(binomial_cdf(l + 1, N, P), a)
+            if share_right:
+                a = share_right * alpha_values
+                r = right_boundaries(N, P, a)
+                tie |= _near(binomial_sf(r, N, P), a) | _near(binomial_sf(r - 1, N, P), a)
+
+            l = l.astype(dtype)
+            r = r.astype(dtype)
+            for i, j, k in zip(*np.nonzero(tie)):
+                l[i, j, k], r[i, j, k] = _exact_boundaries(
+                    name, int(N[i, 0, 0]), float(p0_values[j]), float(alpha_values[k])
+                )
+            left[c, start:start + block] = l
+            right[c, start:start + block] = r
+
+    return CriticalValueTable(
+        constructions=constructions,
+        n_values=n_values,
+        p0_values=p0_values,
+        alpha_values=alpha_values,
+        left=left,
+        right=right,
+    )
@@ -1,8 +1,14 @@
 # tests/geometry/rejection_region.py
 from __future__ import annotations
 
+import itertools
+import math
+from bisect import bisect_right
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass
-from typing import Iterable, Set, Protocol
+from typing import Iterable, Iterator, Set, Tuple, Protocol
+
+import numpy as np
 
 
 class DiscreteModel(Protocol):
@@ -17,17 +23,196 @@ class DiscreteModel(Protocol):
     def pmf(self, x: int) -> float:
         ...
 
+    def cdf(self, x: int) -> float:
+        ...
+
+    def sf(self, x: int) -> float:
+        ...
+
+
+def _bound(b):
+    # obere Intervallgrenze: ganze Zahl oder math.inf (unbeschränkt)
+    return b if b == math.inf else int(b)
+
+
+class IntervalSet(AbstractSet):
+    """
+    Menge ganzer Zahlen als Vereinigung
+    disjunkter, abgeschlossener Intervalle [lo, hi].
+
+    Ablehnungsbereiche sind Randbereiche:
+    K = {0,...,l} ∪ {r,...,n} braucht nur zwei Intervalle,
+    egal wie groß n ist. Bei unbeschränktem Träger (Poisson)
+    ist hi = math.inf erlaubt: K = {0,...,l} ∪ {r, r+1, ...}.
+
+    Verhält sich wie eine (unveränderliche) Menge:
+    - x in K       : binäre Suche, O(log m) bei m Intervallen
+    - for x in K   : aufsteigend, ohne Zwischenspeicher
+                     (unbeschränkt: endlos)
+    - ==, <=, |, & : wie bei set
+    """
+
+    __slots__ = ("_lo", "_hi")
+
+    def __init__(self, intervals: Iterable[Tuple[int, int]] = ()):
+        lo: list[int] = []
+        hi: list[int] = []
+        for a, b in sorted((int(a), _bound(b)) for a, b in intervals if a <= b):
+            if hi and a <= hi[-1] + 1:
+                hi[-1] = max(hi[-1], b)
+            else:
+                lo.append(a)
+                hi.append(b)
+        self._lo = tuple(lo)
+        self._hi = tuple(hi)
+
+    @classmethod
+    def from_points(cls, points: Iterable[int]) -> "IntervalSet":
+        """Fasst beliebige ganze Zahlen zu Intervallen zusammen."""
+        x = np.unique(np.fromiter(points, dtype=np.int64))
+        if x.size == 0:
+            return cls()
+        breaks = np.flatnonzero(np.diff(x) != 1)
+        starts = np.concatenate(([x[0]], x[breaks + 1]))
+        ends = np.concatenate((x[breaks], [x[-1]]))
+        return cls(zip(starts.tolist(), ends.tolist()))
+
+    @classmethod
+    def _from_iterable(cls, it: Iterable[int]) -> "IntervalSet":
+        # Rückgabetyp der Mengen-Operationen aus AbstractSet
+        return cls.from_points(it)
+
+    @property
+    def intervals(self) -> Tuple[Tuple[int, int], ...]:
+        return tuple(zip(self._lo, self._hi))
+
+    def __contains__(self, x) -> bool:
+        try:
+            if int(x) != x:
+                return False
+        except (TypeError, ValueError, OverflowError):
+            return False
+        i = bisect_right(self._lo, x) - 1
+        return i >= 0 and x <= self._hi[i]
+
+    def contains_array(self, x) -> np.ndarray:
+        """
+        Vektorisierte Zugehörigkeit: Maske x ∈ K für ein ganzes Array.
+
+        Eine binäre Suche je Element über die Intervallanfänge.
+        """
+        x = np.asarray(x)
+        if not self._lo:
+            return np.zeros(x.shape, dtype=bool)
+        lo = np.asarray(self._lo)
+        hi = np.asarray(self._hi)
+        i = np.searchsorted(lo, x, side="right") - 1
+        inside = (i >= 0) & (x <= hi[np.maximum(i, 0)])
+        if x.dtype.kind == "f":
+            # inf/nan sind keine ganzen Zahlen (wie bei x in K)
+            inside &= np.isfinite(x) & (x == np.floor(x))
+        return inside
+
+    def clip(self, lo: int, hi: int) -> "IntervalSet":
+        """K ∩ {lo, ..., hi} (z. B. der sichtbare Bereich einer Grafik)."""
+        return IntervalSet(
+            (max(a, lo), min(b, hi)) for a, b in zip(self._lo, self._hi)
+        )
+
+    @property
+    def bounded(self) -> bool:
+        return not self._hi or self._hi[-1] != math.inf
+
+    def __iter__(self) -> Iterator[int]:
+        for a, b in zip(self._lo, self._hi):
+            if b == math.inf:
+                yield from itertools.count(a)
+            else:
+                yield from range(a, b + 1)
+
+    def __len__(self) -> int:
+        if not self.bounded:
+            raise OverflowError("unbeschränkte Menge hat keine endliche Länge")
+        return sum(b - a + 1 for a, b in zip(self._lo, self._hi))
+
+    def __bool__(self) -> bool:
+        return bool(self._lo)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, IntervalSet):
+            return self._lo == other._lo and self._hi == other._hi
+        return super().__eq__(other)
+
+    __hash__ = None
+
+    def __or__(self, other):
+        if isinstance(other, IntervalSet):
+            return IntervalSet(self.intervals + other.intervals)
+        return super().__or__(other)
+
+    __ror__ = __or__
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self.intervals)!r})"
+
+    def to_array(self) -> np.ndarray:
+        """Alle Elemente aufsteigend als NumPy-Array (nur beschränkt)."""
+        if not self.bounded:
+            raise OverflowError("unbeschränkte Menge: erst clip() anwenden")
+        if not self._lo:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate(
+            [np.arange(a, b + 1) for a, b in zip(self._lo, self._hi)]
+        )
+
+    def mass(self, model: DiscreteModel) -> float:
+        """
+        P(X ∈ K) unter model, je Intervall eine Differenz
+        kumulierter Massen (von der Seite mit der kleineren Restmasse).
+        """
+        total = 0.0
+        for a, b in zip(self._lo, self._hi):
+            below = model.cdf(a - 1)
+            above = model.sf(b + 1)
+            if below <= above:
+                total += model.cdf(b) - below
+            else:
+                total += model.sf(a) - above
+        return total
+
 
 @dataclass(frozen=True)
 class RejectionRegion:
     """
     Ablehnungsbereich K ⊂ support.
+
+    K wird intern als IntervalSet gehalten;
+    eine gewöhnliche Menge wird beim Anlegen umgewandelt.
     """
     model: DiscreteModel
     K: Set[int]
 
+    def __post_init__(self):
+        if not isinstance(self.K, IntervalSet):
+            object.__setattr__(self, "K", IntervalSet.from_points(self.K))
+
+    @property
+    def intervals(self) -> Tuple[Tuple[int, int], ...]:
+        return self.K.intervals
+
+    @property
+    def error_bound(self) -> float:
+        """
+        Schranke für den Fehler von probability()
+        (abgeschnittene Modelle: truncation_error, sonst 0).
+        """
+        return getattr(self.model, "truncation_error", 0.0)
+
     def probability(self) -> float:
-        return sum(self.model.pmf(x) for x in self.K)
+        return self.K.mass(self.model)
 
     def contains(self, x: int) -> bool:
         return x in self.K
+
+    def contains_array(self, x) -> np.ndarray:
+        return self.K.contains_array(x)
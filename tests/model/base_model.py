@@ -1,8 +1,58 @@
 # tests/model/base_model.py
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Callable, Iterable, Sequence, Protocol, runtime_checkable, Any
+import itertools
+import math
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Callable, Iterable, Iterator, Sequence, Protocol, runtime_checkable, Any
+
+import numpy as np
+
+from tests.utils.profiling import staged
+
+
+class UnboundedRange:
+    """
+    Träger {start, start+1, ...} ohne obere Grenze (z. B. Poisson).
+
+    Verhält sich wie range(start, ∞): start, stop (= inf), step,
+    x in S, S[i], Iteration (lazy). Nur len() gibt es nicht.
+    """
+
+    __slots__ = ("start",)
+
+    stop = math.inf
+    step = 1
+
+    def __init__(self, start: int = 0):
+        self.start = int(start)
+
+    def __contains__(self, x) -> bool:
+        try:
+            return int(x) == x and x >= self.start
+        except (TypeError, ValueError, OverflowError):
+            return False
+
+    def __getitem__(self, i: int) -> int:
+        if i < 0:
+            raise IndexError("unbeschränkter Träger: nur Indizes >= 0")
+        return self.start + int(i)
+
+    def __iter__(self) -> Iterator[int]:
+        return itertools.count(self.start)
+
+    def __len__(self) -> int:
+        raise OverflowError("unbeschränkter Träger hat keine Länge")
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, UnboundedRange) and other.start == self.start
+
+    def __hash__(self) -> int:
+        return hash((UnboundedRange, self.start))
+
+    def __repr__(self) -> str:
+        return f"UnboundedRange({self.start})"
 
 
 @runtime_checkable
@@ -31,6 +81,111 @@ class DiscreteModel(Protocol):
     def sf(self, x: int) -> float:
         ...
 
+    def ppf(self, q: float) -> int:
+        ...
+
+    def isf(self, q: float) -> int:
+        ...
+
+
+@dataclass(frozen=True)
+class CumulativeMass:
+    """
+    Tabelle der kumulierten Massen über einem sortierten Träger.
+
+    - lower[i]: P(X <= i-ter Trägerpunkt - 1), also lower[0] = 0
+    - upper[i]: P(X >= i-ter Trägerpunkt),     also upper[m] = 0
+
+    Die obere Tabelle wird von rechts aufsummiert (genaue rechte Ränder).
+
+    Ist der Träger ein lückenloser Bereich start, start+1, ...,
+    genügt ein Index (points=None), sonst binäre Suche in points.
+    """
+    lower: np.ndarray
+    upper: np.ndarray
+    start: int = 0
+    points: np.ndarray | None = None
+
+    @classmethod
+    def from_pmf(
+        cls,
+        pmf_values: np.ndarray,
+        *,
+        start: int = 0,
+        points: np.ndarray | None = None,
+    ) -> "CumulativeMass":
+        pmf_values = np.asarray(pmf_values, dtype=float)
+
+        lower = np.zeros(pmf_values.size + 1)
+        np.cumsum(pmf_values, out=lower[1:])
+
+        upper = np.zeros(pmf_values.size + 1)
+        np.cumsum(pmf_values[::-1], out=upper[-2::-1])
+
+        lower.setflags(write=False)
+        upper.setflags(write=False)
+        return cls(lower=lower, upper=upper, start=start, points=points)
+
+    @property
+    def size(self) -> int:
+        return self.lower.size - 1
+
+    def _count_le(self, x):
+        # Anzahl der Trägerpunkte <= x
+        if self.points is not None:
+            return np.searchsorted(self.points, x, side="right")
+        if np.ndim(x) == 0:
+            return min(max(int(np.floor(x)) - self.start + 1, 0), self.size)
+        return np.clip(np.floor(x).astype(np.int64) - self.start + 1, 0, self.size)
+
+    def _count_lt(self, x):
+        # Anzahl der Trägerpunkte < x
+        if self.points is not None:
+            return np.searchsorted(self.points, x, side="left")
+        if np.ndim(x) == 0:
+            return min(max(int(np.ceil(x)) - self.start, 0), self.size)
+        return np.clip(np.ceil(x).astype(np.int64) - self.start, 0, self.size)
+
+    def _point(self, i):
+        # i-ter Trägerpunkt
+        if self.points is not None:
+            return self.points[i] if np.ndim(i) else int(self.points[i])
+        return self.start + i if np.ndim(i) else self.start + int(i)
+
+    def cdf(self, x):
+        # P(X <= x)
+        if np.ndim(x) == 0:
+            return float(self.lower[self._count_le(x)])
+        return self.lower[self._count_le(np.asarray(x))]
+
+    def sf(self, x):
+        # P(X >= x)
+        if np.ndim(x) == 0:
+            return float(self.upper[self._count_lt(x)])
+        return self.upper[self._count_lt(np.asarray(x))]
+
+    def ppf(self, q):
+        """
+        Quantil: kleinstes x mit P(X <= x) >= q.
+
+        Binäre Suche in der unteren Tabelle, O(log n).
+        Ist q größer als die (gerundete) Gesamtmasse,
+        wird der größte Trägerpunkt geliefert.
+        """
+        i = np.searchsorted(self.lower[1:], q, side="left")
+        return self._point(np.minimum(i, self.size - 1))
+
+    def isf(self, q):
+        """
+        Spiegelbild zu ppf: größtes x mit P(X >= x) >= q.
+
+        Binäre Suche in der oberen Tabelle, O(log n).
+        Ist q größer als die (gerundete) Gesamtmasse,
+        wird der kleinste Trägerpunkt geliefert.
+        """
+        below = np.searchsorted(self.upper[-2::-1], q, side="left")
+        return self._point(np.maximum(self.size - 1 - below, 0))
+
 
 @dataclass(frozen=True)
 class FiniteDiscreteModel:
@@ -40,29 +195,60 @@ class FiniteDiscreteModel:
     Du gibst:
     - support: Liste der möglichen Werte
     - pmf_fn : Funktion x -> P(X=x)
+    - optional pmf_values: bereits berechnete P(X=x) in Reihenfolge des supports
+    - optional cumulative_mass: bereits berechnete Tabelle (z. B. aus einem Cache)
 
     Vorteil:
     - sehr ehrlich: Modell ist explizit ein Objekt, nicht nur 'n und p'
     - super für Unterricht/Didaktik: alles sichtbar
+
+    cdf/sf lesen aus einer beim ersten Aufruf aufgebauten
+    Tabelle kumulierter Massen (danach O(1) bzw. O(log n)).
+    Beide akzeptieren auch Arrays von Stellen.
+    ppf/isf (Quantile) suchen binär in derselben Tabelle.
     """
     support: Sequence[int]
     pmf_fn: Callable[[int], float]
+    pmf_values: np.ndarray | None = field(default=None, compare=False, repr=False)
+    cumulative_mass: CumulativeMass | None = field(default=None, compare=False, repr=False)
 
     def pmf(self, x: int) -> float:
         return float(self.pmf_fn(x))
 
-    def cdf(self, x: int) -> float:
+    @cached_property
+    @staged("model")
+    def cumulative(self) -> CumulativeMass:
+        if self.cumulative_mass is not None:
+            return self.cumulative_mass
+
+        support = self.support
+
+        if isinstance(support, range) and support.step == 1:
+            values = self.pmf_values
+            if values is None:
+                values = np.array([self.pmf(x) for x in support], dtype=float)
+            return CumulativeMass.from_pmf(values, start=support.start)
+
+        points = np.asarray(support)
+        if self.pmf_values is not None:
+            values = np.asarray(self.pmf_values, dtype=float)
+        else:
+            values = np.array([self.pmf(x) for x in support], dtype=float)
+        order = np.argsort(points, kind="stable")
+        return CumulativeMass.from_pmf(values[order], points=points[order])
+
+    def cdf(self, x):
         # P(X <= x)
-        s = 0.0
-        for xi in self.support:
-            if xi <= x:
-                s += self.pmf(xi)
-        return float(s)
+        return self.cumulative.cdf(x)
 
-    def sf(self, x: int) -> float:
+    def sf(self, x):
         # P(X >= x)
-        s = 0.0
-        for xi in self.support:
-            if xi >= x:
-                s += self.pmf(xi)
-        return float(s)
+        return self.cumulative.sf(x)
+
+    def ppf(self, q):
+        # kleinstes x mit P(X <= x) >= q
+        return self.cumulative.ppf(q)
+
+    def isf(self, q):
+        # größtes x mit P(X >= x) >= q
+        return self.cumulative.isf(q)
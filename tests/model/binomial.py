@@ -1,10 +1,104 @@
 # tests/model/binomial.py
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
-from math import comb
+from functools import cached_property
+
+import numpy as np
+
+from tests.utils.disk_cache import DiskCache
+from tests.utils.lru_cache import LRUCache
+from tests.utils.profiling import staged
+
+from .base_model import CumulativeMass, FiniteDiscreteModel
+from .pmf_engine import ENGINE_ID, binomial_log_pmf, binomial_pmf_array, binomial_pmf_stream
+from .truncation import chernoff_window
+
+
+def _pmf_window(n: int, p: float, window: range) -> np.ndarray:
+    # pmf nur auf dem Fenster (ganzer Träger: window = range(n+1))
+    if len(window) == n + 1:
+        return binomial_pmf_array(n, p)
+    pmf_values = np.exp(binomial_log_pmf(np.arange(window.start, window.stop), n, p))
+    pmf_values.setflags(write=False)
+    return pmf_values
+
+
+def _finite_model(
+    window: range,
+    pmf_values: np.ndarray,
+    cumulative_mass: CumulativeMass | None = None,
+) -> FiniteDiscreteModel:
+    lo, hi = window.start, window.stop - 1
+
+    def pmf_fn(k: int) -> float:
+        if k < lo or k > hi:
+            return 0.0
+        return pmf_values[k - lo]
+
+    return FiniteDiscreteModel(
+        support=window,
+        pmf_fn=pmf_fn,
+        pmf_values=pmf_values,
+        cumulative_mass=cumulative_mass,
+    )
+
+
+def _disk_key(n: int, p: float, tol: float) -> str:
+    # exakt (float.hex) und mit Rechenweg: alte Einträge passen nie
+    return f"binom-{ENGINE_ID}-n{n}-p{float(p).hex()}-tol{float(tol).hex()}"
+
+
+@staged("model")
+def _build_model(n: int, p: float, tol: float, window: range) -> FiniteDiscreteModel:
+    disk = DISK_CACHE
+    m = len(window)
+    if disk is None or 8 * (3 * m + 2) < disk.min_bytes:
+        return _finite_model(window, _pmf_window(n, p, window))
+
+    # Plattencache: [pmf (m) | lower (m+1) | upper (m+1)] in einer Datei,
+    # als memmap geöffnet; die drei Tabellen sind Sichten darauf
+    key = _disk_key(n, p, tol)
+    packed = disk.get(key)
+    if packed is not None and packed.shape == (3 * m + 2,):
+        cumulative = CumulativeMass(
+            lower=packed[m:2 * m + 1],
+            upper=packed[2 * m + 1:],
+            start=window.start,
+        )
+        return _finite_model(window, packed[:m], cumulative)
+
+    model = _finite_model(window, _pmf_window(n, p, window))
+    cumulative = model.cumulative
+    disk.put(key, np.concatenate([model.pmf_values, cumulative.lower, cumulative.upper]))
+    return model
+
+
+def _model_nbytes(model: FiniteDiscreteModel) -> int:
+    # pmf + untere und obere kumulierte Tabelle
+    return 3 * 8 * (len(model.support) + 1)
+
+
+# Gleiche (n, p, tol) teilen sich Array und Tabellen.
+# Budget anpassen: MODEL_CACHE.resize(max_bytes=...)
+MODEL_CACHE = LRUCache(max_bytes=256 * 2**20, sizeof=_model_nbytes)
 
-from .base_model import FiniteDiscreteModel
+# Plattencache für pmf/cdf/sf (aus: None), geteilt zwischen Prozessen
+# und Sitzungen; wird nach MODEL_CACHE gefragt.
+# Einschalten: set_disk_cache(DiskCache("pfad"))
+# oder Umgebungsvariable HYPOTHESENTESTS_CACHE_DIR=pfad
+DISK_CACHE: DiskCache | None = (
+    DiskCache(os.environ["HYPOTHESENTESTS_CACHE_DIR"])
+    if os.environ.get("HYPOTHESENTESTS_CACHE_DIR")
+    else None
+)
+
+
+def set_disk_cache(cache: DiskCache | None) -> None:
+    """Plattencache setzen (None: aus)."""
+    global DISK_CACHE
+    DISK_CACHE = cache
 
 
 @dataclass(frozen=True)
@@ -16,42 +110,121 @@ class BinomialModel:
     - kennt n und p
     - erzeugt daraus ein diskretes Modell (support + pmf)
 
+    Die Wahrscheinlichkeitsfunktion wird beim ersten Gebrauch einmal
+    vollständig als Array berechnet (siehe pmf_engine) und am Modell
+    gehalten. Modelle mit gleichem (n, p) teilen sich diese Daten
+    (MODEL_CACHE), mit Plattencache auch prozessübergreifend
+    (DISK_CACHE). stream_pmf kommt ohne das Array aus.
+
+    Abgeschnittener Modus (tol > 0):
+    pmf, cdf und sf werden nur auf einem Fenster um np berechnet,
+    außerhalb dessen nachweislich höchstens tol Masse liegt
+    (Chernoff-Schranke, siehe truncation). Der Träger bleibt 0..n;
+    außerhalb des Fensters gilt pmf = 0.
+    truncation_error ist die zertifizierte Schranke für die
+    weggelassene Masse; um höchstens so viel weichen cdf, sf,
+    Randmassen von K, p-Werte und Power vom exakten Wert ab.
+
     Keine Testlogik.
     """
 
     n: int
     p: float
+    tol: float = 0.0
 
     def __post_init__(self):
         if not (0 <= self.p <= 1):
             raise ValueError("p muss in [0,1] liegen")
         if self.n <= 0:
             raise ValueError("n muss positiv sein")
+        if not (0 <= self.tol < 1):
+            raise ValueError("tol muss in [0,1) liegen")
+
+    @cached_property
+    def _window(self) -> tuple[range, float]:
+        if self.tol == 0:
+            return range(self.n + 1), 0.0
+        lo, hi, bound = chernoff_window(self.n, self.p, self.tol)
+        return range(lo, hi + 1), bound
+
+    @cached_property
+    def _model(self) -> FiniteDiscreteModel:
+        # erst beim ersten Zugriff auf pmf/cdf/sf/... aufgebaut
+        return MODEL_CACHE.get_or_create(
+            (self.n, float(self.p), float(self.tol)),
+            lambda: _build_model(self.n, self.p, self.tol, self.window),
+        )
 
-        support = list(range(self.n + 1))
+    @property
+    def window(self) -> range:
+        """Bereich, auf dem die pmf tatsächlich berechnet wird."""
+        return self._window[0]
 
-        def pmf_fn(k: int) -> float:
-            if k < 0 or k > self.n:
-                return 0.0
-            return comb(self.n, k) * (self.p ** k) * ((1 - self.p) ** (self.n - k))
+    @property
+    def truncation_error(self) -> float:
+        """Zertifizierte Schranke für die Masse außerhalb von window."""
+        return self._window[1]
 
-        object.__setattr__(
-            self,
-            "_model",
-            FiniteDiscreteModel(support=support, pmf_fn=pmf_fn),
-        )
+    @property
+    def mean(self) -> float:
+        # exakt n·p; liegt 2·n·p auf k + 1/2, spiegelt p_value._center
+        # nicht damit, sondern mit der Summe Σ x · P(X = x) wie bisher
+        return self.n * self.p
 
     # ---- Weitergabe der Modell-Schnittstelle ----
 
     @property
     def support(self):
-        return self._model.support
+        return range(self.n + 1)
+
+    @property
+    def pmf_values(self) -> np.ndarray:
+        """P(X = k) für k in window (schreibgeschützt)."""
+        return self._model.pmf_values
+
+    def pmf(self, k):
+        if isinstance(k, (int, float, np.number)):
+            return self._model.pmf(k)
+        # vektorisiert: direkt aus dem Array, 0 außerhalb des Fensters
+        k = np.asarray(k)
+        values = self.pmf_values
+        i = k - self.window.start
+        inside = (i >= 0) & (i < values.size) & (k == np.floor(k))
+        return np.where(inside, values[np.clip(i, 0, values.size - 1).astype(np.intp)], 0.0)
 
-    def pmf(self, k: int) -> float:
-        return self._model.pmf(k)
+    @property
+    def cumulative(self):
+        """Tabelle der kumulierten Massen (siehe CumulativeMass)."""
+        return self._model.cumulative
 
-    def cdf(self, k: int) -> float:
+    def cdf(self, k):
         return self._model.cdf(k)
 
-    def sf(self, k: int) -> float:
+    def sf(self, k):
         return self._model.sf(k)
+
+    def ppf(self, q):
+        return self._model.ppf(q)
+
+    def isf(self, q):
+        return self._model.isf(q)
+
+    def stream_pmf(self, start: str = "mode", *, mass: float | None = None):
+        """
+        Paare (k, P(X = k)) nacheinander über die Quotientenrekursion,
+        ohne das pmf-Array aufzubauen (siehe binomial_pmf_stream).
+        """
+        return binomial_pmf_stream(self.n, self.p, start, mass=mass)
+
+
+def transient_model(n: int, p: float, tol: float = 0.0) -> BinomialModel:
+    """
+    BinomialModel zum einmaligen Gebrauch (z. B. je n eines Durchlaufs):
+    die Tabellen hängen nur am Modell, nicht in MODEL_CACHE oder
+    DISK_CACHE. Verdrängt dort nichts und wird mit dem Modell frei.
+    """
+    model = BinomialModel(n=n, p=p, tol=tol)
+    window = model.window
+    # belegt die cached_property _model vorab
+    model.__dict__["_model"] = _finite_model(window, _pmf_window(n, p, window))
+    return model
@@ -0,0 +1,148 @@
+# tests/model/normal.py
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+
+# Berry-Esseen-Konstante (Shevtsova 2011):
+# sup_x |P(S_n <= x) - Φ((x-μ)/σ)| <= C · ρ / (σ_1³ √n)
+BERRY_ESSEEN_C = 0.4748
+
+
+@dataclass(frozen=True)
+class NormalApproxModel:
+    """
+    Normalapproximation des Binomialmodells X ~ Bin(n, p)
+    mit Stetigkeitskorrektur:
+
+        P(X <= k) ≈ Φ((k + 1/2 - μ) / σ),   μ = np, σ = sqrt(npq)
+
+    Erfüllt das Modellprotokoll (support, pmf, cdf, sf, ppf, isf);
+    jede Abfrage kostet O(1), unabhängig von n.
+    Der Träger ist ein range-Objekt und wird nie aufgebaut.
+
+    error_bound gibt an, wie weit cdf/sf höchstens vom
+    exakten Binomialmodell abweichen (Berry-Esseen).
+
+    Keine Testlogik.
+    """
+
+    n: int
+    p: float
+
+    def __post_init__(self):
+        if not (0 < self.p < 1):
+            raise ValueError("p muss in (0,1) liegen")
+        if self.n <= 0:
+            raise ValueError("n muss positiv sein")
+
+    # ---- Kennzahlen ----
+
+    @property
+    def support(self):
+        return range(self.n + 1)
+
+    @property
+    def mean(self) -> float:
+        return self.n * self.p
+
+    @property
+    def sigma(self) -> float:
+        return math.sqrt(self.n * self.p * (1 - self.p))
+
+    @property
+    def mode(self) -> int:
+        # pmf = Masse von [k - 1/2, k + 1/2] unter der Normaldichte:
+        # größter Wert beim ganzzahligen k nächst μ, nach außen fallend
+        return min(max(math.floor(self.mean + 0.5), 0), self.n)
+
+    @property
+    def error_bound(self) -> float:
+        """
+        Schranke für |cdf - cdf_exakt| und |sf - sf_exakt|
+        (Berry-Esseen für Bernoulli-Summen):
+
+            C · (p² + q²) / sqrt(npq)
+
+        Für pmf, Randmassen von K und p-Werte höchstens das Doppelte.
+        """
+        q = 1 - self.p
+        return BERRY_ESSEEN_C * (self.p ** 2 + q ** 2) / self.sigma
+
+    # ---- Modell-Schnittstelle ----
+
+    def _z(self, x):
+        return (x - self.mean) / self.sigma
+
+    def pmf(self, k):
+        # P(X = k) ≈ Φ(z(k + 1/2)) - Φ(z(k - 1/2))
+        from scipy.special import ndtr   # erst bei Bedarf (Importzeit)
+        k_arr = np.asarray(k, dtype=float)
+        inside = (k_arr >= 0) & (k_arr <= self.n) & (k_arr == np.floor(k_arr))
+        mass = np.where(
+            inside,
+            ndtr(self._z(k_arr + 0.5)) - ndtr(self._z(k_arr - 0.5)),
+            0.0,
+        )
+        return float(mass) if np.ndim(k) == 0 else mass
+
+    def cdf(self, k):
+        # P(X <= k) ≈ Φ(z(floor(k) + 1/2))
+        from scipy.special import ndtr
+        k_arr = np.floor(np.asarray(k, dtype=float))
+        mass = ndtr(self._z(k_arr + 0.5))
+        mass = np.where(k_arr < 0, 0.0, np.where(k_arr >= self.n, 1.0, mass))
+        return float(mass) if np.ndim(k) == 0 else mass
+
+    def sf(self, k):
+        # P(X >= k) ≈ 1 - Φ(z(ceil(k) - 1/2)), als Φ(-z) (genaue rechte Ränder)
+        from scipy.special import ndtr
+        k_arr = np.ceil(np.asarray(k, dtype=float))
+        mass = ndtr(-self._z(k_arr - 0.5))
+        mass = np.where(k_arr <= 0, 1.0, np.where(k_arr > self.n, 0.0, mass))
+        return float(mass) if np.ndim(k) == 0 else mass
+
+    def ppf(self, q: float) -> int:
+        """
+        Kleinstes k mit P(X <= k) >= q, geschlossen:
+
+            k = ceil(μ + σ Φ⁻¹(q) - 1/2)
+
+        (Rundung am Rand mit einem cdf-Vergleich nachgezogen).
+        """
+        from scipy.special import ndtri
+        if q <= 0:
+            return 0
+        if q >= 1:
+            return self.n
+        k = math.ceil(self.mean + self.sigma * float(ndtri(q)) - 0.5)
+        k = min(max(k, 0), self.n)
+        while k > 0 and self.cdf(k - 1) >= q:
+            k -= 1
+        while k < self.n and self.cdf(k) < q:
+            k += 1
+        return k
+
+    def isf(self, q: float) -> int:
+        """
+        Größtes k mit P(X >= k) >= q, geschlossen:
+
+            k = floor(μ + 1/2 - σ Φ⁻¹(q))
+
+        (Rundung am Rand mit einem sf-Vergleich nachgezogen).
+        """
+        from scipy.special import ndtri
+        if q <= 0:
+            return self.n
+        if q >= 1:
+            return 0
+        k = math.floor(self.mean + 0.5 - self.sigma * float(ndtri(q)))
+        k = min(max(k, 0), self.n)
+        while k < self.n and self.sf(k + 1) >= q:
+            k += 1
+        while k > 0 and self.sf(k) < q:
+            k -= 1
+        return k
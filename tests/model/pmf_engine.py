@@ -0,0 +1,292 @@
+# tests/model/pmf_engine.py
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+
+# ------------------------------------------------------------------
+# Rechenkern: ganze Wahrscheinlichkeitsfunktion als NumPy-Array
+# ------------------------------------------------------------------
+#
+# Für kleine n wird exakt wie bisher über math.comb gerechnet
+# (bitgleiche Werte, damit Ablehnungsbereiche unverändert bleiben).
+#
+# Für große n läuft ab etwa n = 1030 comb(n, k) als float über.
+# Dort wird im Log-Raum gerechnet (Sattelpunkt-Darstellung nach
+# C. Loader, "Fast and Accurate Computation of Binomial Probabilities",
+# 2000). Die Formel vermeidet die Auslöschung von
+# lgamma(n+1) - lgamma(k+1) - lgamma(n-k+1) und bleibt auch bei
+# n = 10^8 auf wenige Rundungsfehler genau.
+
+EXACT_MAX_N = 1000
+
+# Kennung des Rechenwegs (Schlüssel im Plattencache);
+# bei jeder Änderung an den Werten erhöhen
+ENGINE_ID = "comb1000-loader-1"
+
+_LN_2PI = math.log(2.0 * math.pi)
+_LN_SQRT_2PI = 0.5 * _LN_2PI
+
+# Stirling-Reihe: lgamma(x+1) - [(x+1/2) log x - x + log sqrt(2π)]
+_S0 = 1.0 / 12.0
+_S1 = 1.0 / 360.0
+_S2 = 1.0 / 1260.0
+_S3 = 1.0 / 1680.0
+_S4 = 1.0 / 1188.0
+
+_STIRLERR_TABLE_MAX = 15
+_STIRLERR_TABLE = np.array(
+    [0.0]
+    + [
+        math.lgamma(x + 1.0) - (x + 0.5) * math.log(x) + x - _LN_SQRT_2PI
+        for x in range(1, _STIRLERR_TABLE_MAX + 1)
+    ]
+)
+
+
+def stirlerr(x) -> np.ndarray:
+    """
+    Fehler der Stirling-Formel:
+
+        δ(x) = log(x!) - [(x + 1/2) log x - x + log sqrt(2π)]
+
+    für ganzzahlige x >= 0 (vektorisiert).
+    """
+    x = np.asarray(x, dtype=float)
+    out = np.empty_like(x)
+
+    small = x <= _STIRLERR_TABLE_MAX
+    out[small] = _STIRLERR_TABLE[x[small].astype(np.intp)]
+
+    big = ~small
+    xb = x[big]
+    xx = xb * xb
+    out[big] = (_S0 - (_S1 - (_S2 - (_S3 - _S4 / xx) / xx) / xx) / xx) / xb
+    return out
+
+
+def bd0(x, np_) -> np.ndarray:
+    """
+    Abweichungsterm (deviance):
+
+        bd0(x, m) = x log(x/m) + m - x
+
+    numerisch stabil auch für x ≈ m (vektorisiert).
+    """
+    x, m = np.broadcast_arrays(
+        np.asarray(x, dtype=float),
+        np.asarray(np_, dtype=float),
+    )
+    out = np.empty(x.shape)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        near = np.abs(x - m) < 0.1 * (x + m)
+
+        far = ~near
+        out[far] = x[far] * np.log(x[far] / m[far]) + m[far] - x[far]
+
+        # Reihenentwicklung in v = (x - m) / (x + m), |v| < 0.1
+        xn = x[near]
+        mn = m[near]
+        v = (xn - mn) / (xn + mn)
+        s = (xn - mn) * v
+        ej = 2.0 * xn * v
+        v2 = v * v
+        j = 1
+        while s.size:
+            ej = ej * v2
+            s_new = s + ej / (2 * j + 1)
+            if np.array_equal(s_new, s):
+                break
+            s = s_new
+            j += 1
+        out[near] = s
+
+    return out
+
+
+def binomial_log_pmf(k, n: int, p: float) -> np.ndarray:
+    """
+    log P(X = k) für X ~ Bin(n, p) an beliebigen Stellen k (vektorisiert).
+
+    Sattelpunkt-Darstellung (Loader):
+
+        log P(X=k) = δ(n) - δ(k) - δ(n-k)
+                     - bd0(k, np) - bd0(n-k, nq)
+                     - 1/2 log(2π k (n-k) / n)
+
+    Randwerte k = 0 und k = n separat, außerhalb von 0..n: -inf.
+    """
+    q = 1.0 - p
+    k = np.asarray(k, dtype=float)
+    out = np.full(k.shape, -np.inf)
+
+    if p == 0.0 or q == 0.0:
+        out[k == (0 if p == 0.0 else n)] = 0.0
+        return out
+
+    # Randwerte
+    out[k == 0] = -bd0(n, n * q)[()] - n * p if p < 0.1 else n * math.log(q)
+    out[k == n] = -bd0(n, n * p)[()] - n * q if q < 0.1 else n * math.log(p)
+
+    inner = (k > 0) & (k < n)
+    if inner.any():
+        ki = k[inner]
+        lc = (
+            stirlerr(n)[()]
+            - stirlerr(ki)
+            - stirlerr(n - ki)
+            - bd0(ki, n * p)
+            - bd0(n - ki, n * q)
+        )
+        lf = _LN_2PI + np.log(ki) + np.log1p(-ki / n)
+        out[inner] = lc - 0.5 * lf
+
+    return out
+
+
+def binomial_log_pmf_array(n: int, p: float) -> np.ndarray:
+    """
+    log P(X = k) für X ~ Bin(n, p) und alle k = 0, ..., n.
+    """
+    return binomial_log_pmf(np.arange(n + 1), n, p)
+
+
+def _comb_row(n: int):
+    # comb(n, 0), ..., comb(n, n) exakt über c_{k+1} = c_k (n-k) / (k+1)
+    c = 1
+    for k in range(n + 1):
+        yield c
+        c = c * (n - k) // (k + 1)
+
+
+def binomial_pmf_array(n: int, p: float) -> np.ndarray:
+    """
+    P(X = k) für X ~ Bin(n, p) und alle k = 0, ..., n als ein Array.
+
+    - n <= EXACT_MAX_N: exakt wie bisher, comb(n, k) * p^k * (1-p)^(n-k)
+                        (Binomialkoeffizienten ganzzahlig über die Zeile)
+    - sonst:            Log-Raum (Sattelpunkt), dann exp
+
+    Das Array ist schreibgeschützt (gehört dem Modell).
+    """
+    if n <= EXACT_MAX_N:
+        q = 1 - p
+        pmf = np.array(
+            [c * (p ** k) * (q ** (n - k)) for k, c in enumerate(_comb_row(n))],
+            dtype=float,
+        )
+    else:
+        pmf = np.exp(binomial_log_pmf_array(n, p))
+
+    pmf.setflags(write=False)
+    return pmf
+
+
+# ------------------------------------------------------------------
+# Strom: pmf-Werte nacheinander über die Quotientenrekursion
+# ------------------------------------------------------------------
+#
+#     P(X = k+1) = P(X = k) · (n-k)/(k+1) · p/(1-p)
+#
+# Jeder Schritt O(1), keine großen Ganzzahlen, kein Array über den Träger.
+# Solange ein Wert unterhalb des float-Bereichs läge, wird die Rekursion
+# im Log-Raum geführt, danach (neu verankert) multiplikativ.
+
+_TINY = 1e-290
+
+
+def _walk(n: int, p: float, k: int, log_v: float, step: int):
+    # (k, P(X=k)) ab k in Richtung step = +1 / -1
+    q = 1.0 - p
+    log_odds = math.log(p / q) if step > 0 else math.log(q / p)
+    odds = math.exp(log_odds)
+
+    v = math.exp(log_v)
+    in_log = v < _TINY
+    while True:
+        yield k, v
+        if (step > 0 and k >= n) or (step < 0 and k <= 0):
+            return
+        ratio_num, ratio_den = (n - k, k + 1) if step > 0 else (k, n - k + 1)
+        if in_log:
+            log_v += math.log(ratio_num) - math.log(ratio_den) + log_odds
+            v = math.exp(log_v)
+            if v >= _TINY:
+                # Übergang: neu verankern, damit sich der Log-Drift nicht fortsetzt
+                v = math.exp(float(binomial_log_pmf(k + step, n, p)))
+                in_log = False
+        else:
+            v *= ratio_num / ratio_den * odds
+        k += step
+
+
+def binomial_pmf_stream(
+    n: int,
+    p: float,
+    start: str = "mode",
+    *,
+    mass: float | None = None,
+):
+    """
+    Liefert Paare (k, P(X = k)) für X ~ Bin(n, p) nacheinander.
+
+    start:
+    - "mode" : beim Modus beginnen, dann nach außen; es folgt jeweils
+               der größere der beiden Nachbarn (absteigende Werte)
+    - "left" : k = 0, 1, 2, ...
+    - "right": k = n, n-1, n-2, ...
+
+    mass: Abbruch, sobald die aufsummierte Masse >= mass ist
+    (der Wert, der die Schwelle überschreitet, wird noch geliefert).
+
+    Die Werte stammen aus der Rekursion (relativer Fehler
+    wächst höchstens linear mit der Schrittzahl).
+    """
+    if start not in ("mode", "left", "right"):
+        raise ValueError("start muss 'mode', 'left' oder 'right' sein")
+
+    if p == 0.0 or p == 1.0:
+        atom = 0 if p == 0.0 else n
+        order = {
+            "mode": [atom] + [k for k in range(n + 1) if k != atom],
+            "left": range(n + 1),
+            "right": range(n, -1, -1),
+        }[start]
+        stream = ((k, 1.0 if k == atom else 0.0) for k in order)
+    elif start == "left":
+        stream = _walk(n, p, 0, float(binomial_log_pmf(0, n, p)), +1)
+    elif start == "right":
+        stream = _walk(n, p, n, float(binomial_log_pmf(n, n, p)), -1)
+    else:
+        stream = _outward(n, p)
+
+    total = 0.0
+    for k, v in stream:
+        yield k, v
+        total += v
+        if mass is not None and total >= mass:
+            return
+
+
+def _outward(n: int, p: float):
+    # vom Modus nach außen, immer der größere Nachbar zuerst
+    mode = min(int((n + 1) * p), n)
+    log_v = float(binomial_log_pmf(mode, n, p))
+
+    right = _walk(n, p, mode, log_v, +1)
+    left = _walk(n, p, mode, log_v, -1)
+    yield next(right)
+    next(left)
+
+    r = next(right, None)
+    l = next(left, None)
+    while r is not None or l is not None:
+        if l is None or (r is not None and r[1] >= l[1]):
+            yield r
+            r = next(right, None)
+        else:
+            yield l
+            l = next(left, None)
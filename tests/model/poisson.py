@@ -0,0 +1,151 @@
+# tests/model/poisson.py
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+from .base_model import UnboundedRange
+from .pmf_engine import bd0, stirlerr
+
+_LN_2PI = math.log(2.0 * math.pi)
+
+
+@dataclass(frozen=True)
+class PoissonModel:
+    """
+    Poissonmodell X ~ Poi(mu) für Zähldaten.
+
+    Der Träger {0, 1, 2, ...} ist unbeschränkt und wird nie aufgezählt
+    (UnboundedRange). Stattdessen:
+
+    - pmf im Log-Raum (Sattelpunkt-Darstellung nach Loader,
+      wie beim Binomialmodell, siehe pmf_engine):
+          log P(X = k) = -δ(k) - bd0(k, mu) - log sqrt(2π k)
+    - Randmassen über die regularisierte unvollständige Gammafunktion:
+          P(X <= k) = Q(k+1, mu),   P(X >= k) = P(k, mu)
+      je Abfrage O(1), unabhängig von k
+    - ppf/isf: Suche auf cdf/sf ab der Normalapproximation
+      (exponentiell eingrenzen, dann binär)
+
+    Erfüllt das Modellprotokoll; alle Funktionen außer ppf/isf
+    akzeptieren auch Arrays von Stellen.
+
+    Keine Testlogik.
+    """
+
+    mu: float
+
+    def __post_init__(self):
+        if not (0 < self.mu < math.inf):
+            raise ValueError("mu muss positiv und endlich sein")
+
+    # ---- Kennzahlen ----
+
+    @property
+    def support(self) -> UnboundedRange:
+        return UnboundedRange(0)
+
+    @property
+    def mean(self) -> float:
+        return float(self.mu)
+
+    @property
+    def sigma(self) -> float:
+        return math.sqrt(self.mu)
+
+    @property
+    def mode(self) -> int:
+        # pmf steigt bis floor(mu) und fällt danach (nicht streng bei ganzem mu)
+        return int(math.floor(self.mu))
+
+    # ---- Modell-Schnittstelle ----
+
+    def log_pmf(self, k):
+        k = np.asarray(k, dtype=float)
+        out = np.full(k.shape, -np.inf)
+        valid = (k >= 0) & np.isfinite(k) & (k == np.floor(k))
+
+        out[valid & (k == 0)] = -self.mu
+        pos = valid & (k > 0)
+        kp = k[pos]
+        out[pos] = -stirlerr(kp) - bd0(kp, self.mu) - 0.5 * (_LN_2PI + np.log(kp))
+        return out
+
+    def pmf(self, k):
+        # P(X = k); 0 außerhalb des Trägers
+        out = np.exp(self.log_pmf(k))
+        return float(out) if out.ndim == 0 else out
+
+    def cdf(self, x):
+        # P(X <= x) = Q(floor(x) + 1, mu)
+        from scipy.special import gammaincc   # erst bei Bedarf (Importzeit)
+        x = np.floor(np.asarray(x, dtype=float))
+        with np.errstate(invalid="ignore"):
+            val = gammaincc(np.clip(x, 0, np.finfo(float).max) + 1, self.mu)
+        out = np.where(x < 0, 0.0, np.where(np.isposinf(x), 1.0, val))
+        return float(out) if out.ndim == 0 else out
+
+    def sf(self, x):
+        # P(X >= x) = P(ceil(x), mu)
+        from scipy.special import gammainc
+        x = np.ceil(np.asarray(x, dtype=float))
+        with np.errstate(invalid="ignore"):
+            val = gammainc(np.clip(x, 1, np.finfo(float).max), self.mu)
+        out = np.where(x <= 0, 1.0, np.where(np.isposinf(x), 0.0, val))
+        return float(out) if out.ndim == 0 else out
+
+    def _guess(self, z: float) -> int:
+        # Startwert mu + z·sigma (Normalapproximation), begrenzt
+        z = min(max(z, -40.0), 40.0)
+        return max(0, int(self.mu + z * self.sigma))
+
+    def ppf(self, q: float) -> int:
+        """
+        Quantil: kleinstes x mit P(X <= x) >= q.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q muss in [0,1] liegen")
+        from statistics import NormalDist
+
+        hi = self._guess(NormalDist().inv_cdf(min(max(q, 1e-300), 1 - 1e-16)))
+        lo = -1
+        # Invariante: cdf(lo) < q <= cdf(hi)  (cdf(-1) = 0)
+        if self.cdf(hi) < q:
+            lo, hi = hi, 2 * hi + 1
+            while self.cdf(hi) < q:
+                lo, hi = hi, 2 * hi + 1
+        elif hi > 0 and self.cdf(hi - 1) < q:
+            return hi
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if self.cdf(mid) >= q:
+                hi = mid
+            else:
+                lo = mid
+        return hi
+
+    def isf(self, q: float) -> int:
+        """
+        Spiegelbild zu ppf: größtes x mit P(X >= x) >= q.
+        """
+        if not 0 < q <= 1:
+            raise ValueError("q muss in (0,1] liegen")
+        from statistics import NormalDist
+
+        lo = self._guess(NormalDist().inv_cdf(max(1 - q, 1e-300)))
+        # Invariante: sf(lo) >= q > sf(hi)  (sf(0) = 1)
+        if self.sf(lo) < q:
+            hi, lo = lo, 0
+        else:
+            hi = 2 * lo + 1
+            while self.sf(hi) >= q:
+                lo, hi = hi, 2 * hi + 1
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if self.sf(mid) >= q:
+                lo = mid
+            else:
+                hi = mid
+        return lo
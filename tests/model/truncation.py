@@ -0,0 +1,79 @@
+# tests/model/truncation.py
+from __future__ import annotations
+
+import math
+
+
+# ------------------------------------------------------------------
+# Zertifiziertes Abschneiden der Ränder (Chernoff-Schranke)
+# ------------------------------------------------------------------
+#
+# Für X ~ Bin(n, p) und a = k/n gilt
+#
+#     P(X >= k) <= exp(-n · D(a || p))   für a >= p
+#     P(X <= k) <= exp(-n · D(a || p))   für a <= p
+#
+# mit der Kullback-Leibler-Divergenz
+#
+#     D(a || p) = a log(a/p) + (1-a) log((1-a)/(1-p)).
+#
+# Damit lässt sich ein Fenster [lo, hi] um np bestimmen,
+# außerhalb dessen nachweislich höchstens tol Masse liegt.
+
+
+def kl_bernoulli(a: float, p: float) -> float:
+    """D(a || p) für Bernoulli-Verteilungen (0 log 0 = 0)."""
+    d = 0.0
+    if a > 0:
+        d += a * math.log(a / p)
+    if a < 1:
+        d += (1 - a) * math.log((1 - a) / (1 - p))
+    return d
+
+
+def chernoff_tail(k: int, n: int, p: float) -> float:
+    """
+    Obere Schranke für P(X >= k) (k >= np) bzw. P(X <= k) (k <= np).
+    """
+    return math.exp(-n * kl_bernoulli(k / n, p))
+
+
+def chernoff_window(n: int, p: float, tol: float) -> tuple[int, int, float]:
+    """
+    Fenster [lo, hi] mit P(X < lo) + P(X > hi) <= tol (beweisbar).
+
+    Je Rand höchstens tol/2; beide Grenzen über binäre Suche, O(log n).
+
+    Rückgabe:
+        (lo, hi, bound) mit bound = Summe der beiden Chernoff-Schranken
+    """
+    if p == 0.0 or p == 1.0:
+        atom = 0 if p == 0.0 else n
+        return atom, atom, 0.0
+
+    level = math.log(2.0 / tol)
+    mu = n * p
+
+    # rechts: kleinstes m >= np mit n·D(m/n || p) >= level
+    lo_m, hi_m = math.ceil(mu), n + 1
+    while lo_m < hi_m:
+        mid = (lo_m + hi_m) // 2
+        if n * kl_bernoulli(mid / n, p) >= level:
+            hi_m = mid
+        else:
+            lo_m = mid + 1
+    hi = lo_m - 1
+    right = chernoff_tail(hi + 1, n, p) if hi < n else 0.0
+
+    # links: größtes m <= np mit n·D(m/n || p) >= level
+    lo_m, hi_m = -1, math.floor(mu)
+    while lo_m < hi_m:
+        mid = (lo_m + hi_m + 1) // 2
+        if n * kl_bernoulli(mid / n, p) >= level:
+            lo_m = mid
+        else:
+            hi_m = mid - 1
+    lo = lo_m + 1
+    left = chernoff_tail(lo - 1, n, p) if lo > 0 else 0.0
+
+    return lo, hi, left + right
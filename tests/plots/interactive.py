@@ -0,0 +1,147 @@
+# tests/plots/interactive.py
+from __future__ import annotations
+
+from typing import Callable, TYPE_CHECKING
+
+from tests.model.binomial import BinomialModel
+from tests.plots.plot_model import ModelPlotStyle
+from tests.plots.plot_rejection_region import RejectionRegionFrame
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+# ------------------------------------------------------------------
+# Interaktiver Modus zu Grafik 2 (ipywidgets)
+# ------------------------------------------------------------------
+#
+#     from tests.plots.interactive import interactive_rejection_region
+#     interactive_rejection_region(n=100, p0=0.4, alpha=0.05, k_obs=52)
+#
+# Schnell durch
+# - Entprellen: beim Ziehen wird erst nach einer kurzen Pause gezeichnet,
+# - Caches: Modelle (MODEL_CACHE) und Bereiche (REGION_CACHE),
+# - eine Figur: RejectionRegionFrame setzt nur Daten und Texte neu.
+#
+# Mit `%matplotlib widget` (ipympl) wird die Figur direkt aktualisiert,
+# sonst als Bild in einem Output-Widget neu ausgegeben.
+
+
+class _Debounce:
+    """
+    Ruft fn erst auf, wenn seit dem letzten Auslösen wait Sekunden
+    vergangen sind. Läuft über die Ereignisschleife des Kernels;
+    ohne laufende Schleife sofort.
+    """
+
+    def __init__(self, fn: Callable[[], None], wait: float):
+        self.fn = fn
+        self.wait = wait
+        self._pending: asyncio.TimerHandle | None = None
+
+    def __call__(self, *_) -> None:
+        import asyncio   # erst bei Bedarf (Importzeit)
+
+        if self._pending is not None:
+            self._pending.cancel()
+            self._pending = None
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.fn()
+            return
+        self._pending = loop.call_later(self.wait, self._fire)
+
+    def _fire(self) -> None:
+        self._pending = None
+        self.fn()
+
+
+def interactive_rejection_region(
+    n: int = 100,
+    p0: float = 0.4,
+    alpha: float = 0.05,
+    k_obs: int | None = None,
+    *,
+    style: ModelPlotStyle = ModelPlotStyle(),
+    n_max: int = 10_000,
+    debounce: float = 0.15,
+):
+    """
+    Grafik 2 mit Schiebereglern für n, p0, alpha und k_obs.
+
+    - n_max    : Obergrenze des n-Reglers
+    - debounce : Wartezeit [s] nach der letzten Reglerbewegung
+
+    Rückgabe: das Widget (VBox); in einer Notebook-Zelle als
+    letzter Ausdruck wird es angezeigt.
+    """
+    try:
+        import ipywidgets as widgets
+    except ImportError as e:
+        raise ImportError(
+            "Der interaktive Modus benötigt ipywidgets (pip install ipywidgets)."
+        ) from e
+    import matplotlib.pyplot as plt   # erst bei Bedarf (Importzeit)
+    from IPython.display import display
+
+    if not 1 <= n <= n_max:
+        raise ValueError("n muss zwischen 1 und n_max liegen.")
+
+    # Regler ------------------------------------------------------
+    n_slider = widgets.IntSlider(
+        value=n, min=1, max=n_max, step=1, description="n"
+    )
+    p0_slider = widgets.FloatSlider(
+        value=p0, min=0.01, max=0.99, step=0.01, description="p₀"
+    )
+    alpha_slider = widgets.FloatSlider(
+        value=alpha, min=0.001, max=0.2, step=0.001,
+        readout_format=".3f", description="α",
+    )
+    k_slider = widgets.IntSlider(
+        value=k_obs if k_obs is not None else round(n * p0),
+        min=0, max=n, step=1, description="k_obs",
+    )
+    k_show = widgets.Checkbox(value=k_obs is not None, description="k_obs zeigen")
+
+    # Figur (einmal anlegen, nicht sofort ausgeben) -----------------
+    with plt.ioff():
+        frame = RejectionRegionFrame(style=style)
+
+    if isinstance(frame.fig.canvas, widgets.DOMWidget):
+        # ipympl: Canvas ist selbst ein Widget
+        view = frame.fig.canvas
+        show = frame.fig.canvas.draw_idle
+    else:
+        view = widgets.Output()
+
+        def show() -> None:
+            with view:
+                view.clear_output(wait=True)
+                display(frame.fig)
+
+    def redraw() -> None:
+        # Reglerwerte auf die Schrittweite runden (Cache-Schlüssel)
+        model = BinomialModel(n=n_slider.value, p=round(p0_slider.value, 4))
+        frame.update(
+            model,
+            round(alpha_slider.value, 4),
+            k_obs=k_slider.value if k_show.value else None,
+        )
+        show()
+
+    def on_n(change) -> None:
+        k_slider.max = change["new"]
+
+    n_slider.observe(on_n, names="value")
+    trigger = _Debounce(redraw, debounce)
+    for w in (n_slider, p0_slider, alpha_slider, k_slider, k_show):
+        w.observe(trigger, names="value")
+
+    redraw()
+    return widgets.VBox([
+        widgets.HBox([n_slider, p0_slider]),
+        widgets.HBox([alpha_slider, k_slider, k_show]),
+        view,
+    ])
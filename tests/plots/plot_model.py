@@ -3,15 +3,18 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import math
-import matplotlib.pyplot as plt
 
 from tests.model.binomial import BinomialModel
+from tests.utils.profiling import stage, staged
 
 
 # ------------------------------------------------------------------
 # Plot-Konfiguration (bewusst explizit)
 # ------------------------------------------------------------------
-from typing import Tuple
+from typing import Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
 
 @dataclass(frozen=True)
 class ModelPlotStyle:
@@ -36,6 +39,10 @@ class ModelPlotStyle:
     power_p0_color: str = "tab:blue"
     power_pstar_color: str = "tab:blue"
 
+    # Powerfläche (n × p)
+    surface_cmap: str = "viridis"
+    surface_contour_color: str = "white"
+
     # Typografie
     title_fontsize: int = 14
     subtitle_fontsize: int = 12    
@@ -56,6 +63,7 @@ class ModelPlotStyle:
 # Grafik 1: Stichprobenverteilung
 # ------------------------------------------------------------------
 
+@staged("plot")
 def plot_binomial_model(
     model: BinomialModel,
     style: ModelPlotStyle = ModelPlotStyle(),
@@ -73,6 +81,7 @@ def plot_binomial_model(
     """
 
     if ax is None:
+        import matplotlib.pyplot as plt   # erst bei Bedarf (Importzeit)
         fig, ax = plt.subplots(figsize=style.figsize)
 
     # Modellkennzahlen
@@ -83,7 +92,7 @@ def plot_binomial_model(
     k_min = max(0, int(math.floor(mu - style.sigma_range * sigma)))
     k_max = min(model.n, int(math.ceil(mu + style.sigma_range * sigma)))
 
-    k_vals = [k for k in model.support if k_min <= k <= k_max]
+    k_vals = list(range(k_min, k_max + 1))
     p_vals = [model.pmf(k) for k in k_vals]
 
     # diskrete Wahrscheinlichkeitsfunktion
@@ -157,6 +166,7 @@ def plot_binomial_model(
 )
 
     if save is not None:
-        ax.figure.savefig(save, bbox_inches="tight")
+        with stage("save"):
+            ax.figure.savefig(save, bbox_inches="tight")
     
     return ax
@@ -2,13 +2,18 @@
 from __future__ import annotations
 
 import math
-import matplotlib.pyplot as plt
+from typing import TYPE_CHECKING
 
 from tests.model.binomial import BinomialModel
 from tests.decision.p_value import p_value_two_sided_equal_tails
 from tests.plots.plot_model import plot_binomial_model, ModelPlotStyle
+from tests.utils.profiling import stage, staged
 
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
 
+
+@staged("plot")
 def plot_binomial_model_with_p_value(
     model: BinomialModel,
     x_obs: int,
@@ -24,6 +29,8 @@ def plot_binomial_model_with_p_value(
     Keine Entscheidung, kein alpha.
     """
 
+    import matplotlib.pyplot as plt   # erst bei Bedarf (Importzeit)
+
     fig, ax = plt.subplots(figsize=style.figsize)
 
     # 1. Basisgrafik (Referenz!)
@@ -45,7 +52,9 @@ def plot_binomial_model_with_p_value(
     mu = model.n * model.p
     mirror = int(round(2 * mu - x_obs))
 
-    k_vals = list(model.support)
+    # nur der sichtbare Bereich (Achsen aus der Basisgrafik)
+    k_lo, k_hi = (int(v) for v in ax.get_xlim())
+    k_vals = range(k_lo, k_hi + 1)
 
     # linke Randmasse
     k_left = [k for k in k_vals if k <= min(x_obs, mirror)]
@@ -77,15 +86,22 @@ def plot_binomial_model_with_p_value(
     # 4. p-Wert berechnen (nur für Beschriftung!)
     p_val = p_value_two_sided_equal_tails(model, x_obs)
 
+    # abgeschnittenes Modell: Fehlerschranke mit angeben
+    err = getattr(model, "truncation_error", 0.0)
+    p_title = rf"$p = {p_val:.4f}$"
+    if err > 0:
+        p_title = rf"$p = {p_val:.4f} \pm {err:.0e}$"
+
     ax.legend(
         frameon=False,
         fontsize=style.legend_fontsize,
-        title=rf"$p = {p_val:.4f}$",
+        title=p_title,
         title_fontsize=style.legend_fontsize,
     )
 
     # 5. Optional speichern
     if save is not None:
-        fig.savefig(save, bbox_inches="tight")
+        with stage("save"):
+            fig.savefig(save, bbox_inches="tight")
 
     return ax
@@ -1,11 +1,22 @@
 from __future__ import annotations
 
-import matplotlib.pyplot as plt
-from typing import Callable
+from typing import Callable, TYPE_CHECKING
 
-from tests.power.power_function import power_curve, power_at
+from tests.model.binomial import BinomialModel
+from tests.power.power_function import power_at, power_curve, power_curve_binomial
 from tests.plots.plot_model import ModelPlotStyle
+from tests.utils.profiling import stage, staged
 
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
+
+def _is_full_binomial(model, n: int) -> bool:
+    # schneller Weg (power_curve_binomial) rechnet mit vollem Bin(n, p)
+    return isinstance(model, BinomialModel) and model.n == n and model.tol == 0
+
+
+@staged("plot")
 def plot_power_curve(
     model_factory: Callable[[float], object],
     rejection_region,
@@ -27,8 +38,16 @@ def plot_power_curve(
     - Power g_n(p) = P_p(X ∈ K)
     - festes Testverfahren (K_alpha)
     - variierender wahrer Parameter p
+
+    Liefert model_factory volle Binomialmodelle Bin(n, p)
+    (tol = 0), wird die Kurve über alle p auf einmal berechnet
+    (power_curve_binomial); sonst je p über model_factory
+    (power_curve / power_at, z. B. abgeschnittene Modelle
+    oder Normalapproximation).
     """
 
+    import matplotlib.pyplot as plt   # erst bei Bedarf (Importzeit)
+
     fig, ax = plt.subplots(figsize=style.figsize)
 
     # --- p-Gitter ---
@@ -38,20 +57,31 @@ def plot_power_curve(
         p_values.append(round(p, 6))
         p += p_step
 
-    curve = power_curve(
-        model_factory=model_factory,
-        p_values=p_values,
-        rejection_region=rejection_region,
-    )
-
-    p_vals = [p for p, _ in curve]
-    g_vals = [g for _, g in curve]
+    fast = _is_full_binomial(model_factory(p0), n)
+
+    def power(p: float) -> float:
+        if fast:
+            return float(power_curve_binomial(n, p, rejection_region))
+        return power_at(model_factory(p), rejection_region)
+
+    if fast:
+        # Powerkurve in einem Durchgang (Bin(n, p), vektorisiert)
+        p_vals = p_values
+        g_vals = power_curve_binomial(n, p_values, rejection_region)
+    else:
+        curve = power_curve(
+            model_factory=model_factory,
+            p_values=p_values,
+            rejection_region=rejection_region,
+        )
+        p_vals = [p for p, _ in curve]
+        g_vals = [g for _, g in curve]
 
     # --- Powerkurve ---
     ax.plot(p_vals, g_vals, linewidth=2.0)
 
     # --- Referenzpunkt p0 ---
-    g_p0 = power_at(model_factory(p0), rejection_region)
+    g_p0 = power(p0)
 
     ax.vlines(
         p0,
@@ -72,7 +102,7 @@ def plot_power_curve(
     # --- Optionaler Referenzpunkt p* ---
     g_ps = None
     if p_star is not None:
-        g_ps = power_at(model_factory(p_star), rejection_region)
+        g_ps = power(p_star)
 
         ax.vlines(
             p_star,
@@ -154,6 +184,7 @@ def plot_power_curve(
 
     # --- Speichern ---
     if save is not None:
-        fig.savefig(save, bbox_inches="tight", pad_inches=0.3)
+        with stage("save"):
+            fig.savefig(save, bbox_inches="tight", pad_inches=0.3)
 
     return ax
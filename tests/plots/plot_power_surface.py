@@ -0,0 +1,115 @@
+# tests/plots/plot_power_surface.py
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from tests.power.power_surface import PowerSurface
+from tests.plots.plot_model import ModelPlotStyle
+from tests.utils.profiling import stage, staged
+
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
+
+@staged("plot")
+def plot_power_surface(
+    surface: PowerSurface,
+    *,
+    levels: tuple[float, ...] = (0.5, 0.8, 0.95),
+    style: ModelPlotStyle = ModelPlotStyle(),
+    ax: plt.Axes | None = None,
+    save: str | None = None,
+):
+    """
+    Referenzgrafik: Powerfläche g_n(p) über (p, n).
+
+    Darstellung:
+    - Farbe: Power g_n(p) (Heatmap)
+    - Höhenlinien bei den Power-Niveaus levels
+    - senkrechte Linie bei p0 (dort liegt die Power bei höchstens alpha)
+
+    surface stammt aus power_surface (ggf. parallel berechnet).
+    """
+    if ax is None:
+        import matplotlib.pyplot as plt   # erst bei Bedarf (Importzeit)
+        fig, ax = plt.subplots(figsize=style.figsize)
+
+    p = surface.p_values
+    n = surface.n_values
+
+    # --- Heatmap ---
+    mesh = ax.pcolormesh(
+        p,
+        n,
+        surface.power,
+        cmap=style.surface_cmap,
+        vmin=0.0,
+        vmax=1.0,
+        shading="nearest",
+        rasterized=True,
+    )
+    cbar = ax.figure.colorbar(mesh, ax=ax)
+    cbar.set_label(r"Power $g_n(p)$", fontsize=style.label_fontsize)
+    cbar.ax.tick_params(labelsize=style.tick_fontsize)
+
+    # --- Höhenlinien ---
+    if levels and p.size > 1 and n.size > 1:
+        cs = ax.contour(
+            p,
+            n,
+            surface.power,
+            levels=sorted(levels),
+            colors=style.surface_contour_color,
+            linewidths=style.power_ref_width,
+        )
+        ax.clabel(cs, fmt="%.2f", fontsize=style.legend_fontsize)
+
+    # --- Referenz p0 ---
+    ax.axvline(
+        surface.p0,
+        color=style.surface_contour_color,
+        linewidth=style.power_ref_width,
+        linestyle=style.power_ref_style,
+    )
+
+    # --- Achsen ---
+    ax.set_xlabel(
+        r"Wahrer Parameter $p$",
+        fontsize=style.label_fontsize,
+    )
+    ax.set_ylabel(
+        r"Stichprobenumfang $n$",
+        fontsize=style.label_fontsize,
+    )
+    ax.tick_params(axis="both", labelsize=style.tick_fontsize)
+
+    # --- Titel & Subtitel ---
+    ax.text(
+        0.5,
+        1.11,
+        "Powerfläche des Tests",
+        transform=ax.transAxes,
+        ha="center",
+        va="bottom",
+        fontsize=style.title_fontsize,
+    )
+
+    p0_txt = f"{surface.p0:g}"
+
+    ax.text(
+        0.5,
+        1.01,
+        rf"$H_0: p={p0_txt},\; \alpha={surface.alpha},\; "
+        rf"n={n.min()},\dots,{n.max()}$",
+        transform=ax.transAxes,
+        ha="center",
+        va="bottom",
+        fontsize=style.subtitle_fontsize,
+    )
+
+    # --- Speichern ---
+    if save is not None:
+        with stage("save"):
+            ax.figure.savefig(save, bbox_inches="tight", pad_inches=0.3)
+
+    return ax
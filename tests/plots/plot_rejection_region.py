@@ -1,13 +1,22 @@
 # tests/plots/plot_rejection_region.py
 from __future__ import annotations
 
-import matplotlib.pyplot as plt
+import math
+from typing import TYPE_CHECKING
+
+import numpy as np
+
 from tests.model.binomial import BinomialModel
 from tests.geometry.construct_rejection_region import two_sided_equal_tails
 #from tests.decision.p_value import p_value_two_sided_equal_tails
 from tests.plots.plot_model import plot_binomial_model, ModelPlotStyle
+from tests.utils.profiling import stage, staged
+
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
 
 
+@staged("plot")
 def plot_binomial_model_with_rejection_region(
     model: BinomialModel,
     alpha: float,
@@ -24,6 +33,8 @@ def plot_binomial_model_with_rejection_region(
     (zweiseitig, equal tails).
     """
 
+    import matplotlib.pyplot as plt   # erst bei Bedarf (Importzeit)
+
     fig, ax = plt.subplots(figsize=style.figsize)
 
 
@@ -38,7 +49,9 @@ def plot_binomial_model_with_rejection_region(
     # 2. Ablehnungsbereich (Setzung!)
     R = two_sided_equal_tails(model, alpha)
 
-    k_reject = sorted(R.K)
+    # nur der sichtbare Teil von K (Achsen aus der Basisgrafik)
+    k_lo, k_hi = (int(v) for v in ax.get_xlim())
+    k_reject = list(R.K.clip(k_lo, k_hi))
     p_reject = [model.pmf(k) for k in k_reject]
 
     ax.vlines(
@@ -68,6 +81,9 @@ def plot_binomial_model_with_rejection_region(
         text_parts.append(
             rf"$k_{{obs}}={k_obs},\; p\text{{-Wert}}={p_val:.3f}$"
         )
+
+    if R.error_bound > 0:
+        text_parts.append(rf"Abschneidefehler $\leq {R.error_bound:.0e}$")
     
     ax.text(
         0.5,
@@ -82,8 +98,149 @@ def plot_binomial_model_with_rejection_region(
     # 4. Optional speichern
     # --- Speichern ---
     if save is not None:
-        fig.savefig(save, bbox_inches="tight", pad_inches=0.3)
+        with stage("save"):
+            fig.savefig(save, bbox_inches="tight", pad_inches=0.3)
 
 
 
     return ax
+
+
+# ------------------------------------------------------------------
+# Grafik 2 als wiederverwendbares Bild (interaktiver Modus)
+# ------------------------------------------------------------------
+
+def _segments(k: np.ndarray, heights: np.ndarray) -> np.ndarray:
+    # senkrechte Linien (k, 0) -> (k, h), Format von LineCollection
+    seg = np.zeros((len(k), 2, 2))
+    seg[:, :, 0] = k[:, None]
+    seg[:, 1, 1] = heights
+    return seg
+
+
+class RejectionRegionFrame:
+    """
+    Grafik 2 als wiederverwendbares Bild.
+
+    Beim Anlegen werden Achsen, Beschriftung und alle Artists
+    einmal erzeugt (noch ohne Daten). update(model, alpha, k_obs=...)
+    setzt danach nur Daten und Texte neu: Balken, K, Erwartungswert,
+    Achsengrenzen, Subtitel und Textblock.
+
+    Darstellung wie plot_binomial_model_with_rejection_region;
+    gedacht für Schieberegler (tests.plots.interactive).
+    """
+
+    @staged("plot")
+    def __init__(
+        self,
+        *,
+        style: ModelPlotStyle = ModelPlotStyle(),
+        ax: plt.Axes | None = None,
+    ):
+        if ax is None:
+            import matplotlib.pyplot as plt   # erst bei Bedarf (Importzeit)
+            fig, ax = plt.subplots(figsize=style.figsize)
+        self.ax = ax
+        self.fig = ax.figure
+        self.style = style
+
+        empty = np.zeros(0)
+        self._bars = ax.vlines(
+            empty, 0, empty, linewidth=style.bar_width, color=style.bar_color
+        )
+        self._mean = ax.axvline(
+            0.0,
+            linestyle=style.mean_style,
+            linewidth=style.mean_width,
+            color=style.mean_color,
+        )
+        self._reject = ax.vlines(
+            empty, 0, empty, linewidth=style.bar_width, color="tab:red"
+        )
+
+        ax.set_xlabel(r"Anzahl der Erfolge $k$", fontsize=style.label_fontsize)
+        ax.set_ylabel(r"$P(X = k)$", fontsize=style.label_fontsize)
+        ax.tick_params(axis="both", labelsize=style.tick_fontsize)
+
+        ax.text(
+            0.5,
+            1.11,
+            "Stichprobenverteilung",
+            transform=ax.transAxes,
+            ha="center",
+            va="bottom",
+            fontsize=style.title_fontsize,
+        )
+        self._subtitle = ax.text(
+            0.5,
+            1.02,
+            "",
+            transform=ax.transAxes,
+            ha="center",
+            va="bottom",
+            fontsize=style.subtitle_fontsize,
+        )
+        self._info = ax.text(
+            0.5,
+            -0.20,
+            "",
+            transform=ax.transAxes,
+            ha="center",
+            va="top",
+            fontsize=style.tick_fontsize,
+        )
+
+    @staged("plot")
+    def update(self, model: BinomialModel, alpha: float, *, k_obs: int | None = None):
+        """
+        Neues Modell / neue Setzung / neue Beobachtung.
+
+        Modell und Bereich kommen aus den Caches (MODEL_CACHE,
+        REGION_CACHE); gezeichnet wird nur der sichtbare Bereich.
+        Rückgabe: der Ablehnungsbereich.
+        """
+        from tests.utils.format_K import format_rejection_region_intervals
+        from tests.decision.p_value import p_value_two_sided_equal_tails
+
+        style = self.style
+        ax = self.ax
+
+        # Definitionsmenge wie in plot_binomial_model
+        mu = model.n * model.p
+        sigma = math.sqrt(model.n * model.p * (1 - model.p))
+        k_min = max(0, int(math.floor(mu - style.sigma_range * sigma)))
+        k_max = min(model.n, int(math.ceil(mu + style.sigma_range * sigma)))
+
+        k = np.arange(k_min, k_max + 1)
+        pmf = np.asarray(model.pmf(k), dtype=float)
+        self._bars.set_segments(_segments(k, pmf))
+        self._mean.set_xdata([mu, mu])
+
+        R = two_sided_equal_tails(model, alpha)
+        in_K = R.K.contains_array(k)
+        self._reject.set_segments(_segments(k[in_K], pmf[in_K]))
+
+        ax.set_xlim(k_min, k_max)
+        ax.set_ylim(0, pmf.max() * 1.1)
+
+        self._subtitle.set_text(rf"Binomialmodell: $n={model.n},\; p_0={model.p}$")
+        self._mean.set_label(rf"Erwartungswert $E(X)={mu:.0f}$")
+        self._reject.set_label(rf"Ablehnungsbereich ($\alpha={alpha}$)")
+        ax.legend(frameon=False, fontsize=style.legend_fontsize)
+
+        text_parts = [format_rejection_region_intervals(R.K, model.n)]
+        if k_obs is not None:
+            p_val = p_value_two_sided_equal_tails(model=model, x_obs=k_obs)
+            text_parts.append(
+                rf"$k_{{obs}}={k_obs},\; p\text{{-Wert}}={p_val:.3f}$"
+            )
+        if R.error_bound > 0:
+            text_parts.append(rf"Abschneidefehler $\leq {R.error_bound:.0e}$")
+        self._info.set_text("   |   ".join(text_parts))
+
+        return R
+
+    def save(self, path: str) -> None:
+        with stage("save"):
+            self.fig.savefig(path, bbox_inches="tight", pad_inches=0.3)
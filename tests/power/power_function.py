@@ -3,7 +3,13 @@ from __future__ import annotations
 
 from typing import Iterable, Callable
 
+import numpy as np
 
+from tests.utils.error_bound import truncation_error, with_error_bound
+from tests.utils.profiling import staged
+
+
+@staged("power")
 def power_at(
     model_alt,
     rejection_region,
@@ -20,13 +26,13 @@ def power_at(
 
     Rückgabe:
         Wahrscheinlichkeit der Verwerfung unter model_alt
+        (abgeschnittenes model_alt: Fehler <= truncation_error,
+        am Ergebnis als error_bound)
     """
-    return sum(
-        model_alt.pmf(x)
-        for x in rejection_region.K
-    )
+    return with_error_bound(rejection_region.K.mass(model_alt), truncation_error(model_alt))
 
 
+@staged("power")
 def power_curve(
     model_factory: Callable[[float], object],
     p_values: Iterable[float],
@@ -41,7 +47,7 @@ def power_curve(
     - rejection_region: festgelegter Ablehnungsbereich K
 
     Rückgabe:
-        Liste von Tupeln (p, Power(p))
+        Liste von Tupeln (p, Power(p)), Power mit error_bound
     """
     result = []
 
@@ -51,3 +57,66 @@ def power_curve(
         result.append((p, power))
 
     return result
+
+
+# ---------------------------------------------------------------------
+# Vektorisiert: ganze Powerkurve für Bin(n, p) in einem Durchgang
+# ---------------------------------------------------------------------
+
+def _binomial_sf(k: int, n: int, p: np.ndarray) -> np.ndarray:
+    # P(X >= k) = I_p(k, n-k+1)   (regularisierte unvollständige Beta-Funktion)
+    from scipy.special import betainc   # erst bei Bedarf (Importzeit)
+    if k <= 0:
+        return np.ones_like(p)
+    if k > n:
+        return np.zeros_like(p)
+    return betainc(k, n - k + 1, p)
+
+
+def _binomial_cdf(k: int, n: int, p: np.ndarray) -> np.ndarray:
+    # P(X <= k) = I_{1-p}(n-k, k+1)
+    from scipy.special import betainc
+    if k < 0:
+        return np.zeros_like(p)
+    if k >= n:
+        return np.ones_like(p)
+    return betainc(n - k, k + 1, 1.0 - p)
+
+
+@staged("power")
+def power_curve_binomial(
+    n: int,
+    p_values: Iterable[float],
+    rejection_region,
+) -> np.ndarray:
+    """
+    Power-Funktion g_n(p) = P_p(X ∈ K) für X ~ Bin(n, p),
+    für alle p auf einmal.
+
+    Je Intervall [a, b] von K eine Randmasse über die
+    regularisierte unvollständige Beta-Funktion:
+
+        P_p(X >= a) = I_p(a, n-a+1)
+        P_p(X <= b) = I_{1-p}(n-b, b+1)
+
+    Kein Modell pro p, keine Summe über K.
+
+    Rückgabe:
+        Array der Power-Werte, gleiche Form wie p_values
+    """
+    p = np.asarray(p_values, dtype=float)
+    power = np.zeros_like(p)
+
+    for a, b in rejection_region.intervals:
+        a = max(a, 0)
+        b = min(b, n)
+        if a > b:
+            continue
+        if a == 0:
+            power += _binomial_cdf(b, n, p)
+        elif b == n:
+            power += _binomial_sf(a, n, p)
+        else:
+            power += _binomial_sf(a, n, p) - _binomial_sf(b + 1, n, p)
+
+    return power
@@ -0,0 +1,127 @@
+# tests/power/power_surface.py
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Callable, Iterable
+
+import numpy as np
+
+from tests.model.binomial import BinomialModel
+from tests.geometry.construct_rejection_region import two_sided_equal_tails
+from tests.power.power_function import power_curve_binomial
+from tests.utils.profiling import staged
+
+
+@dataclass(frozen=True)
+class PowerSurface:
+    """
+    Power g_n(p) auf einem Gitter (n × p).
+
+    - power[i, j] = g_{n_values[i]}(p_values[j])
+    - je Zeile ein eigener Ablehnungsbereich K_n
+      (Setzung construction zum Niveau alpha unter H0: p = p0)
+    """
+    n_values: np.ndarray
+    p_values: np.ndarray
+    power: np.ndarray
+    p0: float
+    alpha: float
+
+
+# ------------------------------------------------------------------
+# Worker: Zeilen direkt in den gemeinsamen Speicher schreiben
+# ------------------------------------------------------------------
+
+_shm: shared_memory.SharedMemory | None = None
+_out: np.ndarray | None = None
+
+
+def _attach(name: str, shape: tuple[int, int]) -> None:
+    # Initialisierung je Worker-Prozess: Ergebnisarray einmal einblenden
+    global _shm, _out
+    _shm = shared_memory.SharedMemory(name=name)
+    _out = np.ndarray(shape, dtype=float, buffer=_shm.buf)
+
+
+def _fill_rows(out: np.ndarray, rows, n_values, p_values, p0, alpha, construction) -> None:
+    for i, n in zip(rows, n_values):
+        R = construction(BinomialModel(n=int(n), p=p0), alpha)
+        out[i] = power_curve_binomial(int(n), p_values, R)
+
+
+def _worker(task) -> None:
+    _fill_rows(_out, *task)
+
+
+@staged("power")
+def power_surface(
+    n_values: Iterable[int],
+    p_values: Iterable[float],
+    p0: float,
+    alpha: float,
+    construction: Callable = two_sided_equal_tails,
+    *,
+    workers: int | None = 1,
+    rows_per_task: int | None = None,
+) -> PowerSurface:
+    """
+    Power g_n(p) für alle Kombinationen aus n_values und p_values.
+
+    Je n: ein Ablehnungsbereich (construction(Bin(n, p0), alpha)),
+    dann die ganze Zeile über p vektorisiert (power_curve_binomial).
+
+    Parallel (workers > 1 oder None = os.cpu_count()):
+    die Zeilen werden auf einen Prozesspool verteilt; die Worker
+    schreiben direkt in ein Array im gemeinsamen Speicher
+    (multiprocessing.shared_memory). Zurück kommt nichts außer
+    der Fertigmeldung, es werden keine Ergebnisse gepickelt.
+
+    construction muss eine Funktion auf Modulebene sein
+    (left_tail, right_tail, two_sided_equal_tails, ...).
+    """
+    n_arr = np.asarray(list(n_values), dtype=np.int64)
+    p_arr = np.asarray(list(p_values), dtype=float)
+    if n_arr.ndim != 1 or p_arr.ndim != 1:
+        raise ValueError("n_values und p_values müssen eindimensional sein")
+    if np.any(n_arr <= 0):
+        raise ValueError("n muss positiv sein")
+
+    shape = (n_arr.size, p_arr.size)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers == 1 or n_arr.size <= 1:
+        power = np.empty(shape)
+        _fill_rows(power, range(n_arr.size), n_arr, p_arr, p0, alpha, construction)
+        return PowerSurface(n_arr, p_arr, power, p0, alpha)
+
+    # Zeilen verschränkt verteilen: große und kleine n gemischt,
+    # damit die Worker etwa gleich lange rechnen
+    if rows_per_task is None:
+        rows_per_task = max(1, n_arr.size // (8 * workers))
+    n_tasks = -(-n_arr.size // rows_per_task)
+    tasks = [
+        (rows, n_arr[rows], p_arr, p0, alpha, construction)
+        for rows in (np.arange(t, n_arr.size, n_tasks) for t in range(n_tasks))
+    ]
+
+    shm = shared_memory.SharedMemory(
+        create=True, size=max(1, int(np.prod(shape)) * 8)
+    )
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_attach,
+            initargs=(shm.name, shape),
+        ) as pool:
+            for _ in pool.map(_worker, tasks):
+                pass
+        power = np.ndarray(shape, dtype=float, buffer=shm.buf).copy()
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return PowerSurface(n_arr, p_arr, power, p0, alpha)
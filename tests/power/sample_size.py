@@ -0,0 +1,242 @@
+# tests/power/sample_size.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+
+from tests.model.binomial import transient_model
+from tests.geometry.construct_rejection_region import (
+    left_tail,
+    right_tail,
+    two_sided_equal_tails,
+)
+from tests.geometry.critical_values import (
+    binomial_cdf,
+    binomial_sf,
+    left_boundaries,
+    right_boundaries,
+)
+from tests.geometry.rejection_region import RejectionRegion
+from tests.power.power_function import power_at
+from tests.utils.profiling import staged
+
+
+# Abstand zur Zielpower, ab dem exakt (über die Modelle) nachgerechnet wird
+_TIE_TOL = 1e-9
+
+
+@dataclass(frozen=True)
+class SampleSizePlan:
+    """
+    Ergebnis der Stichprobenplanung.
+
+    - n              : kleinster Stichprobenumfang mit Power >= Ziel
+    - power          : exakte Power g_n(p*) bei diesem n
+    - rejection_region: zugehöriger Ablehnungsbereich unter H0
+    - n_lower_bound  : ab hier wurde gesucht (beweisbar: darunter unmöglich)
+    """
+    n: int
+    power: float
+    rejection_region: RejectionRegion
+    n_lower_bound: int
+
+
+# ---------------------------------------------------------------------
+# Power-Schranken, vektorisiert über n
+# ---------------------------------------------------------------------
+
+def _tail_power(n, p0, p_star, a_left, a_right) -> np.ndarray:
+    # g_n(p*) für K = {0..l} ∪ {r..n}, je n
+    power = np.zeros(np.shape(n))
+    if a_left > 0:
+        power += binomial_cdf(left_boundaries(n, p0, a_left), n, p_star)
+    if a_right > 0:
+        power += binomial_sf(right_boundaries(n, p0, a_right), n, p_star)
+    return power
+
+
+def _mp_power(n, p0, p_star, a) -> np.ndarray:
+    """
+    Power des (randomisierten) besten Tests zum Niveau a
+    für H0: p0 gegen p* (Neyman-Pearson, einseitig Richtung p*).
+
+    Kein Test zum Niveau a ist bei p* mächtiger,
+    und die Power wächst monoton in n.
+    """
+    if a <= 0:
+        return np.zeros(np.shape(n))
+    if p_star > p0:
+        r = right_boundaries(n, p0, a)
+        size = binomial_sf(r, n, p0)
+        edge0 = binomial_sf(r - 1, n, p0) - size
+        edge1 = binomial_sf(r - 1, n, p_star) - binomial_sf(r, n, p_star)
+        base = binomial_sf(r, n, p_star)
+    else:
+        l = left_boundaries(n, p0, a)
+        size = binomial_cdf(l, n, p0)
+        edge0 = binomial_cdf(l + 1, n, p0) - size
+        edge1 = binomial_cdf(l + 1, n, p_star) - binomial_cdf(l, n, p_star)
+        base = binomial_cdf(l, n, p_star)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gamma = np.clip(np.where(edge0 > 0, (a - size) / edge0, 0.0), 0.0, 1.0)
+    return base + gamma * edge1
+
+
+# ---------------------------------------------------------------------
+# Planung
+# ---------------------------------------------------------------------
+
+def _tail_levels(construction: Callable, alpha: float):
+    # (linke, rechte) Randmasse der Setzung; None: keine Randsetzung
+    if construction is two_sided_equal_tails:
+        return alpha / 2, alpha / 2
+    if construction is left_tail:
+        return alpha, 0.0
+    if construction is right_tail:
+        return 0.0, alpha
+    return None
+
+
+def _lower_bound(p0, p_star, alpha, target, levels, n_max) -> int:
+    """
+    Kleinstes n, ab dem die Zielpower überhaupt möglich ist
+    (binäre Suche; die Schranke ist monoton in n).
+    """
+    def bound(n: int) -> float:
+        n_arr = np.array([n], dtype=float)
+        b = _mp_power(n_arr, p0, p_star, alpha)[0]
+        if levels is not None:
+            a_left, a_right = levels
+            a_toward, a_away = (a_right, a_left) if p_star > p0 else (a_left, a_right)
+            b = min(b, _mp_power(n_arr, p0, p_star, a_toward)[0] + a_away)
+        return b
+
+    if bound(n_max) < target - _TIE_TOL:
+        raise ValueError(
+            f"Zielpower {target} wird bis n_max={n_max} nicht erreicht"
+        )
+
+    lo, hi = 1, n_max
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if bound(mid) >= target - _TIE_TOL:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+def _exact_power(n: int, p0, p_star, alpha, construction) -> tuple[float, RejectionRegion]:
+    # Wegwerf-Modelle und -Bereiche je n: an MODEL_CACHE und
+    # REGION_CACHE vorbei (__wrapped__: Setzung ohne _cached-Hülle),
+    # sonst verdrängt ein langer Durchlauf alle übrigen Einträge
+    construct = getattr(construction, "__wrapped__", construction)
+    R = construct(transient_model(n, p0), alpha)
+    return power_at(transient_model(n, p_star), R), R
+
+
+@staged("power")
+def minimal_sample_size(
+    p0: float,
+    p_star: float,
+    alpha: float,
+    target_power: float,
+    construction: Callable = two_sided_equal_tails,
+    *,
+    n_max: int = 10**7,
+    stable_horizon: int = 0,
+    exact_budget: int = 20_000,
+) -> SampleSizePlan:
+    """
+    Kleinstes n mit Power g_n(p*) >= target_power
+    für den Test H0: p = p0 mit gegebener Setzung (construction, alpha).
+
+    Diskretheit: g_n(p*) ist in n NICHT monoton (Sägezahn).
+    Daher keine binäre Suche über n, sondern
+    - eine beweisbare untere Schranke (bester Test nach Neyman-Pearson,
+      monoton in n) und
+    - ab dort ein lückenloser Durchlauf über n, blockweise vektorisiert
+      (kritische Werte über Quantilsuche, Randmassen über
+      die unvollständige Beta-Funktion).
+
+    stable_horizon = h > 0 verlangt zusätzlich g_m(p*) >= Ziel
+    für alle m = n, ..., n+h (kein Rückfall direkt danach).
+
+    Setzungen left_tail, right_tail, two_sided_equal_tails laufen
+    vektorisiert; jede andere (z. B. two_sided_symmetric) wird je n
+    exakt über Modell und Ablehnungsbereich berechnet (langsamer).
+    Dieser Durchlauf prüft höchstens exact_budget Werte von n ab der
+    unteren Schranke; danach ValueError. Die Schranke gilt für den
+    besten Test, eine andere Setzung erreicht das Ziel u. U. viel
+    später oder nie.
+    """
+    if not (0 < p0 < 1):
+        raise ValueError("p0 muss in (0,1) liegen")
+    if not (0 <= p_star <= 1) or p_star == p0:
+        raise ValueError("p* muss in [0,1] liegen und von p0 verschieden sein")
+
+    if exact_budget <= 0:
+        raise ValueError("exact_budget muss positiv sein")
+
+    levels = _tail_levels(construction, alpha)
+    n_start = _lower_bound(p0, p_star, alpha, target_power, levels, n_max)
+    n_stop = n_max if levels is not None else min(n_max, n_start + exact_budget - 1)
+
+    n = n_start
+    block = 256
+    run_start: int | None = None
+
+    while n <= n_stop:
+        ns = np.arange(n, min(n + block, n_stop + 1), dtype=float)
+
+        if levels is not None:
+            g = _tail_power(ns, p0, p_star, *levels)
+            near = np.flatnonzero(np.abs(g - target_power) <= _TIE_TOL)
+            for i in near:
+                g[i] = _exact_power(int(ns[i]), p0, p_star, alpha, construction)[0]
+        else:
+            g = np.array([
+                _exact_power(int(m), p0, p_star, alpha, construction)[0]
+                for m in ns
+            ])
+
+        ok = g >= target_power
+
+        # Läufe aufeinanderfolgender Erfolge (über Blockgrenzen hinweg)
+        fails = np.flatnonzero(~ok)
+        cuts = np.concatenate(([-1], fails, [ok.size]))
+        for i in range(cuts.size - 1):
+            first, last = cuts[i] + 1, cuts[i + 1] - 1
+            if first > last:
+                continue
+            start = run_start if (i == 0 and run_start is not None) else int(ns[first])
+            if int(ns[last]) - start >= stable_horizon:
+                power, R = _exact_power(start, p0, p_star, alpha, construction)
+                return SampleSizePlan(
+                    n=start,
+                    power=power,
+                    rejection_region=R,
+                    n_lower_bound=n_start,
+                )
+
+        if ok[-1]:
+            last_fail = fails[-1] if fails.size else -1
+            if not (last_fail == -1 and run_start is not None):
+                run_start = int(ns[last_fail + 1])
+        else:
+            run_start = None
+
+        n += ns.size
+        block = min(2 * block, 65536)
+
+    if n_stop < n_max:
+        raise ValueError(
+            f"Zielpower {target_power} wird im exakten Durchlauf "
+            f"n = {n_start}..{n_stop} nicht stabil erreicht "
+            f"(exact_budget={exact_budget} erhöhen)"
+        )
+    raise ValueError(
+        f"Zielpower {target_power} wird bis n_max={n_max} nicht stabil erreicht"
+    )
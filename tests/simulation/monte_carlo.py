@@ -0,0 +1,178 @@
+# tests/simulation/monte_carlo.py
+from __future__ import annotations
+
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Callable
+
+import numpy as np
+
+from tests.geometry.rejection_region import IntervalSet, RejectionRegion
+from tests.simulation.samplers import BinomialSampler
+from tests.utils.profiling import staged
+
+
+@dataclass(frozen=True)
+class SimulationResult:
+    """
+    Ergebnis einer Monte-Carlo-Simulation der Verwerfungsrate.
+
+    - rejections: Anzahl Beobachtungen in K
+    - samples   : Anzahl Beobachtungen insgesamt
+    - estimate  : rejections / samples
+    - ci_low, ci_high: Konfidenzintervall (Wilson) zum Niveau confidence
+    - seconds   : Laufzeit (Wanduhr)
+    """
+    rejections: int
+    samples: int
+    estimate: float
+    ci_low: float
+    ci_high: float
+    confidence: float
+    seconds: float
+
+    @property
+    def samples_per_second(self) -> float:
+        return self.samples / self.seconds if self.seconds > 0 else math.inf
+
+    def covers(self, value: float) -> bool:
+        """Liegt value (z. B. die exakte Power) im Konfidenzintervall?"""
+        return self.ci_low <= value <= self.ci_high
+
+
+def wilson_interval(successes: int, trials: int, confidence: float = 0.95):
+    """
+    Wilson-Konfidenzintervall für eine Wahrscheinlichkeit.
+
+    Auch für Schätzwerte nahe 0 oder 1 (kleines alpha!) brauchbar,
+    anders als das Wald-Intervall.
+    """
+    if trials <= 0:
+        raise ValueError("trials muss positiv sein")
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    phat = successes / trials
+    denom = 1 + z * z / trials
+    center = (phat + z * z / (2 * trials)) / denom
+    half = z * math.sqrt(phat * (1 - phat) / trials + z * z / (4 * trials * trials)) / denom
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+# ------------------------------------------------------------------
+# Worker: ein Block (chunk) Beobachtungen
+# ------------------------------------------------------------------
+
+def _count_chunk(task) -> int:
+    # Auf Modulebene, damit der Prozesspool ihn picklen kann.
+    # Es wird nur K geschickt, nicht das Modell samt Tabellen.
+    K, sampler, seed, size = task
+    rng = np.random.default_rng(seed)
+    x = sampler(rng, size)
+    return int(np.count_nonzero(K.contains_array(x)))
+
+
+def _tasks(K: IntervalSet, sampler, samples: int, chunk_size: int, seed):
+    # Blöcke fester Größe, je Block ein eigener Zufallsstrom.
+    # Die Aufteilung hängt nicht von der Zahl der Worker ab:
+    # gleicher seed -> gleiches Ergebnis, egal wie parallel.
+    n_chunks = -(-samples // chunk_size)
+    children = np.random.SeedSequence(seed).spawn(n_chunks)
+    for i, child in enumerate(children):
+        size = min(chunk_size, samples - i * chunk_size)
+        yield K, sampler, child, size
+
+
+@staged("power")
+def simulate_rejection_rate(
+    rejection_region: RejectionRegion,
+    sampler: Callable[[np.random.Generator, int], np.ndarray],
+    samples: int,
+    *,
+    chunk_size: int = 2**20,
+    workers: int | None = 1,
+    seed: int | None = None,
+    confidence: float = 0.95,
+) -> SimulationResult:
+    """
+    Schätzt P(X ∈ K) durch Simulation.
+
+    - sampler(rng, size): erzeugt Beobachtungen
+      (z. B. BinomialSampler, ClusteredSampler, siehe samplers)
+    - samples   : Gesamtzahl der Beobachtungen
+    - chunk_size: Beobachtungen je Block; höchstens so viele
+                  liegen gleichzeitig im Speicher (je Worker)
+    - workers   : Anzahl Prozesse; 1 = im aktuellen Prozess,
+                  None = os.cpu_count()
+    - seed      : Startwert für SeedSequence (None: zufällig)
+
+    Je Block: Ziehen mit NumPy-Generator, Zugehörigkeit zu K
+    vektorisiert (K.contains_array), nur die Trefferzahl
+    wird zurückgegeben.
+    """
+    if samples <= 0:
+        raise ValueError("samples muss positiv sein")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size muss positiv sein")
+    if not (0 < confidence < 1):
+        raise ValueError("confidence muss in (0,1) liegen")
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    tasks = _tasks(rejection_region.K, sampler, samples, chunk_size, seed)
+
+    t0 = time.perf_counter()
+    if workers == 1:
+        rejections = sum(map(_count_chunk, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rejections = sum(pool.map(_count_chunk, tasks))
+    seconds = time.perf_counter() - t0
+
+    ci_low, ci_high = wilson_interval(rejections, samples, confidence)
+    return SimulationResult(
+        rejections=rejections,
+        samples=samples,
+        estimate=rejections / samples,
+        ci_low=ci_low,
+        ci_high=ci_high,
+        confidence=confidence,
+        seconds=seconds,
+    )
+
+
+def empirical_size(
+    rejection_region: RejectionRegion,
+    samples: int,
+    **kwargs,
+) -> SimulationResult:
+    """
+    Empirisches Niveau: Verwerfungsrate unter H0
+    (Binomialmodell des Ablehnungsbereichs).
+
+    Vergleichswert: rejection_region.probability().
+    """
+    model = rejection_region.model
+    return simulate_rejection_rate(
+        rejection_region, BinomialSampler(model.n, model.p), samples, **kwargs
+    )
+
+
+def empirical_power(
+    rejection_region: RejectionRegion,
+    p: float,
+    samples: int,
+    **kwargs,
+) -> SimulationResult:
+    """
+    Empirische Power: Verwerfungsrate für x ~ Bin(n, p).
+
+    Vergleichswert: power_at(BinomialModel(n, p), rejection_region).
+    """
+    n = rejection_region.model.n
+    return simulate_rejection_rate(
+        rejection_region, BinomialSampler(n, p), samples, **kwargs
+    )
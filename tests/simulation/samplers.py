@@ -0,0 +1,70 @@
+# tests/simulation/samplers.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+# ------------------------------------------------------------------
+# Datenerzeugung für die Simulation
+# ------------------------------------------------------------------
+#
+# Ein Sampler ist ein aufrufbares Objekt
+#
+#     sampler(rng, size) -> np.ndarray (ganzzahlige Beobachtungen x)
+#
+# und wird an Worker-Prozesse geschickt; er muss daher picklebar sein
+# (Klassen auf Modulebene, keine lambdas).
+
+
+@dataclass(frozen=True)
+class BinomialSampler:
+    """
+    Beobachtungen x ~ Bin(n, p).
+
+    p darf vom p0 des Tests abweichen (Power, falsch spezifiziertes p).
+    """
+    n: int
+    p: float
+
+    def __post_init__(self):
+        if not (0 <= self.p <= 1):
+            raise ValueError("p muss in [0,1] liegen")
+        if self.n <= 0:
+            raise ValueError("n muss positiv sein")
+
+    def __call__(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        return rng.binomial(self.n, self.p, size=size)
+
+
+@dataclass(frozen=True)
+class ClusteredSampler:
+    """
+    Beobachtungen aus n Versuchen in Clustern (Beta-Binomial).
+
+    Innerhalb eines Clusters sind die Versuche korreliert
+    (Intraklassenkorrelation rho); je Beobachtung wird
+    zuerst p_i ~ Beta(a, b) mit Mittel p gezogen, dann x ~ Bin(n, p_i).
+
+    rho = 0 ist das gewöhnliche Binomialmodell; für rho > 0
+    ist die Varianz um den Faktor 1 + (n-1) rho größer.
+    """
+    n: int
+    p: float
+    rho: float
+
+    def __post_init__(self):
+        if not (0 < self.p < 1):
+            raise ValueError("p muss in (0,1) liegen")
+        if self.n <= 0:
+            raise ValueError("n muss positiv sein")
+        if not (0 <= self.rho < 1):
+            raise ValueError("rho muss in [0,1) liegen")
+
+    def __call__(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        if self.rho == 0:
+            return rng.binomial(self.n, self.p, size=size)
+        s = (1 - self.rho) / self.rho
+        p_i = rng.beta(self.p * s, (1 - self.p) * s, size=size)
+        return rng.binomial(self.n, p_i)
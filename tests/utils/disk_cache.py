@@ -0,0 +1,161 @@
+# tests/utils/disk_cache.py
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+
+import numpy as np
+
+from tests.utils.lru_cache import CacheStats
+
+
+def _umask() -> int:
+    # os.umask lässt sich nur setzend lesen; einmal beim Import
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# Einträge wie gewöhnlich angelegte Dateien (mkstemp: nur 0600),
+# damit ein gemeinsames Verzeichnis für alle Nutzer lesbar ist
+_FILE_MODE = 0o666 & ~_umask()
+
+
+class DiskCache:
+    """
+    Verzeichnis mit float-Arrays (je Eintrag eine .npy-Datei),
+    größenbeschränkt mit LRU-Verdrängung.
+
+    - get(key): Array als np.memmap (nur lesen, ohne Kopie);
+                mehrere Prozesse teilen sich die Seiten im Seitencache
+    - put(key, array): atomar schreiben (temporäre Datei + rename),
+                       danach älteste Einträge verdrängen, bis die
+                       Summe der Dateigrößen <= max_bytes ist
+    - min_bytes: kleinere Arrays werden nicht abgelegt
+                 (neu rechnen ist dort schneller als lesen)
+
+    "Zuletzt benutzt" ist die Änderungszeit der Datei (bei jedem
+    Treffer neu gesetzt). Geteilt zwischen Prozessen und Sitzungen;
+    die Statistik (stats) zählt nur im eigenen Prozess.
+    Bereits geöffnete Arrays bleiben nach dem Verdrängen gültig.
+    """
+
+    SUFFIX = ".npy"
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        max_bytes: int = 2 * 2**30,
+        min_bytes: int = 256 * 2**10,
+    ):
+        if max_bytes < 0:
+            raise ValueError("max_bytes darf nicht negativ sein")
+        self.directory = os.path.abspath(directory)
+        self.max_bytes = max_bytes
+        self.min_bytes = min_bytes
+        os.makedirs(self.directory, exist_ok=True)
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.SUFFIX)
+
+    def get(self, key: str) -> np.ndarray | None:
+        """Array zu key (memmap, schreibgeschützt) oder None."""
+        path = self._path(key)
+        try:
+            array = np.load(path, mmap_mode="r")
+            os.utime(path)
+        except (FileNotFoundError, ValueError, OSError):
+            # fehlt, gerade verdrängt oder unvollständig
+            with self._lock:
+                self._misses += 1
+            return None
+        with self._lock:
+            self._hits += 1
+        return array
+
+    def put(self, key: str, array: np.ndarray) -> None:
+        """Array ablegen (zu kleine oder zu große werden übergangen)."""
+        array = np.asarray(array)
+        if not self.min_bytes <= array.nbytes <= self.max_bytes:
+            return
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, array)
+            os.chmod(tmp, _FILE_MODE)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        self._evict(keep=key)
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        # (Änderungszeit, Größe, Pfad) aller Einträge
+        entries = []
+        with os.scandir(self.directory) as it:
+            for e in it:
+                if not e.name.endswith(self.SUFFIX):
+                    continue
+                try:
+                    st = e.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, e.path))
+        return entries
+
+    def _evict(self, keep: str | None = None) -> None:
+        # ältester Eintrag zuerst
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        keep_path = self._path(keep) if keep is not None else None
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep_path:
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            with self._lock:
+                self._evictions += 1
+
+    def resize(self, *, max_bytes: int) -> None:
+        """Neues Budget setzen (verdrängt sofort, falls nötig)."""
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def clear(self) -> None:
+        """Alle Einträge löschen und die Statistik zurücksetzen."""
+        for _, _, path in self._entries():
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        with self._lock:
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        entries = self._entries()
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(entries),
+                nbytes=sum(size for _, size, _ in entries),
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.exists(self._path(key))
@@ -0,0 +1,74 @@
+# tests/utils/error_bound.py
+from __future__ import annotations
+
+import numpy as np
+
+
+# ------------------------------------------------------------------
+# Ergebnisse mit Fehlerschranke
+# ------------------------------------------------------------------
+#
+# p-Werte und Power abgeschnittener Modelle (BinomialModel mit tol > 0)
+# weichen um höchstens model.truncation_error vom exakten Wert ab.
+# Die Schranke wird am Ergebnis mitgegeben, wie bei
+# RejectionRegion.error_bound, ohne den Rückgabetyp zu ändern:
+#
+#     p = p_value_two_sided_equal_tails(model, 17)
+#     p < 0.05, f"{p:.3f}"   # wie ein float
+#     p.error_bound          # Schranke (0.0 bei exakten Modellen)
+
+
+def truncation_error(model) -> float:
+    """Schranke des Modells (0.0 ohne truncation_error)."""
+    return float(getattr(model, "truncation_error", 0.0))
+
+
+class BoundedFloat(float):
+    """
+    float mit Fehlerschranke error_bound.
+
+    Rechnen ergibt gewöhnliche floats (die Schranke gilt
+    nur für den Wert selbst).
+    """
+
+    __slots__ = ("error_bound",)
+
+    def __new__(cls, value: float, error_bound: float = 0.0):
+        obj = super().__new__(cls, value)
+        obj.error_bound = float(error_bound)
+        return obj
+
+    def __reduce__(self):
+        return BoundedFloat, (float(self), self.error_bound)
+
+
+class BoundedArray(np.ndarray):
+    """
+    NumPy-Array mit Fehlerschranke error_bound (je Element).
+
+    Sichten (Ausschnitte, Umformungen) behalten die Schranke.
+    """
+
+    def __new__(cls, values, error_bound: float = 0.0):
+        obj = np.asarray(values).view(cls)
+        obj.error_bound = float(error_bound)
+        return obj
+
+    def __array_finalize__(self, obj):
+        self.error_bound = getattr(obj, "error_bound", 0.0)
+
+    # Pickle (z. B. Prozesspool): Schranke an den Array-Zustand hängen
+    def __reduce__(self):
+        rebuild, args, state = super().__reduce__()
+        return rebuild, args, (state, self.error_bound)
+
+    def __setstate__(self, state):
+        state, self.error_bound = state
+        super().__setstate__(state)
+
+
+def with_error_bound(value, error_bound: float):
+    """float -> BoundedFloat, Array -> BoundedArray."""
+    if np.ndim(value) == 0:
+        return BoundedFloat(value, error_bound)
+    return BoundedArray(value, error_bound)
@@ -1,8 +1,11 @@
 # tests/utils/format_K.py
 from __future__ import annotations
 
+import math
 from typing import Iterable
 
+from tests.geometry.rejection_region import IntervalSet
+
 
 def format_rejection_region_intervals(K: Iterable[int], n: int) -> str:
     """
@@ -13,32 +16,43 @@ def format_rejection_region_intervals(K: Iterable[int], n: int) -> str:
     - nur links:     K = {0,...,l}
     - nur rechts:    K = {r,...,n}
     - leer:          K = ∅
+
+    Unbeschränkter rechter Rand (hi = inf, z. B. Poisson):
+    {r, r+1, ...} statt {r,...,n}; n spielt dann keine Rolle.
+
+    Liest die Intervalle direkt (IntervalSet); andere Mengen
+    werden vorher in Intervalle umgewandelt.
     """
-    Kset = set(K)
-    if not Kset:
+    if not isinstance(K, IntervalSet):
+        K = IntervalSet.from_points(K)
+    intervals = K.intervals
+    if not intervals:
         return r"$K=\emptyset$"
 
     # Linker Rand: muss bei 0 beginnen, sonst gibt es keinen linken Tail.
     l = None
-    if 0 in Kset:
-        l = 0
-        while (l + 1) in Kset:
-            l += 1
+    first_lo, first_hi = intervals[0]
+    if first_lo <= 0 <= first_hi:
+        l = first_hi
 
-    # Rechter Rand: muss bei n beginnen, sonst gibt es keinen rechten Tail.
+    # Rechter Rand: muss bei n beginnen (oder nach oben offen sein),
+    # sonst gibt es keinen rechten Tail.
     r = None
-    if n in Kset:
-        r = n
-        while (r - 1) in Kset:
-            r -= 1
+    last_lo, last_hi = intervals[-1]
+    unbounded = last_hi == math.inf
+    if unbounded or last_lo <= n <= last_hi:
+        r = last_lo
+        right = (
+            rf"\{{{r},{r + 1},\dots\}}" if unbounded else rf"\{{{r},\dots,{n}\}}"
+        )
 
     if l is not None and r is not None:
-        return rf"$K=\{{0,\dots,{l}\}}\cup\{{{r},\dots,{n}\}}$"
+        return rf"$K=\{{0,\dots,{l}\}}\cup{right}$"
     if l is not None:
         return rf"$K=\{{0,\dots,{l}\}}$"
     if r is not None:
-        return rf"$K=\{{{r},\dots,{n}\}}$"
+        return rf"$K={right}$"
 
     # Wenn weder 0 noch n in K sind, ist es kein Randbereich (hier selten).
     # Dann lieber kompakt als Liste: min..max als Hinweis.
-    return rf"$K\subseteq\{{0,\dots,{n}\}},\;\min(K)={min(Kset)},\;\max(K)={max(Kset)}$"
+    return rf"$K\subseteq\{{0,\dots,{n}\}},\;\min(K)={first_lo},\;\max(K)={last_hi}$"
@@ -0,0 +1,123 @@
+# tests/utils/lru_cache.py
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    Momentaufnahme eines Caches.
+    """
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    nbytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class LRUCache:
+    """
+    Größenbeschränkter Cache mit LRU-Verdrängung.
+
+    - max_bytes  : Speicherbudget (Summe von sizeof über alle Einträge)
+    - max_entries: maximale Anzahl Einträge
+    - sizeof     : geschätzte Größe eines Werts in Bytes
+
+    None heißt: keine Grenze in dieser Hinsicht.
+    max_bytes = 0 oder max_entries = 0 schaltet den Cache ab.
+
+    Threadsicher; jeder Prozess hat seinen eigenen Cache.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int | None = None,
+        max_entries: int | None = None,
+        sizeof: Callable[[Any], int] | None = None,
+    ):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._sizeof = sizeof or (lambda value: 0)
+        self._data: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.RLock()
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Wert zu key; beim ersten Zugriff über factory() erzeugt.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                self._data.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+
+        value = factory()
+
+        with self._lock:
+            if key not in self._data:
+                size = int(self._sizeof(value))
+                self._data[key] = (value, size)
+                self._nbytes += size
+                self._evict()
+        return value
+
+    def _evict(self) -> None:
+        # ältester Eintrag zuerst
+        while self._data and (
+            (self.max_entries is not None and len(self._data) > self.max_entries)
+            or (self.max_bytes is not None and self._nbytes > self.max_bytes)
+        ):
+            _, (_, size) = self._data.popitem(last=False)
+            self._nbytes -= size
+            self._evictions += 1
+
+    def resize(
+        self,
+        *,
+        max_bytes: int | None = None,
+        max_entries: int | None = None,
+    ) -> None:
+        """Neues Budget setzen (verdrängt sofort, falls nötig)."""
+        with self._lock:
+            self.max_bytes = max_bytes
+            self.max_entries = max_entries
+            self._evict()
+
+    def clear(self) -> None:
+        """Alle Einträge und die Statistik zurücksetzen."""
+        with self._lock:
+            self._data.clear()
+            self._nbytes = 0
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._data),
+                nbytes=self._nbytes,
+            )
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
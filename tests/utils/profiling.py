@@ -0,0 +1,301 @@
+# tests/utils/profiling.py
+from __future__ import annotations
+
+import importlib
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Callable, Iterator
+
+import numpy as np
+
+
+# ------------------------------------------------------------------
+# Profiling auf Wunsch: Stufenzeiten, Modellauswertungen, Speicher
+# ------------------------------------------------------------------
+#
+#     with profiling() as report:
+#         R = two_sided_equal_tails(model, 0.05)
+#         plot_binomial_model_with_rejection_region(model, 0.05, save="K.pdf")
+#     print(report)
+#     report.to_json("profil.json")
+#
+# Ohne aktives Profil kostet eine markierte Funktion nur eine
+# Abfrage (_active is None); Modellauswertungen werden nur gezählt,
+# solange ein Profil läuft (Methoden werden dafür kurz ersetzt).
+#
+# Ein Profil zur Zeit, im aufrufenden Thread; Worker-Prozesse
+# (Prozesspools) werden nicht erfasst.
+
+STAGES = ("model", "geometry", "decision", "power", "plot", "save")
+
+# Modellklassen, deren Auswertungen gezählt werden
+_COUNTED_MODELS = (
+    ("tests.model.binomial", "BinomialModel"),
+    ("tests.model.normal", "NormalApproxModel"),
+    ("tests.model.poisson", "PoissonModel"),
+)
+_COUNTED_METHODS = ("pmf", "cdf", "sf", "ppf", "isf")
+
+
+@dataclass
+class StageStats:
+    """
+    Messwerte einer Stufe.
+
+    - calls      : Anzahl Eintritte (verschachtelte Aufrufe derselben
+                   Stufe zählen einmal)
+    - seconds    : Zeit inklusive anderer Stufen darin
+    - self_seconds: Zeit ohne darin enthaltene andere Stufen
+    - peak_bytes : größter Speicherzuwachs während eines Aufrufs
+    - net_bytes  : Summe der nach dem Aufruf verbliebenen Allokationen
+    """
+    calls: int = 0
+    seconds: float = 0.0
+    self_seconds: float = 0.0
+    peak_bytes: int = 0
+    net_bytes: int = 0
+
+
+@dataclass
+class ProfileReport:
+    """
+    Ergebnis von profiling(): Stufen, Zähler, Gesamtwerte.
+
+    Wird beim Verlassen des with-Blocks gefüllt.
+    """
+    stages: dict[str, StageStats] = field(default_factory=dict)
+    evaluations: dict[str, dict[str, int]] = field(default_factory=dict)
+    seconds: float = 0.0
+    peak_bytes: int | None = None
+
+    def to_dict(self) -> dict:
+        return {
+            "seconds": self.seconds,
+            "peak_bytes": self.peak_bytes,
+            "stages": {name: vars(s).copy() for name, s in self.stages.items()},
+            "evaluations": {k: dict(v) for k, v in self.evaluations.items()},
+        }
+
+    def to_json(self, path: str | None = None) -> str:
+        """JSON-Text; mit path zusätzlich in die Datei geschrieben."""
+        text = json.dumps(self.to_dict(), indent=2)
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+        return text
+
+    def __str__(self) -> str:
+        mem = self.peak_bytes is not None
+        lines = [
+            f"{'Stufe':<10} {'Aufrufe':>8} {'gesamt [s]':>11} {'eigen [s]':>10}"
+            + (f" {'Spitze [MB]':>12} {'netto [MB]':>11}" if mem else "")
+        ]
+        for name in sorted(self.stages, key=_stage_order):
+            s = self.stages[name]
+            line = (f"{name:<10} {s.calls:>8} {s.seconds:>11.4f} "
+                    f"{s.self_seconds:>10.4f}")
+            if mem:
+                line += f" {s.peak_bytes / 2**20:>12.2f} {s.net_bytes / 2**20:>11.2f}"
+            lines.append(line)
+
+        lines.append(f"{'gesamt':<10} {'':>8} {self.seconds:>11.4f}")
+        if mem:
+            lines.append(f"Speicherspitze: {self.peak_bytes / 2**20:.2f} MB")
+
+        if self.evaluations:
+            lines.append("")
+            lines.append(f"{'Modellauswertung':<28} {'Aufrufe':>10} {'Stellen':>12}")
+            for name, c in sorted(self.evaluations.items()):
+                lines.append(f"{name:<28} {c['calls']:>10} {c['points']:>12}")
+        return "\n".join(lines)
+
+
+def _stage_order(name: str):
+    return (STAGES.index(name) if name in STAGES else len(STAGES), name)
+
+
+# ------------------------------------------------------------------
+# Laufzeitzustand
+# ------------------------------------------------------------------
+
+class _Frame:
+    __slots__ = ("name", "t0", "child_seconds", "mem0", "peak_seen")
+
+    def __init__(self, name: str, mem0: int):
+        self.name = name
+        self.t0 = time.perf_counter()
+        self.child_seconds = 0.0
+        self.mem0 = mem0
+        self.peak_seen = 0
+
+
+class _Profiler:
+    def __init__(self, report: ProfileReport, memory: bool):
+        self.report = report
+        self.memory = memory
+        self.stack: list[_Frame] = []
+        # Gesamtspitze über alle reset_peak() hinweg
+        self.peak_seen = 0
+
+    def _traced(self) -> tuple[int, int]:
+        return tracemalloc.get_traced_memory() if self.memory else (0, 0)
+
+    def _reset_peak(self) -> None:
+        # Spitze erst in die Gesamtspitze übernehmen, dann neu messen
+        self.peak_seen = max(self.peak_seen, tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+
+    def total_peak(self) -> int:
+        return max(self.peak_seen, tracemalloc.get_traced_memory()[1])
+
+    @contextmanager
+    def stage(self, name: str):
+        # dieselbe Stufe verschachtelt (z. B. power_curve -> power_at):
+        # läuft im äußeren Eintrag mit
+        if self.stack and self.stack[-1].name == name:
+            yield
+            return
+
+        if self.memory and self.stack:
+            # Spitze des äußeren Eintrags sichern, dann neu messen
+            parent = self.stack[-1]
+            parent.peak_seen = max(parent.peak_seen, self._traced()[1])
+            self._reset_peak()
+
+        frame = _Frame(name, self._traced()[0])
+        self.stack.append(frame)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - frame.t0
+            current, peak = self._traced()
+            self.stack.pop()
+
+            stats = self.report.stages.setdefault(name, StageStats())
+            stats.calls += 1
+            stats.seconds += elapsed
+            stats.self_seconds += elapsed - frame.child_seconds
+            if self.memory:
+                peak = max(peak, frame.peak_seen)
+                stats.peak_bytes = max(stats.peak_bytes, peak - frame.mem0)
+                stats.net_bytes += current - frame.mem0
+
+            if self.stack:
+                parent = self.stack[-1]
+                parent.child_seconds += elapsed
+                if self.memory:
+                    parent.peak_seen = max(parent.peak_seen, peak)
+                    self._reset_peak()
+
+
+_active: _Profiler | None = None
+_NULL = nullcontext()
+
+
+def stage(name: str):
+    """
+    Kontext für einen Abschnitt einer Stufe (z. B. savefig).
+    Ohne aktives Profil ein leerer Kontext.
+    """
+    if _active is None:
+        return _NULL
+    return _active.stage(name)
+
+
+def staged(name: str) -> Callable[[Callable], Callable]:
+    """Dekorator: jeder Aufruf der Funktion zählt zur Stufe name."""
+    def decorate(fn: Callable) -> Callable:
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _active is None:
+                return fn(*args, **kwargs)
+            with _active.stage(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+# ------------------------------------------------------------------
+# Zählen der Modellauswertungen (nur während eines Profils)
+# ------------------------------------------------------------------
+
+def _points(x) -> int:
+    if isinstance(x, np.ndarray):
+        return x.size
+    if isinstance(x, (list, tuple, range)):
+        return len(x)
+    return 1
+
+
+def _counting(method: Callable, counter: dict[str, int]) -> Callable:
+    @wraps(method)
+    def wrapper(self, x, *args, **kwargs):
+        counter["calls"] += 1
+        counter["points"] += _points(x)
+        return method(self, x, *args, **kwargs)
+    return wrapper
+
+
+def _patch_models(evaluations: dict) -> list[tuple[type, str, Callable]]:
+    patched = []
+    for module_name, class_name in _COUNTED_MODELS:
+        cls = getattr(importlib.import_module(module_name), class_name)
+        for method in _COUNTED_METHODS:
+            original = cls.__dict__.get(method)
+            if original is None:
+                continue
+            counter = evaluations.setdefault(
+                f"{class_name}.{method}", {"calls": 0, "points": 0}
+            )
+            setattr(cls, method, _counting(original, counter))
+            patched.append((cls, method, original))
+    return patched
+
+
+@contextmanager
+def profiling(*, memory: bool = True) -> Iterator[ProfileReport]:
+    """
+    Profil für den with-Block.
+
+    - Stufenzeiten (model, geometry, decision, power, plot, save)
+    - Anzahl Modellauswertungen (pmf, cdf, sf, ppf, isf;
+      Aufrufe und ausgewertete Stellen)
+    - memory=True: Allokationen über tracemalloc
+      (je Stufe Spitze und Netto; kostet spürbar Laufzeit)
+
+    Liefert einen ProfileReport, der beim Verlassen gefüllt wird.
+    """
+    global _active
+    if _active is not None:
+        raise RuntimeError("es läuft bereits ein Profil")
+
+    report = ProfileReport()
+    start_tracing = memory and not tracemalloc.is_tracing()
+    if start_tracing:
+        tracemalloc.start()
+    if memory:
+        tracemalloc.reset_peak()
+        mem0 = tracemalloc.get_traced_memory()[0]
+
+    patched = _patch_models(report.evaluations)
+    profiler = _Profiler(report, memory)
+    _active = profiler
+    t0 = time.perf_counter()
+    try:
+        yield report
+    finally:
+        report.seconds = time.perf_counter() - t0
+        _active = None
+        for cls, method, original in patched:
+            setattr(cls, method, original)
+        if memory:
+            report.peak_bytes = profiler.total_peak() - mem0
+            if start_tracing:
+                tracemalloc.stop()
+        report.evaluations = {
+            k: v for k, v in report.evaluations.items() if v["calls"]
+        }